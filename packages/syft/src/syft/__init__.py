@@ -13,6 +13,7 @@ from .abstract_server import ServerType
 from .client.client import connect
 from .client.client import login
 from .client.client import login_as_guest
+from .client.client import login_async
 from .client.client import register
 from .client.datasite_client import DatasiteClient
 from .client.gateway_client import GatewayClient
@@ -35,8 +36,10 @@ from .protocol.data_protocol import get_data_protocol
 from .protocol.data_protocol import stage_protocol_changes
 from .serde import NOTHING
 from .serde.deserialize import _deserialize as deserialize
+from .serde.deserialize import _deserialize_from as deserialize_from
 from .serde.serializable import serializable
 from .serde.serialize import _serialize as serialize
+from .serde.serialize import _serialize_to as serialize_to
 from .server.credentials import SyftSigningKey
 from .server.datasite import Datasite
 from .server.enclave import Enclave
@@ -3,7 +3,10 @@ from __future__ import annotations
 
 # stdlib
 from collections import OrderedDict
+from collections.abc import Awaitable
 from collections.abc import Callable
+from collections.abc import Iterator
+from contextlib import contextmanager
 import inspect
 from inspect import Parameter
 from inspect import signature
@@ -45,6 +48,7 @@ from ..service.context import ChangeContext
 from ..service.metadata.server_metadata import ServerMetadataJSON
 from ..service.response import SyftAttributeError
 from ..service.response import SyftError
+from ..service.response import SyftException
 from ..service.response import SyftSuccess
 from ..service.service import UserLibConfigRegistry
 from ..service.service import UserServiceConfigRegistry
@@ -180,7 +184,7 @@ class SignedSyftAPICall(SyftObject):
     cached_deseralized_message: SyftAPICall | None = None
 
     @property
-    def message(self) -> SyftAPICall:
+    def message(self) -> SyftAPICall | SyftAPICallBatch:
         # from deserialize we might not have this attr because __init__ is skipped
         if not hasattr(self, "cached_deseralized_message"):
             self.cached_deseralized_message = None
@@ -231,6 +235,59 @@ class SyftAPICall(SyftObject):
         return f"SyftAPICall(path={self.path}, args={self.args}, kwargs={self.kwargs}, blocking={self.blocking})"
 
 
+@serializable()
+class SyftAPICallBatch(SyftObject):
+    # version
+    __canonical_name__ = "SyftAPICallBatch"
+    __version__ = SYFT_OBJECT_VERSION_1
+
+    # fields
+    server_uid: UID
+    calls: list[SyftAPICall]
+
+    def sign(self, credentials: SyftSigningKey) -> SignedSyftAPICall:
+        signed_message = credentials.signing_key.sign(_serialize(self, to_bytes=True))
+
+        return SignedSyftAPICall(
+            credentials=credentials.verify_key,
+            serialized_message=signed_message.message,
+            signature=signed_message.signature,
+        )
+
+    def __repr__(self) -> str:
+        return f"SyftAPICallBatch(server_uid={self.server_uid}, calls={self.calls})"
+
+
+class BatchedAPICall:
+    """An API call made inside `SyftAPI.batch()`, its result is set when the batch is sent."""
+
+    def __init__(self, api_call: SyftAPICall, cache_result: bool = True) -> None:
+        self.api_call = api_call
+        self.cache_result = cache_result
+        self.is_sent = False
+        self._result: Any = None
+
+    @property
+    def result(self) -> Any:
+        if not self.is_sent:
+            raise SyftException(
+                f"{self.api_call.path} is sent when its batch block exits"
+            )
+        return self._result
+
+    @result.setter
+    def result(self, value: Any) -> None:
+        self._result = value
+        self.is_sent = True
+
+    def get(self) -> Any:
+        return self.result
+
+    def __repr__(self) -> str:
+        state = "sent" if self.is_sent else "pending"
+        return f"BatchedAPICall(path={self.api_call.path}, {state})"
+
+
 @instrument
 @serializable()
 class SyftAPIData(SyftBaseObject):
@@ -325,7 +382,12 @@ class RemoteFunction(SyftObject):
         if not allowed:
             return
         result = self.make_call(api_call=api_call, cache_result=cache_result)
+        if inspect.isawaitable(result):
+            # the api is connected through an AsyncHTTPConnection
+            return self._function_call_result_async(path, result)
+        return self._function_call_result(path, result)
 
+    def _function_call_result(self, path: str, result: Any) -> Any:
         # TODO: annotate this on the service method decorator
         API_CALLS_THAT_REQUIRE_REFRESH = ["settings.enable_eager_execution"]
 
@@ -339,6 +401,11 @@ class RemoteFunction(SyftObject):
         result = result[0]
         return result
 
+    async def _function_call_result_async(
+        self, path: str, result: Awaitable[Any]
+    ) -> Any:
+        return self._function_call_result(path, await result)
+
     def __call__(self, *args: Any, **kwargs: Any) -> Any:
         return self.function_call(self.path, *args, **kwargs)
 
@@ -894,6 +961,11 @@ class SyftAPI(SyftObject):
     __user_role: ServiceRole = ServiceRole.NONE
     communication_protocol: PROTOCOL_TYPE
     metadata: ServerMetadataJSON | None = None
+    # calls made inside a `batch()` block, sent when it exits
+    pending_batch: list[BatchedAPICall] | None = None
+    # set when the api was fetched through an AsyncHTTPConnection, calls made
+    # through the api return awaitables then
+    async_connection: Any = None
 
     # informs getattr does not have nasty side effects
     __syft_allow_autocomplete__ = ["services"]
@@ -922,15 +994,53 @@ class SyftAPI(SyftObject):
         communication_protocol: PROTOCOL_TYPE,
         user_verify_key: SyftVerifyKey | None = None,
     ) -> SyftAPI:
+        # find user role by verify_key
+        # TODO: we should probably not allow empty verify keys but instead make user always register
+        role = server.get_role_for_credentials(user_verify_key)
+        code_items, custom_endpoints = SyftAPI.user_endpoints_for(
+            server, user_verify_key
+        )
+        return SyftAPI.build(
+            server=server,
+            communication_protocol=communication_protocol,
+            role=role,
+            user_verify_key=user_verify_key,
+            code_items=code_items,
+            custom_endpoints=custom_endpoints,
+        )
+
+    @staticmethod
+    def user_endpoints_for(
+        server: AbstractServer, user_verify_key: SyftVerifyKey | None
+    ) -> tuple[list, list]:
+        """The user code and the custom API endpoints the user gets endpoints for."""
         # relative
         from ..service.api.api_service import APIService
 
         # TODO: Maybe there is a possibility of merging ServiceConfig and APIEndpoint
         from ..service.code.user_code_service import UserCodeService
 
-        # find user role by verify_key
-        # TODO: we should probably not allow empty verify keys but instead make user always register
-        role = server.get_role_for_credentials(user_verify_key)
+        # 🟡 TODO 35: fix root context
+        context = AuthedServiceContext(server=server, credentials=user_verify_key)
+        method = server.get_method_with_context(
+            UserCodeService.get_all_for_user, context
+        )
+        code_items = method()
+
+        # get admin defined custom api endpoints
+        method = server.get_method_with_context(APIService.get_endpoints, context)
+        custom_endpoints = method()
+        return code_items, custom_endpoints
+
+    @staticmethod
+    def build(
+        server: AbstractServer,
+        communication_protocol: PROTOCOL_TYPE,
+        role: ServiceRole,
+        user_verify_key: SyftVerifyKey | None,
+        code_items: list,
+        custom_endpoints: list,
+    ) -> SyftAPI:
         _user_service_config_registry = UserServiceConfigRegistry.from_role(role)
         _user_lib_config_registry = UserLibConfigRegistry.from_user(user_verify_key)
         endpoints: dict[str, APIEndpoint] = {}
@@ -1001,13 +1111,6 @@ class SyftAPI(SyftObject):
             )
             lib_endpoints[path] = endpoint
 
-        # 🟡 TODO 35: fix root context
-        context = AuthedServiceContext(server=server, credentials=user_verify_key)
-        method = server.get_method_with_context(
-            UserCodeService.get_all_for_user, context
-        )
-        code_items = method()
-
         for code_item in code_items:
             path = "code.call"
             unique_path = f"code.call_{code_item.service_func_name}"
@@ -1023,9 +1126,6 @@ class SyftAPI(SyftObject):
             )
             endpoints[unique_path] = endpoint
 
-        # get admin defined custom api endpoints
-        method = server.get_method_with_context(APIService.get_endpoints, context)
-        custom_endpoints = method()
         for custom_endpoint in custom_endpoints:
             pre_kwargs = {"path": custom_endpoint.path}
             service_path = "api.call_in_jobs"
@@ -1057,6 +1157,14 @@ class SyftAPI(SyftObject):
         return self.__user_role
 
     def make_call(self, api_call: SyftAPICall, cache_result: bool = True) -> Result:
+        if self.pending_batch is not None:
+            batched_call = BatchedAPICall(api_call, cache_result=cache_result)
+            self.pending_batch.append(batched_call)
+            return batched_call
+
+        if self.async_connection is not None:
+            return self.make_call_async(api_call, cache_result=cache_result)
+
         signed_call = api_call.sign(credentials=self.signing_key)
         if self.connection is not None:
             signed_result = self.connection.make_call(signed_call)
@@ -1064,7 +1172,99 @@ class SyftAPI(SyftObject):
             return SyftError(message="API connection is None")
 
         result = debox_signed_syftapicall_response(signed_result=signed_result)
+        result = self._unwrap_result(result, cache_result=cache_result)
+        # we update the api when we create objects that change it
+        self.update_api(result)
+        return result
 
+    async def make_call_async(
+        self, api_call: SyftAPICall, cache_result: bool = True
+    ) -> Result:
+        if self.async_connection is None:
+            return SyftError(message="API async connection is None")
+
+        signed_call = api_call.sign(credentials=self.signing_key)
+        signed_result = await self.async_connection.make_call(signed_call)
+
+        result = debox_signed_syftapicall_response(signed_result=signed_result)
+        result = self._unwrap_result(result, cache_result=cache_result)
+        self.update_api(result)
+        return result
+
+    def call_many(
+        self, api_calls: list[SyftAPICall], cache_result: bool = True
+    ) -> list[Any] | SyftError:
+        """Sends the calls in one signed request and returns their results in order.
+
+        The server executes the calls one after the other, a failing call does not
+        stop the ones after it.
+        """
+        return self._make_batch_call(api_calls, [cache_result] * len(api_calls))
+
+    @contextmanager
+    def batch(self) -> Iterator[list[BatchedAPICall]]:
+        """Batches the API calls made inside the block into a single request.
+
+        Calls made in the block return a `BatchedAPICall` right away, which holds
+        the result of the call once the block exits.
+
+            with client.api.batch():
+                users = [client.api.services.user.view(uid) for uid in uids]
+            users = [user.get() for user in users]
+        """
+        if self.pending_batch is not None:
+            raise SyftException("API call batches can not be nested")
+
+        batch: list[BatchedAPICall] = []
+        self.pending_batch = batch
+        try:
+            yield batch
+        finally:
+            self.pending_batch = None
+
+        if not batch:
+            return
+        results = self._make_batch_call(
+            [batched_call.api_call for batched_call in batch],
+            [batched_call.cache_result for batched_call in batch],
+        )
+        if isinstance(results, SyftError):
+            results = [results] * len(batch)
+        for batched_call, result in zip(batch, results):
+            batched_call.result = result
+
+    def _make_batch_call(
+        self, api_calls: list[SyftAPICall], cache_results: list[bool]
+    ) -> list[Any] | SyftError:
+        if self.server_uid is None:
+            return SyftError(message="API server_uid is None")
+        if self.connection is None:
+            return SyftError(message="API connection is None")
+
+        batch = SyftAPICallBatch(server_uid=self.server_uid, calls=api_calls)
+        signed_call = batch.sign(credentials=self.signing_key)
+        signed_result = self.connection.make_call(signed_call)
+
+        results = debox_signed_syftapicall_response(signed_result=signed_result)
+        if not isinstance(results, list):
+            # the whole batch failed, e.g. its signature was invalid
+            return results
+
+        unwrapped = []
+        for result, cache_result in zip(results, cache_results):
+            result = self._unwrap_result(result, cache_result=cache_result)
+            result, _ = migrate_args_and_kwargs(
+                [result], kwargs={}, to_latest_protocol=True
+            )
+            unwrapped.append(result[0])
+        # refresh the api at most once for the whole batch
+        for result in unwrapped:
+            if result_needs_api_update(result):
+                self.update_api(result)
+                break
+        return unwrapped
+
+    def _unwrap_result(self, result: Any, cache_result: bool = True) -> Any:
         if isinstance(result, CachedSyftObject):
             if result.error_msg is not None:
                 if cache_result:
@@ -1084,8 +1284,6 @@ class SyftAPI(SyftObject):
                 result = result.ok()
             else:
                 result = result.err()
-        # we update the api when we create objects that change it
-        self.update_api(result)
         return result
 
     def update_api(self, api_call_result: Any) -> None:
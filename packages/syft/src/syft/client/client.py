@@ -2,22 +2,28 @@
 from __future__ import annotations
 
 # stdlib
+import asyncio
 import base64
 from collections.abc import Callable
 from collections.abc import Generator
 from collections.abc import Iterable
+from collections.abc import Iterator
+from contextlib import contextmanager
 from enum import Enum
 from getpass import getpass
 import json
 import logging
+import os
 from typing import Any
 from typing import TYPE_CHECKING
 from typing import cast
 
 # third party
 from argon2 import PasswordHasher
+from cachetools import LRUCache
 from cachetools import TTLCache
 from cachetools import cached
+import httpx
 from pydantic import field_validator
 import requests
 from requests import Response
@@ -34,9 +40,13 @@ from ..abstract_server import ServerType
 from ..protocol.data_protocol import DataProtocol
 from ..protocol.data_protocol import PROTOCOL_TYPE
 from ..protocol.data_protocol import get_data_protocol
+from ..serde.deserialize import DESERIALIZE_READ_SIZE
 from ..serde.deserialize import _deserialize
+from ..serde.deserialize import _deserialize_from
 from ..serde.serializable import serializable
 from ..serde.serialize import _serialize
+from ..serde.serialize import _serialize_body
+from ..serde.serialize import _serialize_chunks
 from ..server.credentials import SyftSigningKey
 from ..server.credentials import SyftVerifyKey
 from ..server.credentials import UserLoginCredentials
@@ -59,6 +69,7 @@ from ..util.util import thread_ident
 from ..util.util import verify_tls
 from .api import APIModule
 from .api import APIRegistry
+from .api import BatchedAPICall
 from .api import SignedSyftAPICall
 from .api import SyftAPI
 from .api import SyftAPICall
@@ -73,11 +84,12 @@ if TYPE_CHECKING:
     from ..service.network.server_peer import ServerPeer
 
 
-def upgrade_tls(url: ServerURL, response: Response) -> ServerURL:
+def upgrade_tls(url: ServerURL, response: Response | httpx.Response) -> ServerURL:
     try:
-        if response.url.startswith("https://") and url.protocol == "http":
+        response_url = str(response.url)
+        if response_url.startswith("https://") and url.protocol == "http":
             # we got redirected to https
-            https_url = ServerURL.from_url(response.url).with_path("")
+            https_url = ServerURL.from_url(response_url).with_path("")
             logger.debug(f"ServerURL Upgraded to HTTPS. {https_url}")
             return https_url
     except Exception as e:
@@ -119,6 +131,31 @@ DEFAULT_SYFT_UI_PORT = 80
 DEFAULT_SYFT_UI_ADDRESS = f"http://localhost:{DEFAULT_SYFT_UI_PORT}"
 INTERNAL_PROXY_TO_RATHOLE = "http://proxy:80/rtunnel/"
 
+# number of keep-alive connections an HTTPConnection keeps open per host
+HTTP_POOL_SIZE = int(os.getenv("SYFT_HTTP_POOL_SIZE", "10"))
+
+# (url, verify key, protocol) -> (etag, serialized SyftAPI) of the last fetched APIs,
+# sent back to the server to revalidate them
+API_RESPONSE_CACHE: LRUCache = LRUCache(maxsize=32)
+
+
+class StreamedCallBody:
+    """Streamed HTTP body of a large API call which can be sent more than once.
+
+    The session retries requests whose connection failed, by then the chunks of
+    the failed attempt are consumed, so the call is serialized again.
+    """
+
+    def __init__(self, signed_call: SignedSyftAPICall, chunks: Iterator[bytes]) -> None:
+        self.signed_call = signed_call
+        self.chunks: Iterator[bytes] | None = chunks
+
+    def __iter__(self) -> Iterator[bytes]:
+        chunks, self.chunks = self.chunks, None
+        if chunks is None:
+            chunks = _serialize_chunks(self.signed_call)
+        return chunks
+
 
 class Routes(Enum):
     ROUTE_METADATA = f"{API_PATH}/metadata"
@@ -141,6 +178,7 @@ class HTTPConnection(ServerConnection):
     session_cache: Session | None = None
     headers: dict[str, str] | None = None
     rtunnel_token: str | None = None
+    pool_size: int = HTTP_POOL_SIZE
 
     @field_validator("url", mode="before")
     @classmethod
@@ -159,6 +197,7 @@ class HTTPConnection(ServerConnection):
             url=self.url,
             proxy_target_uid=proxy_target_uid,
             rtunnel_token=self.rtunnel_token,
+            pool_size=self.pool_size,
         )
 
     def stream_via(self, proxy_uid: UID, url_path: str) -> ServerURL:
@@ -178,20 +217,44 @@ class HTTPConnection(ServerConnection):
         return self.url.with_path(self.routes.ROUTE_API_CALL.value)
 
     def to_blob_route(self, path: str, **kwargs: Any) -> ServerURL:
+        # on-disk blobs are served by the server API itself
+        if path.startswith(API_PATH):
+            return self.url.with_path(path)
         _path = self.routes.ROUTE_BLOB_STORE.value + path
         return self.url.with_path(_path)
 
     @property
     def session(self) -> Session:
+        # every request of the connection goes through this session, which keeps
+        # up to pool_size connections per host alive for reuse
         if self.session_cache is None:
             session = requests.Session()
             retry = Retry(total=3, backoff_factor=0.5)
-            adapter = HTTPAdapter(max_retries=retry)
+            adapter = HTTPAdapter(max_retries=retry, pool_maxsize=self.pool_size)
             session.mount("http://", adapter)
             session.mount("https://", adapter)
             self.session_cache = session
         return self.session_cache
 
+    @property
+    def transport_metadata(self) -> dict[str, Any]:
+        """Settings and usage of the connection pool, e.g. to verify connections are reused."""
+        adapter = self.session.get_adapter(str(self.url))
+        pools = adapter.poolmanager.pools
+        connections_opened = 0
+        requests_sent = 0
+        for key in pools.keys():
+            pool = pools[key]
+            connections_opened += pool.num_connections
+            requests_sent += pool.num_requests
+        return {
+            "pool_size": self.pool_size,
+            "max_retries": adapter.max_retries.total,
+            "hosts": len(pools),
+            "connections_opened": connections_opened,
+            "requests_sent": requests_sent,
+        }
+
     def _make_get(
         self, path: str, params: dict | None = None, stream: bool = False
     ) -> bytes | Iterable:
@@ -225,6 +288,49 @@ class HTTPConnection(ServerConnection):
 
         return response.content
 
+    def _make_get_api(self, params: dict) -> bytes:
+        """Fetches the serialized API, reuses the cached one if it is current."""
+        cache_key = (
+            str(self.url),
+            params["verify_key"],
+            params["communication_protocol"],
+        )
+        cached_api = API_RESPONSE_CACHE.get(cache_key)
+
+        url = self.url
+        headers = dict(self.headers or {})
+
+        if self.rtunnel_token:
+            url = ServerURL.from_url(INTERNAL_PROXY_TO_RATHOLE)
+            headers["Host"] = self.url.host_or_ip
+
+        if cached_api is not None:
+            headers["If-None-Match"] = cached_api[0]
+
+        url = url.with_path(self.routes.ROUTE_API.value)
+
+        response = self.session.get(
+            str(url),
+            headers=headers,
+            verify=verify_tls(),
+            proxies={},
+            params=params,
+        )
+        if response.status_code == 304 and cached_api is not None:
+            return cached_api[1]
+        if response.status_code != 200:
+            raise requests.ConnectionError(
+                f"Failed to fetch {url}. Response returned with code {response.status_code}"
+            )
+
+        # upgrade to tls if available
+        self.url = upgrade_tls(self.url, response)
+
+        etag = response.headers.get("ETag")
+        if etag is not None:
+            API_RESPONSE_CACHE[cache_key] = (etag, response.content)
+        return response.content
+
     @cached(cache=TTLCache(maxsize=128, ttl=300))
     def _make_get_no_params(self, path: str, stream: bool = False) -> bytes | Iterable:
         url = self.url
@@ -362,7 +468,7 @@ class HTTPConnection(ServerConnection):
                 credentials=credentials,
             )
         else:
-            content = self._make_get(self.routes.ROUTE_API.value, params=params)
+            content = self._make_get_api(params)
             obj = _deserialize(content, from_bytes=True)
         obj.connection = self
         obj.signing_key = credentials
@@ -406,7 +512,13 @@ class HTTPConnection(ServerConnection):
         return response
 
     def make_call(self, signed_call: SignedSyftAPICall) -> Any | SyftError:
-        msg_bytes: bytes = _serialize(obj=signed_call, to_bytes=True)
+        # large calls are sent while they are being serialized
+        body: bytes | StreamedCallBody
+        chunks = _serialize_body(signed_call)
+        if isinstance(chunks, bytes):
+            body = chunks
+        else:
+            body = StreamedCallBody(signed_call, chunks)
 
         if self.rtunnel_token:
             api_url = ServerURL.from_url(INTERNAL_PROXY_TO_RATHOLE)
@@ -416,18 +528,26 @@ class HTTPConnection(ServerConnection):
         else:
             api_url = self.api_url
 
-        response = requests.post(  # nosec
-            url=api_url,
-            data=msg_bytes,
+        response = self.session.post(
+            str(api_url),
             headers=self.headers,
+            verify=verify_tls(),
+            proxies={},
+            data=body,
+            stream=True,
         )
 
-        if response.status_code != 200:
-            raise requests.ConnectionError(
-                f"Failed to fetch metadata. Response returned with code {response.status_code}"
-            )
+        with response:
+            if response.status_code != 200:
+                raise requests.ConnectionError(
+                    f"Failed to fetch metadata. Response returned with code {response.status_code}"
+                )
 
-        result = _deserialize(response.content, from_bytes=True)
+            content_length = response.headers.get("Content-Length", None)
+            result = _deserialize_from(
+                response.iter_content(chunk_size=DESERIALIZE_READ_SIZE),
+                size=int(content_length) if content_length is not None else None,
+            )
         return result
 
     def __repr__(self) -> str:
@@ -459,6 +579,205 @@ class HTTPConnection(ServerConnection):
             return SyftError(message=f"Unknown server type {metadata.server_type}")
 
 
+class AsyncHTTPConnection:
+    """Asyncio counterpart of an HTTPConnection.
+
+    Shares the url, routes and headers of the HTTPConnection it wraps, while its
+    requests go through a pooled `httpx.AsyncClient`, so calls to many servers
+    can be awaited concurrently. The pool is closed by `aclose`, or by leaving an
+    `async with` block of the connection.
+    """
+
+    def __init__(self, connection: HTTPConnection, pool_size: int | None = None):
+        self.connection = connection
+        self.pool_size = connection.pool_size if pool_size is None else pool_size
+        self._client: httpx.AsyncClient | None = None
+        self._client_loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        # connections of an AsyncClient belong to the event loop they were made in
+        loop = asyncio.get_running_loop()
+        if self._client is not None and self._client_loop is not loop:
+            self._discard_client()
+        if self._client is None:
+            limits = httpx.Limits(max_keepalive_connections=self.pool_size)
+            transport = httpx.AsyncHTTPTransport(
+                verify=verify_tls(), limits=limits, retries=3
+            )
+            self._client = httpx.AsyncClient(transport=transport, timeout=None)
+            self._client_loop = loop
+        return self._client
+
+    def _discard_client(self) -> None:
+        client, loop = self._client, self._client_loop
+        self._client = None
+        self._client_loop = None
+        # a client can only be closed from its own event loop. The connections of
+        # a loop that is not running anymore are released with the client.
+        if client is not None and loop is not None and loop.is_running():
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+
+    async def aclose(self) -> None:
+        if self._client is None:
+            return
+        if self._client_loop is asyncio.get_running_loop():
+            client = self._client
+            self._client = None
+            self._client_loop = None
+            await client.aclose()
+        else:
+            self._discard_client()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.aclose()
+
+    def _url_for(self, path: str) -> str:
+        connection = self.connection
+        url = connection.url
+        if connection.rtunnel_token:
+            url = ServerURL.from_url(INTERNAL_PROXY_TO_RATHOLE)
+            connection.headers = (
+                {} if connection.headers is None else connection.headers
+            )
+            connection.headers["Host"] = connection.url.host_or_ip
+        return str(url.with_path(path))
+
+    def _check_response(self, response: httpx.Response) -> None:
+        if response.status_code != 200:
+            raise httpx.HTTPStatusError(
+                f"Failed to fetch {response.url}. Response returned with code {response.status_code}",
+                request=response.request,
+                response=response,
+            )
+
+        # upgrade to tls if available
+        self.connection.url = upgrade_tls(self.connection.url, response)
+
+    async def _make_get(self, path: str, params: dict | None = None) -> bytes:
+        response = await self.client.get(
+            self._url_for(path), params=params, headers=self.connection.headers
+        )
+        self._check_response(response)
+        return response.content
+
+    async def _make_post(
+        self,
+        path: str,
+        json: dict[str, Any] | None = None,
+        data: bytes | None = None,
+    ) -> bytes:
+        response = await self.client.post(
+            self._url_for(path),
+            json=json,
+            content=data,
+            headers=self.connection.headers,
+        )
+        self._check_response(response)
+        return response.content
+
+    async def make_call(self, signed_call: SignedSyftAPICall) -> Any | SyftError:
+        content = await self._make_post(
+            self.connection.routes.ROUTE_API_CALL.value,
+            data=_serialize(signed_call, to_bytes=True),
+        )
+        return _deserialize(content, from_bytes=True)
+
+    async def _forward_to_proxy(
+        self,
+        path: str,
+        credentials: SyftSigningKey | None = None,
+        kwargs: dict | None = None,
+    ) -> Any | SyftError:
+        # the async version of forward_message_to_proxy
+        call = SyftAPICall(
+            server_uid=self.connection.proxy_target_uid,
+            path=path,
+            args=[],
+            kwargs={} if kwargs is None else kwargs,
+            blocking=True,
+        )
+        if credentials is None:
+            credentials = SyftSigningKey.generate()
+        signed_result = await self.make_call(call.sign(credentials=credentials))
+        return debox_signed_syftapicall_response(signed_result)
+
+    async def get_server_metadata(
+        self, credentials: SyftSigningKey | None = None
+    ) -> ServerMetadataJSON | SyftError:
+        if self.connection.proxy_target_uid:
+            return await self._forward_to_proxy("metadata", credentials=credentials)
+        response = await self._make_get(self.connection.routes.ROUTE_METADATA.value)
+        metadata_json = json.loads(response)
+        return ServerMetadataJSON(**metadata_json)
+
+    async def get_api(
+        self,
+        credentials: SyftSigningKey,
+        communication_protocol: int,
+        metadata: ServerMetadataJSON | None = None,
+    ) -> SyftAPI:
+        if self.connection.proxy_target_uid:
+            obj = await self._forward_to_proxy(
+                "api",
+                credentials=credentials,
+                kwargs={
+                    "credentials": credentials,
+                    "communication_protocol": communication_protocol,
+                },
+            )
+        else:
+            params = {
+                "verify_key": str(credentials.verify_key),
+                "communication_protocol": communication_protocol,
+            }
+            content = await self._make_get(
+                self.connection.routes.ROUTE_API.value, params=params
+            )
+            obj = _deserialize(content, from_bytes=True)
+        obj.connection = self.connection
+        obj.async_connection = self
+        obj.signing_key = credentials
+        obj.communication_protocol = communication_protocol
+        obj.metadata = metadata
+        if self.connection.proxy_target_uid:
+            obj.server_uid = self.connection.proxy_target_uid
+        return cast(SyftAPI, obj)
+
+    async def login(self, email: str, password: str) -> UserPrivateKey | SyftError:
+        credentials = {"email": email, "password": password}
+        if self.connection.proxy_target_uid:
+            return await self._forward_to_proxy("login", kwargs=credentials)
+        response = await self._make_post(
+            self.connection.routes.ROUTE_LOGIN.value, credentials
+        )
+        return _deserialize(response, from_bytes=True)
+
+    async def get_client_type(
+        self, metadata: ServerMetadataJSON | None = None
+    ) -> type[SyftClient] | SyftError:
+        # relative
+        from .datasite_client import DatasiteClient
+        from .enclave_client import EnclaveClient
+        from .gateway_client import GatewayClient
+
+        if metadata is None:
+            metadata = await self.get_server_metadata(
+                credentials=SyftSigningKey.generate()
+            )
+        if metadata.server_type == ServerType.DATASITE.value:
+            return DatasiteClient
+        elif metadata.server_type == ServerType.GATEWAY.value:
+            return GatewayClient
+        elif metadata.server_type == ServerType.ENCLAVE.value:
+            return EnclaveClient
+        else:
+            return SyftError(message=f"Unknown server type {metadata.server_type}")
+
+
 @serializable()
 class PythonConnection(ServerConnection):
     __canonical_name__ = "PythonConnection"
@@ -627,6 +946,8 @@ class SyftClient:
         self.services: APIModule | None = None
         self.communication_protocol: int | str | None = None
         self.current_protocol: int | str | None = None
+        # set by login_async, api calls return awaitables then
+        self.async_connection: AsyncHTTPConnection | None = None
 
         self.post_init()
 
@@ -781,6 +1102,15 @@ class SyftClient:
                 f"Invalid Route Exchange SyftProtocol: {protocol}.Supported protocols are {SyftProtocol.all()}"
             )
 
+    @contextmanager
+    def batch(self) -> Iterator[list[BatchedAPICall]]:
+        """Sends the API calls made inside the block in a single request.
+
+        See `SyftAPI.batch`.
+        """
+        with self.api.batch() as batch:
+            yield batch
+
     @property
     def jobs(self) -> APIModule | None:
         if self.api.has_service("job"):
@@ -862,6 +1192,50 @@ class SyftClient:
             metadata=self.metadata,
         )
 
+    async def login_async(self, email: str, password: str) -> Self | SyftError:
+        """Logs in through an AsyncHTTPConnection.
+
+        API calls made through the returned client return awaitables, which lets
+        calls to one or many servers run concurrently:
+
+            clients = await asyncio.gather(
+                *[client.login_async(email, password) for client in guests]
+            )
+            users = await asyncio.gather(*[c.users.get_all() for c in clients])
+        """
+        async_connection = self.async_connection
+        if async_connection is None and isinstance(self.connection, HTTPConnection):
+            async_connection = AsyncHTTPConnection(self.connection)
+        if async_connection is None:
+            return SyftError(  # type: ignore
+                message="Async login needs an HTTPConnection, "
+                f"got {type(self.connection)}"
+            )
+
+        user_private_key = await async_connection.login(email=email, password=password)
+        if isinstance(user_private_key, SyftError):
+            return user_private_key
+
+        client = self.__class__(
+            connection=self.connection,
+            metadata=self.metadata,
+            credentials=user_private_key.signing_key,
+        )
+        client.async_connection = async_connection
+        await client._fetch_api_async(user_private_key.signing_key)
+
+        client.__logged_in_user = email
+        client.__user_role = user_private_key.role
+        current_user = await client.api.services.user.get_current_user()
+        if not isinstance(current_user, SyftError):
+            client.__logged_in_username = current_user.name
+        return client
+
+    async def aclose(self) -> None:
+        """Closes the connection pool of a client logged in with `login_async`."""
+        if self.async_connection is not None:
+            await self.async_connection.aclose()
+
     def login(
         self,
         email: str | None = None,
@@ -1038,6 +1412,26 @@ class SyftClient:
             metadata=self.metadata,
         )
         self._fetch_server_metadata(self.credentials)
+        return self._set_api(_api)
+
+    async def _fetch_api_async(self, credentials: SyftSigningKey) -> SyftAPI:
+        if self.async_connection is None:
+            raise ValueError(f"{self} has no async connection")
+        metadata = await self.async_connection.get_server_metadata(
+            credentials=credentials
+        )
+        if isinstance(metadata, ServerMetadataJSON):
+            metadata.check_version(__version__)
+            self.metadata = metadata
+        _api = await self.async_connection.get_api(
+            credentials=credentials,
+            communication_protocol=self.communication_protocol,
+            metadata=self.metadata,
+        )
+        return self._set_api(_api)
+
+    def _set_api(self, _api: SyftAPI) -> SyftAPI:
+        _api.async_connection = self.async_connection
 
         def refresh_callback() -> SyftAPI:
             return self._fetch_api(self.credentials)
@@ -1177,6 +1571,34 @@ def login(
     return _client
 
 
+async def login_async(
+    email: str,
+    password: str,
+    url: str | ServerURL = DEFAULT_SYFT_UI_ADDRESS,
+    port: int | None = None,
+) -> SyftClient | SyftError:
+    """Async counterpart of `login` for servers reached over HTTP."""
+    url = ServerURL.from_url(url)
+    if isinstance(port, int | str):
+        url.set_port(int(port))
+    connection = HTTPConnection(url=url)
+    async_connection = AsyncHTTPConnection(connection)
+
+    metadata = await async_connection.get_server_metadata(
+        credentials=SyftSigningKey.generate()
+    )
+    if isinstance(metadata, SyftError):
+        return metadata
+    metadata.check_version(__version__)
+
+    client_type = await async_connection.get_client_type(metadata)
+    if isinstance(client_type, SyftError):
+        return client_type
+    _client = client_type(connection=connection, metadata=metadata)
+    _client.async_connection = async_connection
+    return await _client.login_async(email=email, password=password)
+
+
 class SyftClientSessionCache:
     __credentials_store__: dict = {}
     __cache_key_format__ = "{email}-{password}-{connection}"
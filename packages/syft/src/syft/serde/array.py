@@ -1,3 +1,11 @@
+# stdlib
+from collections.abc import Callable
+import itertools
+import json
+import operator
+import struct
+from typing import Any
+
 # third party
 import numpy as np
 from numpy import frombuffer
@@ -34,7 +42,10 @@ DTYPE_REFACTOR = {
 }
 
 recursive_serde_register(
-    np.ndarray, serialize=numpy_serialize, deserialize=numpy_deserialize
+    np.ndarray,
+    serialize=numpy_serialize,
+    deserialize=numpy_deserialize,
+    zero_copy=True,
 )
 
 recursive_serde_register(
@@ -127,6 +138,185 @@ recursive_serde_register(
     deserialize=lambda buffer: frombuffer(buffer, dtype=np.float64)[0],
 )
 
+# Blocked arrays
+# --------------
+# Large arrays saved to blob storage are serialized in blocks of rows, each
+# serialized (and compressed) on its own, behind an index of the block offsets.
+# A slice of rows can then be read with ranged reads of the index and of the
+# blocks holding those rows, instead of the whole blob.
+#
+# layout:
+#   index  : block count (I) | rows per block (Q) | metadata length (I)
+#            | metadata (json with the dtype and shape)
+#            | (block count + 1) * block offset (Q), from the end of the index
+#   blocks : numpy_serialize of the rows of each block
+
+# size of the rows of an array serialized together
+ARRAY_BLOCK_SIZE = 4 * (1024**2)  # 4MB
+
+_BLOCKS_HEADER = struct.Struct("<IQI")
+
+
+class ArrayBlocks:
+    """An ndarray to be serialized in blocks of rows.
+
+    It deserializes back into the ndarray itself.
+    """
+
+    def __init__(self, array: np.ndarray, block_size: int = ARRAY_BLOCK_SIZE) -> None:
+        self.array = array
+        self.block_size = block_size
+
+
+def array_blocks_serialize(obj: ArrayBlocks) -> bytes:
+    array = obj.array
+    row_size = max(array.nbytes // max(len(array), 1), 1)
+    rows_per_block = max(obj.block_size // row_size, 1)
+    blocks = [
+        numpy_serialize(np.ascontiguousarray(array[start : start + rows_per_block]))
+        for start in range(0, len(array), rows_per_block)
+    ]
+    offsets = list(itertools.accumulate((len(block) for block in blocks), initial=0))
+    metadata = json.dumps(
+        {"dtype": array.dtype.str, "shape": list(array.shape)}
+    ).encode()
+    return b"".join(
+        [
+            _BLOCKS_HEADER.pack(len(blocks), rows_per_block, len(metadata)),
+            metadata,
+            struct.pack(f"<{len(offsets)}Q", *offsets),
+            *blocks,
+        ]
+    )
+
+
+class _BlocksIndex:
+    def __init__(
+        self,
+        dtype: np.dtype,
+        shape: tuple,
+        rows_per_block: int,
+        offsets: tuple[int, ...],
+        size: int,
+    ) -> None:
+        self.dtype = dtype
+        self.shape = shape
+        self.rows_per_block = rows_per_block
+        self.offsets = offsets
+        # size of the index, the blocks start after it
+        self.size = size
+
+    @classmethod
+    def read(cls, read: Callable[[int, int], bytes | memoryview]) -> "_BlocksIndex":
+        """Reads the index through read(offset, length) of the blocked array."""
+        n_blocks, rows_per_block, metadata_size = _BLOCKS_HEADER.unpack(
+            read(0, _BLOCKS_HEADER.size)
+        )
+        offsets_size = (n_blocks + 1) * 8
+        rest = read(_BLOCKS_HEADER.size, metadata_size + offsets_size)
+        metadata = json.loads(bytes(rest[:metadata_size]))
+        offsets = struct.unpack_from(f"<{n_blocks + 1}Q", rest, metadata_size)
+        return cls(
+            dtype=np.dtype(metadata["dtype"]),
+            shape=tuple(metadata["shape"]),
+            rows_per_block=rows_per_block,
+            offsets=offsets,
+            size=_BLOCKS_HEADER.size + metadata_size + offsets_size,
+        )
+
+    def read_rows(
+        self, read: Callable[[int, int], bytes | memoryview], start: int, stop: int
+    ) -> np.ndarray:
+        """Returns the rows [start, stop), reading only the blocks holding them."""
+        if start >= stop:
+            return np.empty((0, *self.shape[1:]), dtype=self.dtype)
+        first = start // self.rows_per_block
+        last = (stop - 1) // self.rows_per_block
+        data = memoryview(
+            read(
+                self.size + self.offsets[first],
+                self.offsets[last + 1] - self.offsets[first],
+            )
+        )
+        blocks = [
+            numpy_deserialize(
+                data[
+                    self.offsets[i] - self.offsets[first] : self.offsets[i + 1]
+                    - self.offsets[first]
+                ]
+            )
+            for i in range(first, last + 1)
+        ]
+        rows = blocks[0] if len(blocks) == 1 else np.concatenate(blocks)
+        offset = first * self.rows_per_block
+        return rows[start - offset : stop - offset]
+
+
+def array_blocks_deserialize(buf: bytes | memoryview) -> np.ndarray:
+    view = memoryview(buf)
+
+    def read(offset: int, length: int) -> memoryview:
+        return view[offset : offset + length]
+
+    index = _BlocksIndex.read(read)
+    return index.read_rows(read, 0, index.shape[0])
+
+
+recursive_serde_register(
+    ArrayBlocks,
+    serialize=array_blocks_serialize,
+    deserialize=array_blocks_deserialize,
+    zero_copy=True,
+)
+
+ARRAY_BLOCKS_CANONICAL_NAME = f"{ArrayBlocks.__module__}.{ArrayBlocks.__name__}"
+
+
+def _rows_for_key(key: Any, n_rows: int) -> tuple[int, int, Any]:
+    """Splits an index into the rows [start, stop) it needs and the index into them."""
+    first, rest = (key[0], key[1:]) if isinstance(key, tuple) and key else (key, ())
+    if isinstance(first, int | np.integer):
+        row = operator.index(first)
+        if row < 0:
+            row += n_rows
+        if not 0 <= row < n_rows:
+            raise IndexError(f"index {first} is out of bounds for size {n_rows}")
+        return row, row + 1, (0, *rest)
+    if isinstance(first, slice):
+        start, stop, step = first.indices(n_rows)
+        if step > 0:
+            lo, hi = start, max(start, stop)
+            return lo, hi, (slice(0, hi - lo, step), *rest)
+        lo, hi = stop + 1, max(start + 1, stop + 1)
+        return lo, hi, (slice(start - lo, None, step), *rest)
+    # any other index may need all rows
+    return 0, n_rows, key
+
+
+def read_array_slice(
+    read_range: Callable[[int, int | None], bytes], key: Any
+) -> np.ndarray | None:
+    """Returns array[key] of a flat serialized ArrayBlocks blob, reading only the
+    blocks holding the rows of key through read_range (see `locate_flat_root`).
+
+    Returns None if the blob does not hold a blocked array.
+    """
+    # relative
+    from .flat import locate_flat_root
+
+    root = locate_flat_root(read_range)
+    if root is None or root[0] != ARRAY_BLOCKS_CANONICAL_NAME:
+        return None
+    _, root_offset, _ = root
+
+    def read(offset: int, length: int) -> bytes:
+        return read_range(root_offset + offset, length)
+
+    index = _BlocksIndex.read(read)
+    start, stop, row_key = _rows_for_key(key, index.shape[0])
+    return index.read_rows(read, start, stop)[row_key]
+
+
 # TODO: There is an incorrect mapping in looping,which makes it not work.
 # numpy_scalar_types = [
 #     np.bool_,
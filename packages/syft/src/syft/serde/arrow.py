@@ -1,4 +1,5 @@
 # stdlib
+import json
 from typing import cast
 
 # third party
@@ -6,11 +7,16 @@ import numpy as np
 import pyarrow as pa
 
 # relative
+from ..util.experimental_flags import ARROW_IPC_CODECS
 from ..util.experimental_flags import ApacheArrowCompression
 from ..util.experimental_flags import flags
 from .deserialize import _deserialize
 from .serialize import _serialize
 
+# every message of an Arrow IPC stream starts with a continuation marker, which
+# neither the flat nor the capnp serde format can start with
+ARROW_IPC_MAGIC = b"\xff\xff\xff\xff"
+
 
 def arrow_serialize(obj: np.ndarray) -> bytes:
     # inner function to make sure variables go out of scope after this
@@ -34,28 +40,36 @@ def arrow_serialize(obj: np.ndarray) -> bytes:
 
 
 def arrow_deserialize(
-    numpy_bytes: bytes, decompressed_size: int, dtype: str
+    numpy_bytes: bytes | memoryview, decompressed_size: int, dtype: str
 ) -> np.ndarray:
     original_dtype = np.dtype(dtype)
     if flags.APACHE_ARROW_COMPRESSION is ApacheArrowCompression.NONE:
-        reader = pa.BufferReader(numpy_bytes)
-        numpy_bytes = reader.read_buffer()
+        # wraps the payload without copying it
+        buffer = pa.py_buffer(numpy_bytes)
     else:
-        numpy_bytes = pa.decompress(
+        buffer = pa.decompress(
             numpy_bytes,
             decompressed_size=decompressed_size,
             codec=flags.APACHE_ARROW_COMPRESSION.value,
         )
 
-    result = pa.ipc.read_tensor(numpy_bytes)
+    result = pa.ipc.read_tensor(buffer)
     np_array = result.to_numpy()
-    np_array.setflags(write=True)
-    return np_array.astype(original_dtype)
+    if buffer.is_mutable:
+        np_array.setflags(write=True)
+    else:
+        # the payload is a view into an immutable message, copy it once so the
+        # array stays writable
+        np_array = np_array.copy()
+    return np_array.astype(original_dtype, copy=False)
 
 
 def numpyutf8toarray(input_index: np.ndarray) -> np.ndarray:
     """Decodes utf-8 encoded numpy array to string numpy array.
 
+    Reads the legacy layout of string arrays, where every byte, offset and
+    dimension was stored as a uint64.
+
     Args:
         input_index (np.ndarray): utf-8 encoded array
 
@@ -68,60 +82,85 @@ def numpyutf8toarray(input_index: np.ndarray) -> np.ndarray:
     index_length = int(string_index[-1])
     index_array = string_index[-(index_length + 1) : -1]  # noqa
     string_array: np.ndarray = string_index[: -(index_length + 1)]
-    output_bytes: bytes = string_array.astype(np.uint8).tobytes()
-    output_list = []
-    last_offset = 0
-    for offset in index_array:
-        chars = output_bytes[last_offset:offset]
-        final_string = chars.decode("utf-8")
-        last_offset = offset
-        output_list.append(final_string)
-    return np.array(output_list).reshape(shape)
+    offsets = np.concatenate([[0], index_array]).astype(np.int64)
+    strings = pa.LargeStringArray.from_buffers(
+        index_length,
+        pa.py_buffer(offsets),
+        pa.py_buffer(string_array.astype(np.uint8)),
+    )
+    return _strings_to_numpy(strings, np.dtype(str), shape)
+
+
+def _strings_to_numpy(
+    strings: pa.Array | pa.ChunkedArray, dtype: np.dtype, shape: tuple
+) -> np.ndarray:
+    # decodes all strings at once into an object array
+    values = strings.to_numpy(zero_copy_only=False)
+    if dtype.kind == "U":
+        values = values.astype(dtype)
+    return values.reshape(shape)
 
 
 def arraytonumpyutf8(string_list: str | np.ndarray) -> bytes:
-    """Encodes string Numpyarray  to utf-8 encoded numpy array.
+    """Encodes a string or object Numpyarray to an Arrow IPC stream.
+
+    The strings are stored as an Arrow StringArray, i.e. their utf-8 bytes
+    and offsets, with the shape and dtype in the schema metadata. Objects
+    other than str and None can not be encoded.
 
     Args:
         string_list (np.ndarray): NumpyArray to be encoded
 
     Returns:
-        bytes: serialized utf-8 encoded int Numpy array
+        bytes: serialized Arrow IPC stream
     """
-    array_shape = np.array(string_list).shape
-    string_list = np.array(string_list).flatten()
-    bytes_list = []
-    indexes = []
-    offset = 0
-
-    for item in string_list:
-        name_bytes = item.encode("utf-8")
-        offset += len(name_bytes)
-        indexes.append(offset)
-        bytes_list.append(name_bytes)
-
-    np_bytes = np.frombuffer(b"".join(bytes_list), dtype=np.uint8)
-    np_bytes = np_bytes.astype(np.uint64)
-    np_indexes = np.array(indexes, dtype=np.uint64)
-    index_length = np.array([len(np_indexes)], dtype=np.uint64)
-    shape = np.array(array_shape, dtype=np.uint64)
-    shape_length = np.array([len(shape)], dtype=np.uint64)
-    output_array = np.concatenate(
-        [np_bytes, np_indexes, index_length, shape, shape_length]
+    array = np.asarray(string_list)
+    # arrow reads fixed width numpy strings up to the first NUL, as str objects
+    # they keep every character
+    values = array.ravel().astype(object, copy=False)
+    # converts all strings at once, None becomes null in object arrays
+    strings = pa.array(values, type=pa.string(), from_pandas=False)
+    metadata = {
+        b"shape": json.dumps(array.shape).encode(),
+        b"dtype": array.dtype.str.encode(),
+    }
+    table = pa.table({"strings": strings}).replace_schema_metadata(metadata)
+    options = pa.ipc.IpcWriteOptions(
+        compression=ARROW_IPC_CODECS[flags.APACHE_ARROW_IPC_COMPRESSION]
     )
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema, options=options) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
 
-    return cast(bytes, _serialize(output_array, to_bytes=True))
+
+def arrow_strings_deserialize(buf: bytes | memoryview) -> np.ndarray:
+    table = pa.ipc.open_stream(pa.py_buffer(buf)).read_all()
+    metadata = table.schema.metadata
+    shape = tuple(json.loads(metadata[b"shape"]))
+    dtype = np.dtype(metadata[b"dtype"].decode())
+    return _strings_to_numpy(table.column("strings"), dtype, shape)
 
 
 def numpy_serialize(obj: np.ndarray) -> bytes:
-    if obj.dtype.type != np.str_:
-        return arrow_serialize(obj)
-    else:
+    if obj.dtype.type in (np.str_, np.object_):
         return arraytonumpyutf8(obj)
+    else:
+        return arrow_serialize(obj)
+
 
+def numpy_deserialize(buf: bytes | memoryview) -> np.ndarray:
+    # relative
+    from .flat import is_flat_blob
+    from .flat import rs_flat2object
 
-def numpy_deserialize(buf: bytes) -> np.ndarray:
-    deser = _deserialize(buf, from_bytes=True)
+    if bytes(buf[: len(ARROW_IPC_MAGIC)]) == ARROW_IPC_MAGIC:
+        return arrow_strings_deserialize(buf)
+    if is_flat_blob(buf):
+        # keep the arrow payload as a view into buf instead of a bytes copy
+        deser = rs_flat2object(buf, bytes_as_views=True)
+    else:
+        deser = _deserialize(buf, from_bytes=True)
     if isinstance(deser, tuple):
         return arrow_deserialize(*deser)
     elif isinstance(deser, np.ndarray):
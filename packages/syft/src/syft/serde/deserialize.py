@@ -1,9 +1,15 @@
 # stdlib
+from collections.abc import Iterable
+import os
 from typing import Any
+from typing import BinaryIO
 
 # third party
 from capnp.lib.capnp import _DynamicStructBuilder
 
+# size of the reads from streams of unknown length
+DESERIALIZE_READ_SIZE = 1024**2  # 1MB
+
 
 def _deserialize(
     blob: Any,
@@ -11,11 +17,13 @@ def _deserialize(
     from_bytes: bool = False,
 ) -> Any:
     # relative
+    from .flat import is_flat_blob
+    from .flat import rs_flat2object
     from .recursive import rs_bytes2object
     from .recursive import rs_proto2object
 
     if (
-        (from_bytes and not isinstance(blob, bytes))
+        (from_bytes and not isinstance(blob, bytes | bytearray | memoryview))
         or (
             from_proto
             and not from_bytes
@@ -26,7 +34,48 @@ def _deserialize(
         raise TypeError("Wrong deserialization format.")
 
     if from_bytes:
+        if is_flat_blob(blob):
+            return rs_flat2object(blob)
         return rs_bytes2object(blob)
 
     if from_proto:
         return rs_proto2object(blob)
+
+
+def _deserialize_from(
+    source: BinaryIO | Iterable[bytes],
+    size: int | None = None,
+) -> Any:
+    """Deserializes a message read from a binary stream or an iterable of chunks.
+
+    The message is read into a single buffer that the deserialized objects can
+    keep views into, preallocated when `size` is given or the stream is seekable.
+    """
+    if hasattr(source, "readinto"):
+        if size is None and source.seekable():
+            position = source.tell()
+            size = source.seek(0, os.SEEK_END) - position
+            source.seek(position)
+        if size is not None:
+            buf = bytearray(size)
+            view = memoryview(buf)
+            read = 0
+            while read < size:
+                n = source.readinto(view[read:])
+                if not n:
+                    break
+                read += n
+            if read != size:
+                raise ValueError(f"Expected {size} bytes, stream ended after {read}")
+            return _deserialize(buf, from_bytes=True)
+        stream = source
+        source = iter(lambda: stream.read(DESERIALIZE_READ_SIZE), b"")
+
+    # size is only a hint for iterables, e.g. the Content-Length of an encoded body
+    buf = bytearray(size or 0)
+    read = 0
+    for chunk in source:
+        buf[read : read + len(chunk)] = chunk
+        read += len(chunk)
+    del buf[read:]
+    return _deserialize(buf, from_bytes=True)
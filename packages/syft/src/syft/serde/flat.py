@@ -0,0 +1,360 @@
+# stdlib
+from collections.abc import Callable
+from collections.abc import Iterator
+import struct
+import types
+from typing import Any
+
+# relative
+from ..types.syft_object_registry import SyftObjectRegistry
+from .recursive import SerdePlan
+from .recursive import rs_kwargs2object
+
+# Flat wire format
+# ----------------
+# The capnp based format embeds every attribute as a complete serialized
+# sub-message, so an object nested N levels deep has its bytes copied N times
+# on the way out and re-parsed N times on the way in. The flat format writes the
+# whole object graph into a single buffer instead. Composite nodes store
+# absolute offsets to their children, so every byte is written once.
+#
+# Nodes are written in post-order: children come before their parent, so every
+# node is final as soon as it is written. This lets the writer hand out the
+# message in chunks while it is being built, e.g. to stream it into a file or an
+# HTTP body, without ever holding all of it in memory.
+#
+# layout (version 2):
+#   header  : magic (4s) | format version (B)
+#   nodes   : node (B kind | I name index of the canonical name | i version)
+#     LEAF     : length (Q) | bytes produced by the registered serializer
+#     SEQUENCE : count (I) | count * child offset (Q)
+#     MAPPING  : count (I) | count * (key offset (Q), value offset (Q))
+#     OBJECT   : count (I) | count * (name index of the field (I), offset (Q))
+#   names   : count (I) | count * (length (I) | utf-8 bytes)
+#   trailer : offset of the name table (Q) | offset of the root node (Q)
+#
+# The magic can never start a capnp message (its first word is the number of
+# segments, which capnp caps far below 0x465953ff), which lets the reader tell
+# both formats apart and keep reading blobs written before the flat format.
+
+FLAT_MAGIC = b"\xffSYF"
+FLAT_FORMAT_VERSION = 2
+
+# size of the chunks handed out when streaming a message, leaves larger than
+# this are handed out as they are
+FLAT_STREAM_CHUNK_SIZE = 4 * (1024**2)  # 4MB
+
+KIND_LEAF = 0
+KIND_SEQUENCE = 1
+KIND_MAPPING = 2
+KIND_OBJECT = 3
+
+_HEADER = struct.Struct("<4sB")
+_TRAILER = struct.Struct("<QQ")
+_NODE = struct.Struct("<BIi")
+_LENGTH = struct.Struct("<Q")
+_COUNT = struct.Struct("<I")
+_FIELD = struct.Struct("<IQ")
+
+_NOTHING = object()
+
+
+def is_flat_blob(blob: bytes | bytearray | memoryview) -> bool:
+    return bytes(blob[: len(FLAT_MAGIC)]) == FLAT_MAGIC
+
+
+class _Frame:
+    """A composite node whose children are still being written."""
+
+    __slots__ = ("kind", "plan", "values", "names", "index", "offsets")
+
+    def __init__(
+        self, kind: int, plan: SerdePlan, values: list, names: list | None = None
+    ) -> None:
+        self.kind = kind
+        self.plan = plan
+        self.values = values
+        self.names = names
+        self.index = 0
+        self.offsets: list[int] = []
+
+
+class _FlatWriter:
+    def __init__(
+        self, for_hashing: bool = False, chunk_size: int | None = None
+    ) -> None:
+        self.for_hashing = for_hashing
+        # None keeps the whole message in a single chunk
+        self.chunk_size = chunk_size
+        self.buf = bytearray()
+        # number of bytes already handed out
+        self.flushed = 0
+        self.names: dict[str, int] = {}
+
+    @property
+    def position(self) -> int:
+        return self.flushed + len(self.buf)
+
+    def name_index(self, name: str) -> int:
+        index = self.names.get(name, None)
+        if index is None:
+            index = len(self.names)
+            self.names[name] = index
+        return index
+
+    def take(self) -> bytes:
+        chunk = bytes(self.buf)
+        self.flushed += len(chunk)
+        self.buf.clear()
+        return chunk
+
+    def visit(self, obj: Any) -> _Frame | bytes:
+        """Returns the serialized leaf for leaves, else a frame for the children."""
+        is_type = isinstance(obj, type)
+        plan = SyftObjectRegistry.get_serde_plan_for(obj, for_hashing=self.for_hashing)
+
+        if plan.nonrecursive or is_type:
+            if plan.serialize is None:
+                raise Exception(
+                    f"Cant serialize {type(obj)} nonrecursive without serialize."
+                )
+            if not is_type and plan.is_sequence:
+                return _Frame(KIND_SEQUENCE, plan, list(obj))
+            if not is_type and plan.is_mapping:
+                return _Frame(
+                    KIND_MAPPING, plan, [x for pair in obj.items() for x in pair]
+                )
+            self.buf.extend(
+                _NODE.pack(
+                    KIND_LEAF, self.name_index(plan.canonical_name), plan.version
+                )
+            )
+            return plan.serialize(obj)
+
+        names = []
+        values = []
+        for attr_name, field_serialize in plan.fields_for(obj):
+            if not hasattr(obj, attr_name):
+                raise ValueError(
+                    f"{attr_name} on {type(obj)} does not exist, serialization aborted!"
+                )
+
+            field_obj = getattr(obj, attr_name)
+
+            if field_serialize is not None:
+                field_obj = field_serialize(field_obj)
+
+            if isinstance(field_obj, types.FunctionType):
+                continue
+
+            names.append(self.name_index(attr_name))
+            values.append(field_obj)
+
+        return _Frame(KIND_OBJECT, plan, values, names)
+
+    def write_frame(self, frame: _Frame) -> int:
+        offset = self.position
+        plan = frame.plan
+        self.buf.extend(
+            _NODE.pack(frame.kind, self.name_index(plan.canonical_name), plan.version)
+        )
+        if frame.kind == KIND_OBJECT:
+            self.buf.extend(_COUNT.pack(len(frame.offsets)))
+            fields = [x for field in zip(frame.names, frame.offsets) for x in field]
+            self.buf.extend(struct.pack("<" + "IQ" * len(frame.offsets), *fields))
+        else:
+            count = len(frame.offsets)
+            if frame.kind == KIND_MAPPING:
+                count //= 2
+            self.buf.extend(_COUNT.pack(count))
+            self.buf.extend(struct.pack(f"<{len(frame.offsets)}Q", *frame.offsets))
+        return offset
+
+    def iter_chunks(self, obj: Any) -> Iterator[bytes]:
+        self.buf.extend(_HEADER.pack(FLAT_MAGIC, FLAT_FORMAT_VERSION))
+        chunk_size = self.chunk_size
+
+        # iterative post-order walk, the stack holds the composite nodes whose
+        # children are being written
+        stack: list[_Frame] = []
+        pending = obj
+        while True:
+            if pending is not _NOTHING:
+                offset = self.position
+                node = self.visit(pending)
+                pending = _NOTHING
+                if isinstance(node, _Frame):
+                    stack.append(node)
+                    continue
+                self.buf.extend(_LENGTH.pack(len(node)))
+                if chunk_size is not None and len(node) >= chunk_size:
+                    # hand large leaves out as they are instead of copying them
+                    yield self.take()
+                    yield node
+                    self.flushed += len(node)
+                else:
+                    self.buf.extend(node)
+            else:
+                frame = stack[-1]
+                if frame.index < len(frame.values):
+                    pending = frame.values[frame.index]
+                    frame.index += 1
+                    continue
+                stack.pop()
+                offset = self.write_frame(frame)
+
+            if chunk_size is not None and len(self.buf) >= chunk_size:
+                yield self.take()
+
+            if not stack:
+                break
+            stack[-1].offsets.append(offset)
+
+        root_offset = offset
+        names_offset = self.position
+        self.buf.extend(_COUNT.pack(len(self.names)))
+        # dicts keep insertion order, which is the index order
+        for name in self.names:
+            encoded = name.encode("utf-8")
+            self.buf.extend(_COUNT.pack(len(encoded)))
+            self.buf.extend(encoded)
+        self.buf.extend(_TRAILER.pack(names_offset, root_offset))
+        yield self.take()
+
+
+def rs_object2flat(obj: Any, for_hashing: bool = False) -> bytes:
+    writer = _FlatWriter(for_hashing=for_hashing)
+    (blob,) = writer.iter_chunks(obj)
+    return blob
+
+
+def rs_object2flat_chunks(
+    obj: Any, for_hashing: bool = False, chunk_size: int = FLAT_STREAM_CHUNK_SIZE
+) -> Iterator[bytes]:
+    """Serializes obj in chunks of about chunk_size bytes, as it is being written."""
+    writer = _FlatWriter(for_hashing=for_hashing, chunk_size=chunk_size)
+    return writer.iter_chunks(obj)
+
+
+def _read_names(view: memoryview, offset: int) -> list[str]:
+    (count,) = _COUNT.unpack_from(view, offset)
+    offset += _COUNT.size
+    names = []
+    for _ in range(count):
+        (length,) = _COUNT.unpack_from(view, offset)
+        offset += _COUNT.size
+        names.append(str(view[offset : offset + length], "utf-8"))
+        offset += length
+    return names
+
+
+class _FlatReader:
+    def __init__(
+        self, view: memoryview, names: list[str], bytes_as_views: bool = False
+    ) -> None:
+        self.view = view
+        self.names = names
+        self.bytes_as_views = bytes_as_views
+
+    def read_node(self, offset: int) -> Any:
+        view = self.view
+        kind, name_index, version = _NODE.unpack_from(view, offset)
+        offset += _NODE.size
+        plan = SyftObjectRegistry.get_serde_plan(self.names[name_index], version)
+
+        if kind == KIND_LEAF:
+            if plan.deserialize is None:
+                raise Exception(
+                    f"Cant deserialize {plan.canonical_name} without deserialize."
+                )
+            (length,) = _LENGTH.unpack_from(view, offset)
+            offset += _LENGTH.size
+            # a view into the message, without copying the leaf out of it
+            data = view[offset : offset + length]
+            if self.bytes_as_views and plan.cls is bytes:
+                return data
+            return plan.deserialize(data if plan.zero_copy else bytes(data))
+
+        (count,) = _COUNT.unpack_from(view, offset)
+        offset += _COUNT.size
+
+        if kind == KIND_SEQUENCE:
+            offsets = struct.unpack_from(f"<{count}Q", view, offset)
+            return plan.cls([self.read_node(child) for child in offsets])
+
+        if kind == KIND_MAPPING:
+            offsets = struct.unpack_from(f"<{2 * count}Q", view, offset)
+            return plan.cls(
+                [
+                    (self.read_node(key), self.read_node(value))
+                    for key, value in zip(offsets[::2], offsets[1::2])
+                ]
+            )
+
+        if kind == KIND_OBJECT:
+            kwargs = {}
+            for field_index, child in _FIELD.iter_unpack(
+                view[offset : offset + count * _FIELD.size]
+            ):
+                attr_name = self.names[field_index]
+                attr_value = self.read_node(child)
+                field_deserialize = plan.field_deserializers.get(attr_name, None)
+
+                if field_deserialize is not None:
+                    attr_value = field_deserialize(attr_value)
+                kwargs[attr_name] = attr_value
+            return rs_kwargs2object(plan.cls, kwargs)
+
+        raise ValueError(f"Unknown flat serde node kind: {kind}")
+
+
+def rs_flat2object(
+    blob: bytes | bytearray | memoryview, bytes_as_views: bool = False
+) -> Any:
+    """Deserializes a blob written by `rs_object2flat`.
+
+    Leaves of types registered with `zero_copy=True` receive a memoryview into
+    `blob` rather than a copy of their bytes. With `bytes_as_views`, `bytes`
+    leaves are returned as such memoryviews too, which lets buffer backed
+    deserializers (numpy, arrow) wrap the payload without copying it.
+    """
+    view = memoryview(blob)
+    magic, format_version = _HEADER.unpack_from(view, 0)
+    if magic != FLAT_MAGIC:
+        raise ValueError("Blob is not in the flat serde format.")
+    if format_version != FLAT_FORMAT_VERSION:
+        raise ValueError(
+            f"Unsupported flat serde format version: {format_version}, "
+            f"expected {FLAT_FORMAT_VERSION}"
+        )
+    names_offset, root_offset = _TRAILER.unpack_from(view, len(view) - _TRAILER.size)
+    names = _read_names(view, names_offset)
+    reader = _FlatReader(view, names, bytes_as_views=bytes_as_views)
+    return reader.read_node(root_offset)
+
+
+def locate_flat_root(
+    read_range: Callable[[int, int | None], bytes],
+) -> tuple[str, int, int] | None:
+    """Finds the root leaf of a flat blob through ranged reads of it.
+
+    `read_range(offset, length)` returns length bytes from offset, or the bytes
+    up to the end for a length of None, counting from the end for a negative
+    offset. Returns the canonical name of the root leaf with the offset and
+    length of its bytes, or None if the root is not a leaf of a version 2 blob.
+    """
+    header = read_range(0, _HEADER.size)
+    if len(header) < _HEADER.size:
+        return None
+    magic, format_version = _HEADER.unpack(header)
+    if magic != FLAT_MAGIC or format_version != FLAT_FORMAT_VERSION:
+        return None
+
+    names_offset, root_offset = _TRAILER.unpack(read_range(-_TRAILER.size, None))
+    node = read_range(root_offset, _NODE.size + _LENGTH.size)
+    kind, name_index, _ = _NODE.unpack_from(node, 0)
+    if kind != KIND_LEAF:
+        return None
+    (length,) = _LENGTH.unpack_from(node, _NODE.size)
+    names = _read_names(memoryview(read_range(names_offset, None)), 0)
+    return names[name_index], root_offset + _NODE.size + _LENGTH.size, length
@@ -1,10 +1,14 @@
 # stdlib
 from collections.abc import Callable
+from collections.abc import Mapping
+from contextvars import ContextVar
+from dataclasses import dataclass
 from enum import Enum
 from enum import EnumMeta
 import sys
 import tempfile
 import types
+from types import MappingProxyType
 from typing import Any
 
 # third party
@@ -26,6 +30,16 @@ recursive_scheme = get_capnp_schema("recursive_serde.capnp").RecursiveSerde
 
 SPOOLED_FILE_MAX_SIZE_SERDE = 50 * (1024**2)  # 50MB
 
+# set while an object is serialized for hashing. Leaf serializers serialize their
+# contents without for_hashing, this keeps them on capnp too
+_serializing_for_hashing: ContextVar[bool] = ContextVar(
+    "serializing_for_hashing", default=False
+)
+
+
+def serializing_for_hashing() -> bool:
+    return _serializing_for_hashing.get()
+
 
 def get_types(cls: type, keys: list[str] | None = None) -> list[type] | None:
     if keys is None:
@@ -86,6 +100,7 @@ def recursive_serde_register(
     exclude_attrs: list | None = None,
     inherit_attrs: bool | None = True,
     inheritable_attrs: bool | None = True,
+    zero_copy: bool = False,
 ) -> None:
     pydantic_fields = None
     base_attrs = None
@@ -155,6 +170,7 @@ def recursive_serde_register(
         cls,
         attribute_types,
         version,
+        zero_copy,
     )
 
     TYPE_BANK[fqn] = serde_attributes
@@ -180,6 +196,100 @@ def recursive_serde_register(
             )
 
 
+@dataclass(frozen=True)
+class SerdePlan:
+    """The resolved serde properties of one registered class.
+
+    Plans are compiled once per (canonical_name, version, for_hashing) and
+    cached in the SyftObjectRegistry, so that serializing an object does not
+    need to recompute its attribute set or look up its overrides again.
+    """
+
+    canonical_name: str
+    version: int
+    cls: type
+    nonrecursive: bool
+    serialize: Callable | None
+    deserialize: Callable | None
+    # sorted (attribute name, serialize override) pairs, None if the attributes
+    # are only known per instance (taken from its __dict__)
+    fields: tuple[tuple[str, Callable | None], ...] | None
+    exclude_attrs: frozenset[str]
+    field_serializers: Mapping[str, Callable]
+    field_deserializers: Mapping[str, Callable]
+    is_sequence: bool
+    is_mapping: bool
+    zero_copy: bool
+
+    def fields_for(self, obj: Any) -> tuple[tuple[str, Callable | None], ...]:
+        if self.fields is not None:
+            return self.fields
+        return tuple(
+            (attr_name, self.field_serializers.get(attr_name, None))
+            for attr_name in sorted(set(obj.__dict__.keys()) - self.exclude_attrs)
+        )
+
+
+def compile_serde_plan(
+    canonical_name: str,
+    version: int,
+    serde_attributes: tuple,
+    for_hashing: bool = False,
+) -> SerdePlan:
+    # relative
+    from ..types.syft_object import DYNAMIC_SYFT_ATTRIBUTES
+    from .recursive_primitives import serialize_iterable
+    from .recursive_primitives import serialize_kv
+
+    (
+        nonrecursive,
+        serialize,
+        deserialize,
+        attribute_list,
+        exclude_attrs_list,
+        serde_overrides,
+        hash_exclude_attrs,
+        cls,
+        _,
+        _,
+        zero_copy,
+    ) = serde_attributes
+
+    exclude_attrs = set(exclude_attrs_list)
+    if for_hashing:
+        exclude_attrs |= set(hash_exclude_attrs) | set(DYNAMIC_SYFT_ATTRIBUTES)
+
+    field_serializers = {
+        attr_name: transforms[0] for attr_name, transforms in serde_overrides.items()
+    }
+    field_deserializers = {
+        attr_name: transforms[1] for attr_name, transforms in serde_overrides.items()
+    }
+
+    fields = None
+    if attribute_list is not None:
+        fields = tuple(
+            (attr_name, field_serializers.get(attr_name, None))
+            for attr_name in sorted(set(attribute_list) - exclude_attrs)
+        )
+
+    return SerdePlan(
+        canonical_name=canonical_name,
+        version=version,
+        cls=cls,
+        nonrecursive=nonrecursive,
+        serialize=serialize,
+        deserialize=deserialize,
+        fields=fields,
+        exclude_attrs=frozenset(exclude_attrs),
+        field_serializers=MappingProxyType(field_serializers),
+        field_deserializers=MappingProxyType(field_deserializers),
+        is_sequence=nonrecursive and serialize is serialize_iterable,
+        is_mapping=nonrecursive and serialize is serialize_kv,
+        zero_copy=zero_copy,
+    )
+
+
 def chunk_bytes(
     field_obj: Any,
     ser_func: Callable,
@@ -214,85 +324,54 @@ def chunk_bytes(
 
 
 def combine_bytes(capnp_list: list[bytes]) -> bytes:
-    # TODO: make sure this doesn't copy, perhaps allocate a fixed size buffer
-    # and move the bytes into it as we go
-    bytes_value = b""
-    for value in capnp_list:
-        bytes_value += value
-    return bytes_value
+    # most fields fit in a single chunk, which can be handed over as is
+    if len(capnp_list) == 1:
+        return capnp_list[0]
+    # join allocates the result once instead of growing it chunk by chunk
+    return b"".join(capnp_list)
 
 
 def rs_object2proto(self: Any, for_hashing: bool = False) -> _DynamicStructBuilder:
-    # relative
-    from ..types.syft_object import DYNAMIC_SYFT_ATTRIBUTES
+    if for_hashing and not serializing_for_hashing():
+        token = _serializing_for_hashing.set(True)
+        try:
+            return rs_object2proto(self, for_hashing=True)
+        finally:
+            _serializing_for_hashing.reset(token)
 
-    is_type = False
-    if isinstance(self, type):
-        is_type = True
+    is_type = isinstance(self, type)
 
     msg = recursive_scheme.new_message()
 
     # todo: rewrite and make sure every object has a canonical name and version
-    canonical_name = SyftObjectRegistry.get_canonical_name(self)
-    if is_type:
-        version = 1
-    else:
-        version = getattr(self, "__version__", 1)
-
-    if not SyftObjectRegistry.has_serde_class("", canonical_name, version):
-        # third party
-        raise Exception(f"{canonical_name} version {version} not in SyftObjectRegistry")
+    plan = SyftObjectRegistry.get_serde_plan_for(self, for_hashing=for_hashing)
 
-    msg.canonicalName = canonical_name
-    msg.version = version
-
-    (
-        nonrecursive,
-        serialize,
-        _,
-        attribute_list,
-        exclude_attrs_list,
-        serde_overrides,
-        hash_exclude_attrs,
-        _,
-        _,
-        _,
-    ) = SyftObjectRegistry.get_serde_properties(canonical_name, version)
+    msg.canonicalName = plan.canonical_name
+    msg.version = plan.version
 
-    if nonrecursive or is_type:
-        if serialize is None:
+    if plan.nonrecursive or is_type:
+        if plan.serialize is None:
             raise Exception(
                 f"Cant serialize {type(self)} nonrecursive without serialize."
             )
-        chunk_bytes(self, serialize, "nonrecursiveBlob", msg)
+        chunk_bytes(self, plan.serialize, "nonrecursiveBlob", msg)
         return msg
 
-    if attribute_list is None:
-        attribute_list = self.__dict__.keys()
+    fields = plan.fields_for(self)
 
-    hash_exclude_attrs_set = (
-        set(hash_exclude_attrs).union(set(DYNAMIC_SYFT_ATTRIBUTES))
-        if for_hashing
-        else set()
-    )
-    attribute_list = (
-        set(attribute_list) - set(exclude_attrs_list) - hash_exclude_attrs_set
-    )
-
-    msg.init("fieldsName", len(attribute_list))
-    msg.init("fieldsData", len(attribute_list))
+    msg.init("fieldsName", len(fields))
+    msg.init("fieldsData", len(fields))
 
-    for idx, attr_name in enumerate(sorted(attribute_list)):
+    for idx, (attr_name, field_serialize) in enumerate(fields):
         if not hasattr(self, attr_name):
             raise ValueError(
                 f"{attr_name} on {type(self)} does not exist, serialization aborted!"
             )
 
         field_obj = getattr(self, attr_name)
-        transforms = serde_overrides.get(attr_name, None)
 
-        if transforms is not None:
-            field_obj = transforms[0](field_obj)
+        if field_serialize is not None:
+            field_obj = field_serialize(field_obj)
 
         if isinstance(field_obj, types.FunctionType):
             continue
@@ -330,72 +409,57 @@ def map_fqns_for_backward_compatibility(fqn: str) -> str:
         return fqn
 
 
-def rs_proto2object(proto: _DynamicStructBuilder) -> Any:
-    # relative
-    from .deserialize import _deserialize
-
-    # clean this mess, Tudor
-    module_parts = proto.fullyQualifiedName.split(".")
+def _load_legacy_class(fully_qualified_name: str) -> None:
+    # 0.8.6 messages address classes by their module path, make sure user code
+    # classes are loaded before the registry is asked for them
+    module_parts = fully_qualified_name.split(".")
     klass = module_parts.pop()
-    class_type: type | Any = type(None)
 
     if klass != "NoneType":
         try:
-            class_type = index_syft_by_module_name(proto.fullyQualifiedName)  # type: ignore[assignment,unused-ignore]
+            index_syft_by_module_name(fully_qualified_name)  # type: ignore[unused-ignore]
         except Exception:  # nosec
             try:
-                class_type = getattr(sys.modules[".".join(module_parts)], klass)
+                getattr(sys.modules[".".join(module_parts)], klass)
             except Exception:  # nosec
-                if "syft.user" in proto.fullyQualifiedName:
+                if "syft.user" in fully_qualified_name:
                     # relative
                     from ..server.server import CODE_RELOADER
 
                     for load_user_code in CODE_RELOADER.values():
                         load_user_code()
-                try:
-                    class_type = getattr(sys.modules[".".join(module_parts)], klass)
-                except Exception:  # nosec
-                    pass
+
+
+def rs_proto2object(proto: _DynamicStructBuilder) -> Any:
+    # relative
+    from .deserialize import _deserialize
 
     canonical_name = proto.canonicalName
     version = getattr(proto, "version", -1)
     fqn = getattr(proto, "fullyQualifiedName", "")
     fqn = map_fqns_for_backward_compatibility(fqn)
-    if not SyftObjectRegistry.has_serde_class(fqn, canonical_name, version):
-        # third party
-        raise Exception(f"{canonical_name} version {version} not in SyftObjectRegistry")
-
-    # TODO: 🐉 sort this out, basically sometimes the syft.user classes are not in the
-    # module name space in sub-processes or threads even though they are loaded on start
-    # its possible that the uvicorn awsgi server is preloading a bunch of threads
-    # however simply getting the class from the TYPE_BANK doesn't always work and
-    # causes some errors so it seems like we want to get the local one where possible
-    (
-        nonrecursive,
-        _,
-        deserialize,
-        _,
-        _,
-        serde_overrides,
-        _,
-        cls,
-        _,
-        version,
-    ) = SyftObjectRegistry.get_serde_properties_bw_compatible(
-        fqn, canonical_name, version
-    )
 
-    if class_type == type(None) or fqn != "":
-        # yes this looks stupid but it works and the opposite breaks
-        class_type = cls
+    if fqn == "":
+        plan = SyftObjectRegistry.get_serde_plan(canonical_name, version)
+    else:
+        _load_legacy_class(proto.fullyQualifiedName)
+        if not SyftObjectRegistry.has_serde_class(fqn, canonical_name, version):
+            # third party
+            raise Exception(
+                f"{canonical_name} version {version} not in SyftObjectRegistry"
+            )
+        serde_attributes = SyftObjectRegistry.get_serde_properties_bw_compatible(
+            fqn, canonical_name, version
+        )
+        plan = compile_serde_plan(canonical_name, version, serde_attributes)
 
-    if nonrecursive:
-        if deserialize is None:
+    if plan.nonrecursive:
+        if plan.deserialize is None:
             raise Exception(
                 f"Cant serialize {type(proto)} nonrecursive without serialize."
             )
 
-        return deserialize(combine_bytes(proto.nonrecursiveBlob))
+        return plan.deserialize(combine_bytes(proto.nonrecursiveBlob))
 
     kwargs = {}
 
@@ -403,12 +467,18 @@ def rs_proto2object(proto: _DynamicStructBuilder) -> Any:
         if attr_name != "":
             attr_bytes = combine_bytes(attr_bytes_list)
             attr_value = _deserialize(attr_bytes, from_bytes=True)
-            transforms = serde_overrides.get(attr_name, None)
+            field_deserialize = plan.field_deserializers.get(attr_name, None)
 
-            if transforms is not None:
-                attr_value = transforms[1](attr_value)
+            if field_deserialize is not None:
+                attr_value = field_deserialize(attr_value)
             kwargs[attr_name] = attr_value
 
+    return rs_kwargs2object(plan.cls, kwargs, proto.fullyQualifiedName)
+
+
+def rs_kwargs2object(
+    class_type: type | Any, kwargs: dict[str, Any], fqn: str = ""
+) -> Any:
     if hasattr(class_type, "serde_constructor"):
         return class_type.serde_constructor(kwargs)
 
@@ -418,7 +488,7 @@ def rs_proto2object(proto: _DynamicStructBuilder) -> Any:
         # if we skip the __new__ flow of BaseModel we get the error
         # AttributeError: object has no attribute '__fields_set__'
 
-        if "syft.user" in proto.fullyQualifiedName:
+        if "syft.user" in fqn:
             # weird issues with pydantic and ForwardRef on user classes being inited
             # with custom state args / kwargs
             obj = class_type()
@@ -210,6 +210,7 @@ recursive_serde_register(
     int,
     serialize=lambda x: x.to_bytes((x.bit_length() + 7) // 8 + 1, "big", signed=True),
     deserialize=lambda x_bytes: int.from_bytes(x_bytes, "big", signed=True),
+    zero_copy=True,
 )
 
 recursive_serde_register(
@@ -221,7 +222,10 @@ recursive_serde_register(
 recursive_serde_register(bytes, serialize=lambda x: x, deserialize=lambda x: x)
 
 recursive_serde_register(
-    str, serialize=lambda x: x.encode(), deserialize=lambda x: x.decode()
+    str,
+    serialize=lambda x: x.encode(),
+    deserialize=lambda x: str(x, "utf-8"),
+    zero_copy=True,
 )
 
 recursive_serde_register(
@@ -1,6 +1,9 @@
 # stdlib
+from collections.abc import Iterator
+import itertools
 import tempfile
 from typing import Any
+from typing import BinaryIO
 
 # relative
 from .util import compatible_with_large_file_writes_capnp
@@ -13,7 +16,16 @@ def _serialize(
     for_hashing: bool = False,
 ) -> Any:
     # relative
+    from ..util.experimental_flags import flags
+    from .flat import rs_object2flat
     from .recursive import rs_object2proto
+    from .recursive import serializing_for_hashing
+
+    # hashes are always taken over the capnp bytes, so they do not depend on
+    # the wire format
+    hashing = for_hashing or serializing_for_hashing()
+    if to_bytes and flags.FLAT_SERDE and not hashing:
+        return rs_object2flat(obj, for_hashing=for_hashing)
 
     proto = rs_object2proto(obj, for_hashing=for_hashing)
     if to_bytes:
@@ -32,3 +44,61 @@ def _serialize(
 
     if to_proto:
         return proto
+
+
+def _serialize_chunks(
+    obj: object,
+    for_hashing: bool = False,
+    chunk_size: int | None = None,
+) -> Iterator[bytes]:
+    """Serializes obj to bytes, handing the message out in chunks as it is written.
+
+    The chunks joined together are the same bytes `_serialize(obj, to_bytes=True)`
+    returns.
+    """
+    # relative
+    from ..util.experimental_flags import flags
+    from .flat import FLAT_STREAM_CHUNK_SIZE
+    from .flat import rs_object2flat_chunks
+    from .recursive import serializing_for_hashing
+
+    if not flags.FLAT_SERDE or for_hashing or serializing_for_hashing():
+        # capnp messages are only available once complete
+        yield _serialize(obj, to_bytes=True, for_hashing=for_hashing)
+        return
+
+    if chunk_size is None:
+        chunk_size = FLAT_STREAM_CHUNK_SIZE
+    yield from rs_object2flat_chunks(
+        obj, for_hashing=for_hashing, chunk_size=chunk_size
+    )
+
+
+def _serialize_to(
+    obj: object,
+    stream: BinaryIO,
+    for_hashing: bool = False,
+    chunk_size: int | None = None,
+) -> int:
+    """Serializes obj into a writable binary stream, returns the bytes written."""
+    size = 0
+    for chunk in _serialize_chunks(obj, for_hashing=for_hashing, chunk_size=chunk_size):
+        stream.write(chunk)
+        size += len(chunk)
+    return size
+
+
+def _serialize_body(
+    obj: object, chunk_size: int | None = None
+) -> bytes | Iterator[bytes]:
+    """Serializes obj as an HTTP body.
+
+    Returns the bytes when the message fits in a single chunk, else an iterator
+    over the remaining chunks for a streamed (chunked) body.
+    """
+    chunks = _serialize_chunks(obj, chunk_size=chunk_size)
+    first = next(chunks)
+    second = next(chunks, None)
+    if second is None:
+        return first
+    return itertools.chain((first, second), chunks)
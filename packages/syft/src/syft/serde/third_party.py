@@ -28,8 +28,11 @@ from ..types.dicttuple import DictTuple
 from ..types.dicttuple import _Meta as _DictTupleMetaClass
 from ..types.syft_metaclass import EmptyType
 from ..types.syft_metaclass import PartialModelMetaclass
+from ..util.experimental_flags import ARROW_IPC_CODECS
+from ..util.experimental_flags import flags
 from .array import numpy_deserialize
 from .array import numpy_serialize
+from .arrow import ARROW_IPC_MAGIC
 from .deserialize import _deserialize as deserialize
 from .recursive_primitives import _serialize_kv_pairs
 from .recursive_primitives import deserialize_kv
@@ -64,25 +67,93 @@ recursive_serde_register(cls=TypeError)
 recursive_serde_register_type(Collection)
 
 
-def serialize_dataframe(df: DataFrame) -> bytes:
+# pandas objects are serialized to Arrow IPC streams, which pandas can be read
+# back from without copying numeric columns. DataFrames used to be serialized
+# to parquet files and Series to dicts of their cells, both are still readable.
+PARQUET_MAGIC = b"PAR1"
+SERIES_METADATA_KEY = b"syft.series"
+
+
+def _pandas_to_ipc(df: DataFrame, metadata: dict[bytes, bytes] | None = None) -> bytes:
     table = pa.Table.from_pandas(df)
+    if metadata is not None:
+        table = table.replace_schema_metadata({**table.schema.metadata, **metadata})
+    options = pa.ipc.IpcWriteOptions(
+        compression=ARROW_IPC_CODECS[flags.APACHE_ARROW_IPC_COMPRESSION]
+    )
     sink = pa.BufferOutputStream()
-    # 🟡 TODO 37: Should we warn about this?
-    parquet_args = {
-        "coerce_timestamps": "us",
-        "allow_truncated_timestamps": True,
-    }
-    pq.write_table(table, sink, **parquet_args)
-    buffer = sink.getvalue()
-    numpy_bytes = buffer.to_pybytes()
-    return numpy_bytes
-
-
-def deserialize_dataframe(buf: bytes) -> DataFrame:
-    reader = pa.BufferReader(buf)
-    numpy_bytes = reader.read_buffer()
-    result = pq.read_table(numpy_bytes)
-    df = result.to_pandas()
+    with pa.ipc.new_stream(sink, table.schema, options=options) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def _writable_values(
+    column: pa.ChunkedArray, message: pa.Buffer, view: memoryview
+) -> np.ndarray | None:
+    """A writable array sharing the memory of a numeric column, if there is one."""
+    if column.num_chunks != 1 or column.null_count:
+        return None
+    chunk = column.chunk(0)
+    if not (pa.types.is_integer(chunk.type) or pa.types.is_floating(chunk.type)):
+        return None
+    dtype = np.dtype(chunk.type.to_pandas_dtype())
+    data = chunk.buffers()[1]
+    if data.is_mutable:
+        # decompressed buffers belong to arrow
+        memory, start = memoryview(data), 0
+    else:
+        # a slice of the message, which is writable if the message is
+        memory, start = view, data.address - message.address
+        if view.readonly or start < 0 or start + data.size > message.size:
+            return None
+    return np.frombuffer(
+        memory,
+        dtype=dtype,
+        count=len(chunk),
+        offset=start + chunk.offset * dtype.itemsize,
+    )
+
+
+def _ipc_to_pandas(buf: bytes | memoryview) -> tuple[DataFrame, dict[bytes, bytes]]:
+    view = memoryview(buf).cast("B")
+    message = pa.py_buffer(view)
+    table = pa.ipc.open_stream(message).read_all()
+    # one block per column, so the columns are not copied into a consolidated one
+    df = table.to_pandas(split_blocks=True)
+
+    # arrow hands out read-only arrays, numeric columns are replaced with
+    # writable views of the message where possible, other ones are copied
+    columns = table.schema.pandas_metadata["columns"]
+    values = []
+    for i in range(df.shape[1]):
+        array = df.iloc[:, i].array
+        if isinstance(df.dtypes.iloc[i], np.dtype):
+            array = array.to_numpy()
+            if not array.flags.writeable:
+                writable = _writable_values(
+                    table.column(columns[i]["field_name"]), message, view
+                )
+                if writable is None or writable.dtype != array.dtype:
+                    writable = array.copy()
+                array = writable
+        values.append(array)
+    # assigning columns would copy them, building the frame from them does not
+    result = DataFrame(dict(enumerate(values)), index=df.index, copy=False)
+    result.columns = df.columns
+    return result, table.schema.metadata or {}
+
+
+def serialize_dataframe(df: DataFrame) -> bytes:
+    return _pandas_to_ipc(df)
+
+
+def deserialize_dataframe(buf: bytes | memoryview) -> DataFrame:
+    if bytes(buf[: len(PARQUET_MAGIC)]) == PARQUET_MAGIC:
+        reader = pa.BufferReader(buf)
+        numpy_bytes = reader.read_buffer()
+        result = pq.read_table(numpy_bytes)
+        return result.to_pandas()
+    df, _ = _ipc_to_pandas(buf)
     return df
 
 
@@ -91,18 +162,37 @@ recursive_serde_register(
     DataFrame,
     serialize=serialize_dataframe,
     deserialize=deserialize_dataframe,
+    zero_copy=True,
 )
 
 
-def deserialize_series(blob: bytes) -> Series:
-    df: DataFrame = DataFrame.from_dict(deserialize(blob, from_bytes=True))
-    return Series(df[df.columns[0]])
+def serialize_series(series: Series) -> bytes:
+    # a Series without a name becomes column 0 of its frame
+    named = b"named" if series.name is not None else b"unnamed"
+    try:
+        return _pandas_to_ipc(series.to_frame(), {SERIES_METADATA_KEY: named})
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # object columns of mixed types have no arrow type, they keep the
+        # encoding used before Arrow IPC
+        return serialize(DataFrame(series).to_dict(), to_bytes=True)
+
+
+def deserialize_series(blob: bytes | memoryview) -> Series:
+    if bytes(blob[: len(ARROW_IPC_MAGIC)]) != ARROW_IPC_MAGIC:
+        legacy_df: DataFrame = DataFrame.from_dict(deserialize(blob, from_bytes=True))
+        return Series(legacy_df[legacy_df.columns[0]])
+    df, metadata = _ipc_to_pandas(blob)
+    series = df.iloc[:, 0]
+    if metadata.get(SERIES_METADATA_KEY, None) == b"unnamed":
+        series.name = None
+    return series
 
 
 recursive_serde_register(
     Series,
-    serialize=lambda x: serialize(DataFrame(x).to_dict(), to_bytes=True),
+    serialize=serialize_series,
     deserialize=deserialize_series,
+    zero_copy=True,
 )
 
 recursive_serde_register(
@@ -189,7 +279,7 @@ try:
     def torch_serialize(tensor: torch.Tensor) -> bytes:
         return numpy_serialize(tensor.numpy())
 
-    def torch_deserialize(buffer: bytes) -> torch.tensor:
+    def torch_deserialize(buffer: bytes | memoryview) -> torch.tensor:
         np_array = numpy_deserialize(buffer)
         return torch.from_numpy(np_array)
 
@@ -197,6 +287,7 @@ try:
         torch.Tensor,
         serialize=torch_serialize,
         deserialize=lambda data: torch_deserialize(data),
+        zero_copy=True,
     )
 
 except Exception:  # nosec
@@ -23,6 +23,7 @@ from ..client.connection import ServerConnection
 from ..protocol.data_protocol import PROTOCOL_TYPE
 from ..serde.deserialize import _deserialize as deserialize
 from ..serde.serialize import _serialize as serialize
+from ..serde.serialize import _serialize_body as serialize_body
 from ..service.context import ServerServiceContext
 from ..service.context import UnauthedServiceContext
 from ..service.metadata.server_metadata import ServerMetadataJSON
@@ -30,6 +31,11 @@ from ..service.response import SyftError
 from ..service.user.user import UserCreate
 from ..service.user.user import UserPrivateKey
 from ..service.user.user_service import UserService
+from ..store.blob_storage.on_disk import ON_DISK_BLOB_ROUTE
+from ..store.blob_storage.on_disk import OnDiskBlobStorageClient
+from ..store.blob_storage.on_disk import iter_file_range
+from ..store.blob_storage.on_disk import parse_range
+from ..store.blob_storage.on_disk import resolve_blob_url
 from ..types.uid import UID
 from ..util.telemetry import TRACE_MODE
 from .credentials import SyftVerifyKey
@@ -54,6 +60,14 @@ def make_routes(worker: Worker) -> APIRouter:
     async def get_body(request: Request) -> bytes:
         return await request.body()
 
+    async def get_body_buffer(request: Request) -> bytearray:
+        # reads the body chunk by chunk into a single buffer, which the
+        # deserialized message can keep views into
+        data = bytearray()
+        async for chunk in request.stream():
+            data.extend(chunk)
+        return data
+
     def _get_server_connection(peer_uid: UID) -> ServerConnection:
         # relative
         from ..service.network.server_peer import route_to_connection
@@ -114,6 +128,45 @@ def make_routes(worker: Worker) -> APIRouter:
             media_type="application/octet-stream",
         )
 
+    @router.get(f"{ON_DISK_BLOB_ROUTE}/{{file_name}}", name="blob_disk")
+    def blob_disk_download(
+        request: Request, file_name: str, expires: int, signature: str
+    ) -> Response:
+        blob_storage_client = worker.blob_storage_client
+        path = None
+        if isinstance(blob_storage_client, OnDiskBlobStorageClient):
+            path = resolve_blob_url(
+                blob_storage_client.config.base_directory,
+                file_name,
+                expires,
+                signature,
+            )
+        if path is None or not path.is_file():
+            raise HTTPException(404, "Blob not found.")
+
+        size = path.stat().st_size
+        try:
+            byte_range = parse_range(request.headers.get("Range"), size)
+        except ValueError:
+            return Response(
+                status_code=416, headers={"Content-Range": f"bytes */{size}"}
+            )
+
+        headers = {"Accept-Ranges": "bytes"}
+        if byte_range is None:
+            start, end, status_code = 0, size, 200
+        else:
+            start, end = byte_range
+            status_code = 206
+            headers["Content-Range"] = f"bytes {start}-{end - 1}/{size}"
+        headers["Content-Length"] = str(end - start)
+        return StreamingResponse(
+            iter_file_range(path, start, end),
+            status_code=status_code,
+            headers=headers,
+            media_type="application/octet-stream",
+        )
+
     @router.get(
         "/",
         name="healthcheck",
@@ -143,12 +196,19 @@ def make_routes(worker: Worker) -> APIRouter:
         )
 
     def handle_syft_new_api(
-        user_verify_key: SyftVerifyKey, communication_protocol: PROTOCOL_TYPE
+        user_verify_key: SyftVerifyKey,
+        communication_protocol: PROTOCOL_TYPE,
+        if_none_match: str | None = None,
     ) -> Response:
+        etag, api_bytes = worker.get_serialized_api(
+            user_verify_key, communication_protocol
+        )
+        # the client still has this API
+        if if_none_match == etag:
+            return Response(status_code=304, headers={"ETag": etag})
         return Response(
-            serialize(
-                worker.get_api(user_verify_key, communication_protocol), to_bytes=True
-            ),
+            api_bytes,
+            headers={"ETag": etag},
             media_type="application/octet-stream",
         )
 
@@ -158,28 +218,34 @@ def make_routes(worker: Worker) -> APIRouter:
         request: Request, verify_key: str, communication_protocol: PROTOCOL_TYPE
     ) -> Response:
         user_verify_key: SyftVerifyKey = SyftVerifyKey.from_string(verify_key)
+        if_none_match = request.headers.get("If-None-Match")
         if TRACE_MODE:
             with trace.get_tracer(syft_new_api.__module__).start_as_current_span(
                 syft_new_api.__qualname__,
                 context=extract(request.headers),
                 kind=trace.SpanKind.SERVER,
             ):
-                return handle_syft_new_api(user_verify_key, communication_protocol)
+                return handle_syft_new_api(
+                    user_verify_key, communication_protocol, if_none_match
+                )
         else:
-            return handle_syft_new_api(user_verify_key, communication_protocol)
+            return handle_syft_new_api(
+                user_verify_key, communication_protocol, if_none_match
+            )
 
-    def handle_new_api_call(data: bytes) -> Response:
+    def handle_new_api_call(data: bytearray) -> Response:
         obj_msg = deserialize(blob=data, from_bytes=True)
         result = worker.handle_api_call(api_call=obj_msg)
-        return Response(
-            serialize(result, to_bytes=True),
-            media_type="application/octet-stream",
-        )
+        body = serialize_body(result)
+        if isinstance(body, bytes):
+            return Response(body, media_type="application/octet-stream")
+        # large results are sent while they are being serialized
+        return StreamingResponse(body, media_type="application/octet-stream")
 
     # make a request to the SyftAPI
     @router.post("/api_call")
     def syft_new_api_call(
-        request: Request, data: Annotated[bytes, Depends(get_body)]
+        request: Request, data: Annotated[bytearray, Depends(get_body_buffer)]
     ) -> Response:
         if TRACE_MODE:
             with trace.get_tracer(syft_new_api_call.__module__).start_as_current_span(
@@ -14,12 +14,16 @@ import os
 from pathlib import Path
 import subprocess  # nosec
 import sys
+import threading
+import time
 from time import sleep
 import traceback
 from typing import Any
 from typing import cast
 
 # third party
+from cachetools import LRUCache
+from cachetools import TTLCache
 from nacl.signing import SigningKey
 from result import Err
 from result import Result
@@ -32,18 +36,21 @@ from ..abstract_server import ServerType
 from ..client.api import SignedSyftAPICall
 from ..client.api import SyftAPI
 from ..client.api import SyftAPICall
+from ..client.api import SyftAPICallBatch
 from ..client.api import SyftAPIData
 from ..client.api import debox_signed_syftapicall_response
 from ..client.client import SyftClient
 from ..exceptions.exception import PySyftException
 from ..protocol.data_protocol import PROTOCOL_TYPE
 from ..protocol.data_protocol import get_data_protocol
+from ..serde.serialize import _serialize as serialize
 from ..service.action.action_object import Action
 from ..service.action.action_object import ActionObject
 from ..service.action.action_store import ActionStore
 from ..service.action.action_store import DictActionStore
 from ..service.action.action_store import MongoActionStore
 from ..service.action.action_store import SQLiteActionStore
+from ..service.api.api_service import APIService
 from ..service.blob_storage.service import BlobStorageService
 from ..service.code.user_code_service import UserCodeService
 from ..service.code.user_code_stash import UserCodeStash
@@ -51,6 +58,7 @@ from ..service.context import AuthedServiceContext
 from ..service.context import ServerServiceContext
 from ..service.context import UnauthedServiceContext
 from ..service.context import UserLoginCredentials
+from ..service.job.job_events import JOB_EVENTS_WAIT_INTERVAL_SEC
 from ..service.job.job_stash import Job
 from ..service.job.job_stash import JobStash
 from ..service.job.job_stash import JobStatus
@@ -70,7 +78,9 @@ from ..service.queue.queue_stash import QueueItem
 from ..service.queue.queue_stash import QueueStash
 from ..service.queue.zmq_queue import QueueConfig
 from ..service.queue.zmq_queue import ZMQClientConfig
+from ..service.queue.zmq_queue import ZMQProducer
 from ..service.queue.zmq_queue import ZMQQueueConfig
+from ..service.queue.zmq_queue import ZMQQueueNotifier
 from ..service.response import SyftError
 from ..service.service import AbstractService
 from ..service.service import ServiceConfigRegistry
@@ -83,7 +93,6 @@ from ..service.user.user import UserCreate
 from ..service.user.user import UserView
 from ..service.user.user_roles import ServiceRole
 from ..service.user.user_service import UserService
-from ..service.user.user_stash import UserStash
 from ..service.worker.utils import DEFAULT_WORKER_IMAGE_TAG
 from ..service.worker.utils import DEFAULT_WORKER_POOL_NAME
 from ..service.worker.utils import create_default_image
@@ -142,6 +151,24 @@ DEFAULT_ROOT_EMAIL = "DEFAULT_ROOT_EMAIL"
 DEFAULT_ROOT_USERNAME = "DEFAULT_ROOT_USERNAME"
 DEFAULT_ROOT_PASSWORD = "DEFAULT_ROOT_PASSWORD"  # nosec
 
+# Duration (in seconds) after which the server reloads its cached ServerSettings,
+# writes through its own settings stash are applied to the cache right away
+SETTINGS_CACHE_TTL_SEC = 10
+
+# Number of serialized SyftAPIs a server keeps, one per distinct combination of
+# role, protocol, user code and custom API endpoints
+API_CACHE_SIZE = 256
+
+# Duration (in seconds) a server reuses the user code and custom API endpoints it
+# read for a user's API, writes through its own stashes drop them right away
+API_ENDPOINTS_CACHE_TTL_SEC = 10
+
+# The API caches of every server by its id, outside of the Server, which is
+# serialized with its services
+API_CACHES: dict[UID, LRUCache] = {}
+API_ENDPOINTS_CACHES: dict[UID, TTLCache] = {}
+API_CACHE_LOCK = threading.Lock()
+
 
 def get_private_key_env() -> str | None:
     return get_env(SERVER_PRIVATE_KEY)
@@ -396,6 +423,9 @@ class Server(AbstractServer):
 
         # construct services only after init stores
         self.services: ServiceRegistry = ServiceRegistry.for_server(self)
+        # ServerSettings and the time it has to be reloaded, see settings
+        self.settings_cache: tuple[ServerSettings, float] | None = None
+        self.settings_stash.add_listener(self.settings_changed)
 
         create_admin_new(  # nosec B106
             name=root_username,
@@ -427,6 +457,7 @@ class Server(AbstractServer):
         # Migrate data before any operation on db
 
         # first migrate, for backwards compatibility
+        self.queue_notifier: ZMQQueueNotifier | None = None
         self.init_queue_manager(queue_config=self.queue_config)
 
         context = AuthedServiceContext(
@@ -510,6 +541,8 @@ class Server(AbstractServer):
         if self.peer_health_manager is not None:
             self.peer_health_manager.stop()
 
+        self.remove_queue_notifier()
+
         for consumer_list in self.queue_manager.consumers.values():
             for c in consumer_list:
                 c.close()
@@ -520,6 +553,9 @@ class Server(AbstractServer):
         self.queue_manager.consumers.clear()
 
         ServerRegistry.remove_server(self.id)
+        with API_CACHE_LOCK:
+            API_CACHES.pop(self.id, None)
+            API_ENDPOINTS_CACHES.pop(self.id, None)
 
     def close(self) -> None:
         self.stop()
@@ -557,6 +593,9 @@ class Server(AbstractServer):
     def init_queue_manager(self, queue_config: QueueConfig) -> None:
         MessageHandlers = [APICallMessageHandler]
         if self.is_subprocess:
+            port = getattr(queue_config.client_config, "queue_port", None)
+            if port is not None:
+                self.add_queue_notifier(get_queue_address(port))
             return None
 
         self.queue_manager = QueueManager(config=queue_config)
@@ -581,6 +620,7 @@ class Server(AbstractServer):
                 port = queue_config.client_config.queue_port
                 if port is not None:
                     address = get_queue_address(port)
+                    self.add_queue_notifier(address)
                 else:
                     address = None
 
@@ -607,6 +647,21 @@ class Server(AbstractServer):
                         message_handler=message_handler,
                     )
 
+    def add_queue_notifier(self, address: str) -> None:
+        # new queue items and resolved jobs of this server are announced to the
+        # producer at address
+        self.queue_notifier = ZMQQueueNotifier(address)
+        self.queue_stash.add_listener(self.queue_notifier.notify)
+        self.job_stash.add_listener(self.queue_notifier.notify_job_resolved)
+
+    def remove_queue_notifier(self) -> None:
+        if self.queue_notifier is None:
+            return
+        self.queue_stash.remove_listener(self.queue_notifier.notify)
+        self.job_stash.remove_listener(self.queue_notifier.notify_job_resolved)
+        self.queue_notifier.close()
+        self.queue_notifier = None
+
     def add_consumer_for_service(
         self,
         service_name: str,
@@ -866,6 +921,10 @@ class Server(AbstractServer):
     def worker_stash(self) -> WorkerStash:
         return self.get_service("workerservice").stash
 
+    @property
+    def settings_stash(self) -> SettingsStash:
+        return self.get_service("settingsservice").stash
+
     @property
     def service_path_map(self) -> dict[str, AbstractService]:
         return self.services.service_path_map
@@ -912,18 +971,38 @@ class Server(AbstractServer):
             if attr is not Empty:
                 setattr(self, attr_name, attr)
 
+    def settings_changed(self, settings: ServerSettings | None) -> None:
+        """Called by the SettingsStash for every written or deleted ServerSettings."""
+        if settings is None:
+            self.settings_cache = None
+            return
+        self.settings_cache = (
+            settings.model_copy(),
+            time.time() + SETTINGS_CACHE_TTL_SEC,
+        )
+        self.update_self(settings)
+
     @property
     def settings(self) -> ServerSettings:
-        settings_stash = SettingsStash(store=self.document_store)
+        # every caller gets its own copy, the cached ServerSettings is neither
+        # changed by callers nor by stores that update their objects in place
+        cached = self.settings_cache
+        if cached is not None and time.time() < cached[1]:
+            return cached[0].model_copy()
+
         if self.signing_key is None:
             raise ValueError(f"{self} has no signing key")
-        settings = settings_stash.get_all(self.signing_key.verify_key)
+        settings = self.settings_stash.get_all(self.signing_key.verify_key)
         if settings.is_err():
             raise ValueError(
                 f"Cannot get server settings for '{self.name}'. Error: {settings.err()}"
             )
         if settings.is_ok() and len(settings.ok()) > 0:
             settings = settings.ok()[0]
+            self.settings_cache = (
+                settings.model_copy(),
+                time.time() + SETTINGS_CACHE_TTL_SEC,
+            )
         self.update_self(settings)
         return settings
 
@@ -991,7 +1070,10 @@ class Server(AbstractServer):
         # relative
         from ..service.queue.queue import Status
 
+        job_events = self.get_service("jobservice").events
         while True:
+            # read before the store, see JobEvents
+            since = job_events.generation
             result = self.queue_stash.pop_on_complete(credentials, uid)
             if not result.is_ok():
                 return result.err()
@@ -999,7 +1081,13 @@ class Server(AbstractServer):
                 res = result.ok()
                 if res.status == Status.COMPLETED:
                     return res
-            sleep(0.1)
+            if res.job_id is None:
+                sleep(0.1)
+            else:
+                # the job of a queue item is resolved right after the item itself,
+                # by this or another process, so the queue stash is read again after
+                # a short wait even without a notification
+                job_events.wait([res.job_id], since, JOB_EVENTS_WAIT_INTERVAL_SEC)
 
     def resolve_future(
         self, credentials: SyftVerifyKey, uid: UID
@@ -1056,8 +1144,11 @@ class Server(AbstractServer):
                 self.peer_client_cache[peer_cache_key] = client
 
         if client:
-            message: SyftAPICall = api_call.message
-            if message.path == "metadata":
+            message = api_call.message
+            if isinstance(message, SyftAPICallBatch):
+                signed_result = client.connection.make_call(api_call)
+                result = debox_signed_syftapicall_response(signed_result=signed_result)
+            elif message.path == "metadata":
                 result = client.metadata
             elif message.path == "login":
                 result = client.connection.login(**message.kwargs)
@@ -1117,21 +1208,56 @@ class Server(AbstractServer):
         if api_call.message.server_uid != self.id and check_call_location:
             return self.forward_message(api_call=api_call)
 
-        if api_call.message.path == "queue":
+        if isinstance(api_call.message, SyftAPICallBatch):
+            return self.handle_api_call_batch(
+                credentials=api_call.credentials,
+                batch=api_call.message,
+                job_id=job_id,
+            )
+
+        return self._handle_verified_api_call(
+            credentials=api_call.credentials, api_call=api_call.message, job_id=job_id
+        )
+
+    def handle_api_call_batch(
+        self,
+        credentials: SyftVerifyKey,
+        batch: SyftAPICallBatch,
+        job_id: UID | None = None,
+    ) -> list:
+        """Executes the calls of a verified batch in order, returns their results."""
+        results = []
+        for api_call in batch.calls:
+            if api_call.server_uid != batch.server_uid:
+                result = SyftError(
+                    message=f"Batched call {api_call.path} targets {api_call.server_uid}, "
+                    f"but the batch was sent to {batch.server_uid}"
+                )
+            else:
+                result = self._handle_verified_api_call(
+                    credentials=credentials, api_call=api_call, job_id=job_id
+                )
+            results.append(result)
+        return results
+
+    def _handle_verified_api_call(
+        self,
+        credentials: SyftVerifyKey,
+        api_call: SyftAPICall,
+        job_id: UID | None = None,
+    ) -> Result | QueueItem | SyftObject | SyftError:
+        if api_call.path == "queue":
             return self.resolve_future(
-                credentials=api_call.credentials, uid=api_call.message.kwargs["uid"]
+                credentials=credentials, uid=api_call.kwargs["uid"]
             )
 
-        if api_call.message.path == "metadata":
+        if api_call.path == "metadata":
             return self.metadata
 
         result = None
-        is_blocking = api_call.message.blocking
+        is_blocking = api_call.blocking
 
         if is_blocking or self.is_subprocess:
-            credentials: SyftVerifyKey = api_call.credentials
-            api_call = api_call.message
-
             role = self.get_role_for_credentials(credentials=credentials)
             context = AuthedServiceContext(
                 server=self,
@@ -1167,7 +1293,7 @@ class Server(AbstractServer):
                     message=f"Exception calling {api_call.path}. {traceback.format_exc()}"
                 )
         else:
-            return self.add_api_call_to_queue(api_call)
+            return self.add_api_call_to_queue(api_call, credentials=credentials)
         return result
 
     def add_api_endpoint_execution_to_queue(
@@ -1308,6 +1434,11 @@ class Server(AbstractServer):
         role = self.get_role_for_credentials(credentials=credentials)
         context = AuthedServiceContext(server=self, credentials=credentials, role=role)
 
+        if self.queue_is_full(context, queue_item):
+            return SyftError(
+                message="The queue of this worker pool is full. Please try again later."
+            )
+
         result_obj = ActionObject.empty()
         if action is not None:
             result_obj = ActionObject.obj_not_ready(id=action.result_id)
@@ -1343,15 +1474,34 @@ class Server(AbstractServer):
         job_res = self.job_stash.set(credentials, job)
         if job_res.is_err():
             return SyftError(message=f"{job_res.err()}")
-        self.queue_stash.set_placeholder(credentials, queue_item)
 
         log_service = self.get_service("logservice")
 
         result = log_service.add(context, log_id, queue_item.job_id)
         if isinstance(result, SyftError):
             return result
+
+        # the producer picks up the item right away, so the job and its log have to
+        # exist by now
+        self.queue_stash.set_placeholder(credentials, queue_item)
         return job
 
+    def queue_is_full(
+        self, context: AuthedServiceContext, queue_item: QueueItem
+    ) -> bool:
+        # only known to the server running the producer, the others leave it to
+        # the producer to hold back items
+        queue_manager = getattr(self, "queue_manager", None)
+        if queue_manager is None:
+            return False
+        producer = queue_manager.producers.get(APICallMessageHandler.queue_name)
+        if not isinstance(producer, ZMQProducer):
+            return False
+        worker_pool = queue_item.worker_pool.resolve_with_context(context)
+        if worker_pool.is_err():
+            return False
+        return producer.is_full(worker_pool.ok().name)
+
     def _sort_jobs(self, jobs: list[Job]) -> list[Job]:
         job_datetimes = {}
         for job in jobs:
@@ -1395,13 +1545,18 @@ class Server(AbstractServer):
         )
 
     def add_api_call_to_queue(
-        self, api_call: SyftAPICall, parent_job_id: UID | None = None
+        self,
+        api_call: SyftAPICall | SignedSyftAPICall,
+        parent_job_id: UID | None = None,
+        credentials: SyftVerifyKey | None = None,
     ) -> Job | SyftError:
+        # unsigned calls come from verified batches, with the batch credentials
         unsigned_call = api_call
         if isinstance(api_call, SignedSyftAPICall):
             unsigned_call = api_call.message
-
-        credentials = api_call.credentials
+            credentials = api_call.credentials if credentials is None else credentials
+        if isinstance(unsigned_call, SyftAPICallBatch):
+            return SyftError(message="API call batches can not be queued")
         context = AuthedServiceContext(
             server=self,
             credentials=credentials,
@@ -1459,7 +1614,7 @@ class Server(AbstractServer):
                 )
 
             return self.add_action_to_queue(
-                action, api_call.credentials, parent_job_id=parent_job_id
+                action, credentials, parent_job_id=parent_job_id
             )
 
         else:
@@ -1471,7 +1626,7 @@ class Server(AbstractServer):
             queue_item = QueueItem(
                 id=UID(),
                 server_uid=self.id,
-                syft_client_verify_key=api_call.credentials,
+                syft_client_verify_key=credentials,
                 syft_server_location=self.id,
                 job_id=UID(),
                 worker_settings=worker_settings,
@@ -1483,7 +1638,7 @@ class Server(AbstractServer):
             )
             return self.add_queueitem_to_queue(
                 queue_item=queue_item,
-                credentials=api_call.credentials,
+                credentials=credentials,
                 action=None,
                 parent_job_id=parent_job_id,
             )
@@ -1526,6 +1681,75 @@ class Server(AbstractServer):
             communication_protocol=communication_protocol,
         )
 
+    def get_serialized_api(
+        self,
+        for_user: SyftVerifyKey | None = None,
+        communication_protocol: PROTOCOL_TYPE | None = None,
+    ) -> tuple[str, bytes]:
+        """The serialized SyftAPI of a user and an etag identifying it.
+
+        The API only depends on the role, the protocol, the user code and the custom
+        API endpoints, users that share those share one serialized API. Changed user
+        code or endpoints give a new etag, old entries drop out of the LRU cache.
+        """
+        role = self.get_role_for_credentials(for_user)
+        code_items, custom_endpoints = self.user_endpoints_for(for_user)
+        key = (
+            role,
+            communication_protocol,
+            self.name,
+            self.server_type,
+            self.server_side_type,
+            self.enable_warnings,
+            tuple(code_item.id for code_item in code_items),
+            tuple(
+                (endpoint.path, str(endpoint.signature))
+                for endpoint in custom_endpoints
+            ),
+        )
+        etag = hashlib.sha256(f"{__version__}-{self.id}-{key}".encode()).hexdigest()
+
+        with API_CACHE_LOCK:
+            api_cache = API_CACHES.setdefault(self.id, LRUCache(maxsize=API_CACHE_SIZE))
+            api_bytes = api_cache.get(etag)
+        if api_bytes is None:
+            api = SyftAPI.build(
+                server=self,
+                communication_protocol=communication_protocol,
+                role=role,
+                user_verify_key=for_user,
+                code_items=code_items,
+                custom_endpoints=custom_endpoints,
+            )
+            api_bytes = serialize(api, to_bytes=True)
+            with API_CACHE_LOCK:
+                api_cache[etag] = api_bytes
+        return etag, api_bytes
+
+    def user_endpoints_for(self, for_user: SyftVerifyKey | None) -> tuple[list, list]:
+        """SyftAPI.user_endpoints_for, reused until the user code or custom API
+        endpoints of this server change, or API_ENDPOINTS_CACHE_TTL_SEC passed.
+        """
+        # read before the stores, see StorePartition.generation
+        key = (
+            for_user,
+            self.user_code_stash.partition.generation,
+            self.get_service(APIService).stash.partition.generation,
+        )
+        with API_CACHE_LOCK:
+            endpoints_cache = API_ENDPOINTS_CACHES.setdefault(
+                self.id,
+                TTLCache(maxsize=API_CACHE_SIZE, ttl=API_ENDPOINTS_CACHE_TTL_SEC),
+            )
+            endpoints = endpoints_cache.get(key)
+        if endpoints is None:
+            endpoints = SyftAPI.user_endpoints_for(self, for_user)
+            # errors are read again on the next request
+            if all(isinstance(items, list) for items in endpoints):
+                with API_CACHE_LOCK:
+                    endpoints_cache[key] = endpoints
+        return endpoints
+
     def get_method_with_context(
         self, function: Callable, context: ServerServiceContext
     ) -> Callable:
@@ -1539,7 +1763,7 @@ class Server(AbstractServer):
 
     def create_initial_settings(self, admin_email: str) -> ServerSettings | None:
         try:
-            settings_stash = SettingsStash(store=self.document_store)
+            settings_stash = self.settings_stash
             if self.signing_key is None:
                 logger.debug(
                     "create_initial_settings failed as there is no signing key"
@@ -1604,7 +1828,8 @@ def create_admin_new(
     server: AbstractServer,
 ) -> User | None:
     try:
-        user_stash = UserStash(store=server.document_store)
+        # the service's stash, so its role cache sees the new admin
+        user_stash = server.get_service("userservice").stash
         row_exists = user_stash.get_by_email(
             credentials=server.signing_key.verify_key, email=email
         ).ok()
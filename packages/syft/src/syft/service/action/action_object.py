@@ -6,10 +6,9 @@ from collections.abc import Callable
 from collections.abc import Iterable
 from enum import Enum
 import inspect
-from io import BytesIO
 import logging
 from pathlib import Path
-import sys
+import tempfile
 import threading
 import time
 import traceback
@@ -34,7 +33,7 @@ from ...client.api import SyftAPI
 from ...client.api import SyftAPICall
 from ...client.client import SyftClient
 from ...serde.serializable import serializable
-from ...serde.serialize import _serialize as serialize
+from ...serde.serialize import _serialize_to as serialize_to
 from ...server.credentials import SyftVerifyKey
 from ...service.blob_storage.util import can_upload_to_blob_storage
 from ...service.response import SyftError
@@ -54,6 +53,7 @@ from ...types.transforms import drop
 from ...types.transforms import make_set_default
 from ...types.uid import LineageID
 from ...types.uid import UID
+from ...util.experimental_flags import flags
 from ...util.util import prompt_warning_message
 from ..context import AuthedServiceContext
 from ..response import SyftException
@@ -239,6 +239,10 @@ class ActionObjectPointer:
     pass
 
 
+# Serialized action data up to this size is spooled in memory before it is
+# uploaded to blob storage, larger data is spooled to a temporary file
+BLOB_UPLOAD_SPOOL_SIZE = 16 * 1024 * 1024
+
 # Hooks
 HOOK_ALWAYS = "ALWAYS"
 HOOK_ON_POINTERS = "ON_POINTERS"
@@ -646,6 +650,7 @@ BASE_PASSTHROUGH_ATTRS: list[str] = [
     "_set_obj_location_",
     "syft_action_data_cache",
     "reload_cache",
+    "read_slice",
     "syft_resolved",
     "refresh_object",
     "syft_action_data_server_id",
@@ -832,8 +837,47 @@ class ActionObject(SyncableSyftObject):
 
         return None
 
+    def read_slice(self, key: Any) -> Any:
+        """Returns `syft_action_data[key]`.
+
+        When the data is a large ndarray stored in blob storage, only the blocks
+        of rows that key indexes are downloaded instead of the whole array.
+        """
+        if (
+            isinstance(self.syft_action_data_cache, ActionDataEmpty)
+            and self.syft_blob_storage_entry_id is not None
+        ):
+            blob_storage_read_method = from_api_or_context(
+                func_or_path="blob_storage.read",
+                syft_server_location=self.syft_server_location,
+                syft_client_verify_key=self.syft_client_verify_key,
+            )
+            if blob_storage_read_method is not None:
+                # relative
+                from ...serde.array import read_array_slice
+                from ...store.blob_storage import BlobRetrieval
+
+                blob_retrieval_object = blob_storage_read_method(
+                    uid=self.syft_blob_storage_entry_id
+                )
+                if isinstance(blob_retrieval_object, SyftError):
+                    return blob_retrieval_object
+                if (
+                    isinstance(blob_retrieval_object, BlobRetrieval)
+                    and blob_retrieval_object.supports_range_reads
+                ):
+                    result = read_array_slice(blob_retrieval_object.read_range, key)
+                    if result is not None:
+                        return result
+        return self.syft_action_data[key]
+
     def _save_to_blob_storage_(self, data: Any) -> SyftError | SyftWarning | None:
+        # third party
+        import numpy as np
+
         # relative
+        from ...serde.array import ARRAY_BLOCK_SIZE
+        from ...serde.array import ArrayBlocks
         from ...types.blob_storage import BlobFile
         from ...types.blob_storage import CreateBlobStorageEntry
 
@@ -858,34 +902,53 @@ class ActionObject(SyncableSyftObject):
                         message=f"The action object {self.id} was not saved to "
                         f"the blob store but to memory cache since it is small."
                     )
-                serialized = serialize(data, to_bytes=True)
-                size = sys.getsizeof(serialized)
-                storage_entry = CreateBlobStorageEntry.from_obj(data, file_size=size)
-
-                if not TraceResultRegistry.current_thread_is_tracing():
-                    self.syft_action_data_cache = self.as_empty_data()
-                if self.syft_blob_storage_entry_id is not None:
-                    # TODO: check if it already exists
-                    storage_entry.id = self.syft_blob_storage_entry_id
-                allocate_method = from_api_or_context(
-                    func_or_path="blob_storage.allocate",
-                    syft_server_location=self.syft_server_location,
-                    syft_client_verify_key=self.syft_client_verify_key,
-                )
-                if allocate_method is not None:
-                    blob_deposit_object = allocate_method(storage_entry)
-                    if isinstance(blob_deposit_object, SyftError):
-                        return blob_deposit_object
-
-                    result = blob_deposit_object.write(BytesIO(serialized))
-                    if isinstance(result, SyftError):
-                        return result
+                # large arrays are stored in blocks of rows, which read_slice
+                # can download on their own from a flat serialized blob
+                if (
+                    flags.FLAT_SERDE
+                    and isinstance(data, np.ndarray)
+                    and data.ndim > 0
+                    and data.nbytes > ARRAY_BLOCK_SIZE
+                ):
+                    to_serialize: Any = ArrayBlocks(data)
+                else:
+                    to_serialize = data
+
+                # the serialized chunks are spooled instead of joined, the
+                # deposit needs the exact size and reads its parts back by offset
+                with tempfile.SpooledTemporaryFile(
+                    max_size=BLOB_UPLOAD_SPOOL_SIZE
+                ) as serialized:
+                    size = serialize_to(to_serialize, serialized)
+                    serialized.seek(0)
+                    storage_entry = CreateBlobStorageEntry.from_obj(
+                        data, file_size=size
+                    )
 
-                    self.syft_blob_storage_entry_id = (
-                        blob_deposit_object.blob_storage_entry_id
+                    if not TraceResultRegistry.current_thread_is_tracing():
+                        self.syft_action_data_cache = self.as_empty_data()
+                    if self.syft_blob_storage_entry_id is not None:
+                        # TODO: check if it already exists
+                        storage_entry.id = self.syft_blob_storage_entry_id
+                    allocate_method = from_api_or_context(
+                        func_or_path="blob_storage.allocate",
+                        syft_server_location=self.syft_server_location,
+                        syft_client_verify_key=self.syft_client_verify_key,
                     )
-                else:
-                    logger.warn("cannot save to blob storage. allocate_method=None")
+                    if allocate_method is not None:
+                        blob_deposit_object = allocate_method(storage_entry)
+                        if isinstance(blob_deposit_object, SyftError):
+                            return blob_deposit_object
+
+                        result = blob_deposit_object.write(serialized)
+                        if isinstance(result, SyftError):
+                            return result
+
+                        self.syft_blob_storage_entry_id = (
+                            blob_deposit_object.blob_storage_entry_id
+                        )
+                    else:
+                        logger.warn("cannot save to blob storage. allocate_method=None")
 
             self.syft_action_data_type = type(data)
             self._set_reprs(data)
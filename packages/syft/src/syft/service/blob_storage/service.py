@@ -287,7 +287,7 @@ class BlobStorageService(AbstractService):
         roles=GUEST_ROLE_LEVEL,
     )
     def write_to_disk(
-        self, context: AuthedServiceContext, uid: UID, data: bytes
+        self, context: AuthedServiceContext, uid: UID, data: bytes, offset: int = 0
     ) -> SyftSuccess | SyftError:
         result = self.stash.get_by_uid(
             credentials=context.credentials,
@@ -304,7 +304,10 @@ class BlobStorageService(AbstractService):
             )
 
         try:
-            Path(obj.location.path).write_bytes(data)
+            # a write at offset 0 starts the file over, later chunks are added to it
+            with Path(obj.location.path).open("r+b" if offset > 0 else "wb") as f:
+                f.seek(offset)
+                f.write(data)
             return SyftSuccess(message="File successfully saved.")
         except Exception as e:
             return SyftError(message=f"Failed to write object to disk: {e}")
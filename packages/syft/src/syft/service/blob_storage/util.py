@@ -1,11 +1,43 @@
 # stdlib
 from typing import Any
 
+# third party
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
 # relative
-from ...util.util import get_mb_serialized_size
+from ...serde.serialize import _serialize_chunks
 from ..metadata.server_metadata import ServerMetadata
 from ..metadata.server_metadata import ServerMetadataJSON
 
+# Bytes added on top of the raw buffers of an estimated object, covering the
+# serde header and the type and shape metadata
+SERIALIZED_SIZE_OVERHEAD = 1024
+
+
+def estimate_serialized_size(data: Any) -> int:
+    """Estimates the serialized size of data in bytes without serializing it.
+
+    Arrays, dataframes and arrow data are estimated from the size of their
+    buffers, other objects are serialized in chunks which are only counted.
+    """
+    if isinstance(data, bytes | bytearray | memoryview):
+        return len(data) + SERIALIZED_SIZE_OVERHEAD
+    # object arrays only hold pointers to the python objects
+    if isinstance(data, np.ndarray) and data.dtype != object:
+        return data.nbytes + SERIALIZED_SIZE_OVERHEAD
+    if isinstance(data, pd.DataFrame | pd.Series):
+        # deep walks the python objects of every value, numeric data has none
+        dtypes = data.dtypes if isinstance(data, pd.DataFrame) else [data.dtype]
+        deep = not all(pd.api.types.is_numeric_dtype(dtype) for dtype in dtypes)
+        # a series reports a single number, a dataframe one per column
+        memory_usage: int = np.sum(data.memory_usage(deep=deep))
+        return int(memory_usage) + SERIALIZED_SIZE_OVERHEAD
+    if isinstance(data, pa.Table | pa.RecordBatch | pa.Array | pa.ChunkedArray):
+        return data.nbytes + SERIALIZED_SIZE_OVERHEAD
+    return sum(len(chunk) for chunk in _serialize_chunks(data))
+
 
 def min_size_for_blob_storage_upload(
     metadata: ServerMetadata | ServerMetadataJSON,
@@ -16,4 +48,5 @@ def min_size_for_blob_storage_upload(
 def can_upload_to_blob_storage(
     data: Any, metadata: ServerMetadata | ServerMetadataJSON
 ) -> bool:
-    return get_mb_serialized_size(data) >= min_size_for_blob_storage_upload(metadata)
+    size_mb = estimate_serialized_size(data) / (1024 * 1024)
+    return size_mb >= min_size_for_blob_storage_upload(metadata)
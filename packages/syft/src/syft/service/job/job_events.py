@@ -0,0 +1,61 @@
+# stdlib
+from collections import deque
+from collections.abc import Collection
+import threading
+import time
+
+# relative
+from ...types.uid import UID
+
+# Longest duration (in seconds) the server holds a job.wait_for call open
+JOB_WAIT_MAX_TIMEOUT_SEC = 30
+
+# Number of resolved ids kept for waiters that started before they were resolved
+JOB_EVENTS_HISTORY = 10_000
+
+# Longest duration (in seconds) of a single wait, after which waiters re-check the
+# store for jobs resolved without a notification, e.g. by another process
+JOB_EVENTS_WAIT_INTERVAL_SEC = 0.5
+
+
+class JobEvents:
+    """Wakes up threads waiting for jobs to resolve.
+
+    Every resolved id gets a generation number. A waiter passes the generation it
+    read before checking the store, so a job resolved in between is not missed.
+    """
+
+    def __init__(self, history: int = JOB_EVENTS_HISTORY) -> None:
+        self.condition = threading.Condition()
+        self.generation = 0
+        self.resolved: deque[tuple[int, UID]] = deque(maxlen=history)
+
+    def notify(self, uid: UID) -> None:
+        with self.condition:
+            self.generation += 1
+            self.resolved.append((self.generation, uid))
+            self.condition.notify_all()
+
+    def _resolved_since(self, uids: set[UID], since: int) -> bool:
+        for generation, uid in reversed(self.resolved):
+            if generation <= since:
+                return False
+            if uid in uids:
+                return True
+        return False
+
+    def wait(self, uids: Collection[UID], since: int, timeout: float) -> bool:
+        """Waits until any of uids is resolved after generation `since`.
+
+        Returns False if that did not happen within timeout seconds, which is capped
+        at JOB_EVENTS_WAIT_INTERVAL_SEC.
+        """
+        uids = set(uids)
+        deadline = time.time() + min(timeout, JOB_EVENTS_WAIT_INTERVAL_SEC)
+        with self.condition:
+            while not self._resolved_since(uids, since):
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    return False
+                self.condition.wait(remaining)
+        return True
@@ -27,6 +27,8 @@ from ..user.user_roles import ADMIN_ROLE_LEVEL
 from ..user.user_roles import DATA_OWNER_ROLE_LEVEL
 from ..user.user_roles import DATA_SCIENTIST_ROLE_LEVEL
 from ..user.user_roles import GUEST_ROLE_LEVEL
+from .job_events import JOB_WAIT_MAX_TIMEOUT_SEC
+from .job_events import JobEvents
 from .job_stash import Job
 from .job_stash import JobStash
 from .job_stash import JobStatus
@@ -45,7 +47,7 @@ def wait_until(
 
 
 @instrument
-@serializable()
+@serializable(without=["events"])
 class JobService(AbstractService):
     store: DocumentStore
     stash: JobStash
@@ -53,6 +55,8 @@ class JobService(AbstractService):
     def __init__(self, store: DocumentStore) -> None:
         self.store = store
         self.stash = JobStash(store=store)
+        self.events = JobEvents()
+        self.stash.add_listener(self.events.notify)
 
     @service_method(
         path="job.get",
@@ -104,6 +108,45 @@ class JobService(AbstractService):
             return SyftError(message=res.err())
         return SyftSuccess(message="Great Success!")
 
+    @service_method(
+        path="job.wait_for",
+        name="wait_for",
+        roles=DATA_SCIENTIST_ROLE_LEVEL,
+    )
+    def wait_for(
+        self,
+        context: AuthedServiceContext,
+        uids: list[UID],
+        timeout: float | None = None,
+    ) -> list[Job] | SyftError:
+        """Returns the resolved jobs of uids as soon as any of them is resolved.
+
+        Returns an empty list if none of them was resolved within timeout seconds,
+        at most JOB_WAIT_MAX_TIMEOUT_SEC.
+        """
+        if timeout is None or timeout > JOB_WAIT_MAX_TIMEOUT_SEC:
+            timeout = JOB_WAIT_MAX_TIMEOUT_SEC
+        deadline = time.time() + timeout
+
+        while True:
+            # read before the store, see JobEvents
+            since = self.events.generation
+            resolved = []
+            for uid in uids:
+                res = self.stash.get_by_uid(context.credentials, uid=uid)
+                if res.is_err():
+                    return SyftError(message=res.err())
+                job = res.ok()
+                if job is not None and job.resolved:
+                    resolved.append(job)
+            if resolved:
+                return resolved
+
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                return []
+            self.events.wait(uids, since, remaining)
+
     @service_method(
         path="job.get_by_result_id",
         name="get_by_result_id",
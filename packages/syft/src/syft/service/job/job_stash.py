@@ -6,7 +6,7 @@ from datetime import timezone
 from enum import Enum
 import random
 from string import Template
-from time import sleep
+import time
 from typing import Any
 
 # third party
@@ -25,7 +25,6 @@ from ...server.credentials import SyftVerifyKey
 from ...service.context import AuthedServiceContext
 from ...service.worker.worker_pool import SyftWorker
 from ...store.document_store import BaseUIDStoreStash
-from ...store.document_store import DocumentStore
 from ...store.document_store import PartitionKey
 from ...store.document_store import PartitionSettings
 from ...store.document_store import QueryKeys
@@ -55,6 +54,7 @@ from ..response import SyftNotReady
 from ..response import SyftSuccess
 from ..user.user import UserView
 from .html_template import job_repr_template
+from .job_events import JOB_WAIT_MAX_TIMEOUT_SEC
 
 
 @serializable()
@@ -142,7 +142,13 @@ class Job(SyncableSyftObject):
     requested_by: UID | None = None
     job_type: JobType = JobType.JOB
 
-    __attr_searchable__ = ["parent_job_id", "job_worker_id", "status", "user_code_id"]
+    __attr_searchable__ = [
+        "parent_job_id",
+        "job_worker_id",
+        "status",
+        "user_code_id",
+        "result_id",
+    ]
     __repr_attrs__ = [
         "id",
         "result",
@@ -176,6 +182,12 @@ class Job(SyncableSyftObject):
 
         return self
 
+    def result_id(self) -> UID | None:
+        # searchable, so jobs can be looked up by the id of their result
+        if isinstance(self.result, ActionObject):
+            return self.result.id.id
+        return None
+
     @property
     def action_display_name(self) -> str:
         if self.action is None:
@@ -697,7 +709,9 @@ class Job(SyncableSyftObject):
             )
 
         print_warning = True
-        counter = 0
+        deadline = None if timeout is None else time.time() + timeout
+        # servers from before job.wait_for are polled instead
+        server_waits = hasattr(api.services.job, "wait_for")
         while True:
             self.fetch()
             if self.resolved:
@@ -719,12 +733,21 @@ class Job(SyncableSyftObject):
                     )
                     print_warning = False
 
-            sleep(1)
-
-            if timeout is not None:
-                counter += 1
-                if counter > timeout:
+            poll_timeout: float = JOB_WAIT_MAX_TIMEOUT_SEC
+            if deadline is not None:
+                remaining = deadline - time.time()
+                if remaining <= 0:
                     return SyftError(message="Reached Timeout!")
+                poll_timeout = min(poll_timeout, remaining)
+
+            if not server_waits:
+                time.sleep(min(1, poll_timeout))
+                continue
+
+            # returns as soon as the job is resolved on the server
+            res = api.services.job.wait_for(uids=[self.id], timeout=poll_timeout)
+            if isinstance(res, SyftError):
+                return res
 
         # if self.resolve returns self.result as error, then we
         # return SyftError and not wait for the result
@@ -868,16 +891,26 @@ class JobInfo(SyftObject):
         return info
 
 
+ParentJobIdPartitionKey = PartitionKey(key="parent_job_id", type_=UID)
+JobStatusPartitionKey = PartitionKey(key="status", type_=JobStatus)
+JobWorkerIdPartitionKey = PartitionKey(key="job_worker_id", type_=str)
+UserCodeIdPartitionKey = PartitionKey(key="user_code_id", type_=UID)
+ResultIdPartitionKey = PartitionKey(key="result_id", type_=UID | None)
+
+
 @instrument
-@serializable()
+@serializable(without=["listeners"])
 class JobStash(BaseUIDStoreStash):
     object_type = Job
     settings: PartitionSettings = PartitionSettings(
         name=Job.__canonical_name__, object_type=Job
     )
 
-    def __init__(self, store: DocumentStore) -> None:
-        super().__init__(store=store)
+    # listeners are called with the id of every Job once it is stored as resolved
+
+    def _notify_resolved(self, res: Result[Job, str]) -> None:
+        if res.is_ok() and res.ok().resolved:
+            self._notify(res.ok().id)
 
     def set_result(
         self,
@@ -888,37 +921,42 @@ class JobStash(BaseUIDStoreStash):
         valid = self.check_type(item, self.object_type)
         if valid.is_err():
             return SyftError(message=valid.err())
-        return super().update(credentials, item, add_permissions)
+        res = super().update(credentials, item, add_permissions)
+        self._notify_resolved(res)
+        return res
+
+    def update(
+        self,
+        credentials: SyftVerifyKey,
+        obj: Job,
+        has_permission: bool = False,
+    ) -> Result[Job, str]:
+        res = super().update(credentials, obj, has_permission=has_permission)
+        self._notify_resolved(res)
+        return res
 
     def get_by_result_id(
         self,
         credentials: SyftVerifyKey,
         res_id: UID,
     ) -> Result[Job | None, str]:
-        res = self.get_all(credentials)
+        qks = QueryKeys(qks=[ResultIdPartitionKey.with_obj(res_id)])
+        res = self.query_all(credentials=credentials, qks=qks)
         if res.is_err():
             return res
+
+        jobs = res.ok()
+        if len(jobs) == 0:
+            return Ok(None)
+        elif len(jobs) > 1:
+            return Err("multiple Jobs found")
         else:
-            res = res.ok()
-            # beautiful query
-            res = [
-                x
-                for x in res
-                if isinstance(x.result, ActionObject) and x.result.id.id == res_id
-            ]
-            if len(res) == 0:
-                return Ok(None)
-            elif len(res) > 1:
-                return Err("multiple Jobs found")
-            else:
-                return Ok(res[0])
+            return Ok(jobs[0])
 
     def get_by_parent_id(
         self, credentials: SyftVerifyKey, uid: UID
     ) -> Result[Job | None, str]:
-        qks = QueryKeys(
-            qks=[PartitionKey(key="parent_job_id", type_=UID).with_obj(uid)]
-        )
+        qks = QueryKeys(qks=[ParentJobIdPartitionKey.with_obj(uid)])
         item = self.query_all(credentials=credentials, qks=qks)
         return item
 
@@ -932,28 +970,18 @@ class JobStash(BaseUIDStoreStash):
         return result
 
     def get_active(self, credentials: SyftVerifyKey) -> Result[SyftSuccess, str]:
-        qks = QueryKeys(
-            qks=[
-                PartitionKey(key="status", type_=JobStatus).with_obj(
-                    JobStatus.PROCESSING
-                )
-            ]
-        )
+        qks = QueryKeys(qks=[JobStatusPartitionKey.with_obj(JobStatus.PROCESSING)])
         return self.query_all(credentials=credentials, qks=qks)
 
     def get_by_worker(
         self, credentials: SyftVerifyKey, worker_id: str
     ) -> Result[list[Job], str]:
-        qks = QueryKeys(
-            qks=[PartitionKey(key="job_worker_id", type_=str).with_obj(worker_id)]
-        )
+        qks = QueryKeys(qks=[JobWorkerIdPartitionKey.with_obj(worker_id)])
         return self.query_all(credentials=credentials, qks=qks)
 
     def get_by_user_code_id(
         self, credentials: SyftVerifyKey, user_code_id: UID
     ) -> Result[list[Job], str]:
-        qks = QueryKeys(
-            qks=[PartitionKey(key="user_code_id", type_=UID).with_obj(user_code_id)]
-        )
+        qks = QueryKeys(qks=[UserCodeIdPartitionKey.with_obj(user_code_id)])
 
         return self.query_all(credentials=credentials, qks=qks)
@@ -25,6 +25,13 @@ class AbstractMessageHandler:
     def handle_message(message: bytes, syft_worker_id: UID) -> None:
         raise NotImplementedError
 
+    @classmethod
+    def handle_queue_item(
+        cls, queue_item: Any, message: bytes, syft_worker_id: UID
+    ) -> None:
+        """Handles a message the consumer already deserialized into queue_item."""
+        cls.handle_message(message, syft_worker_id)
+
 
 @serializable(attrs=["message_handler", "queue_name", "address"])
 class QueueConsumer:
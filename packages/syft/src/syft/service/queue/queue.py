@@ -1,6 +1,10 @@
 # stdlib
+import atexit
+from collections.abc import Callable
 import logging
+from multiprocessing import Pipe
 from multiprocessing import Process
+from multiprocessing.connection import Connection
 import threading
 from threading import Thread
 import time
@@ -125,6 +129,8 @@ class QueueManager(BaseQueueManager):
             queue_stash=queue_stash,
             context=context,
             worker_stash=worker_stash,
+            max_queue_depth=getattr(self.config, "max_queue_depth", None),
+            priorities=getattr(self.config, "priorities", None),
         )
 
     def send(
@@ -146,13 +152,7 @@ class QueueManager(BaseQueueManager):
         return self._client.consumers
 
 
-def handle_message_multiprocessing(
-    worker_settings: WorkerSettings,
-    queue_item: QueueItem,
-    credentials: SyftVerifyKey,
-) -> None:
-    # this is a temp hack to prevent some multithreading issues
-    time.sleep(0.5)
+def build_job_worker(worker_settings: WorkerSettings) -> Any:
     queue_config = worker_settings.queue_config
     if queue_config is None:
         raise ValueError(f"{worker_settings} has no queue configurations!")
@@ -175,6 +175,17 @@ def handle_message_multiprocessing(
         migrate=False,
     )
 
+    # otherwise it reads it from env, resulting in the wrong credentials
+    worker.id = worker_settings.id
+    worker.signing_key = worker_settings.signing_key
+    return worker
+
+
+def execute_queue_item(
+    worker: Any,  # should be of type Worker(Server), but get circular import error
+    queue_item: QueueItem,
+    credentials: SyftVerifyKey,
+) -> None:
     # Set monitor thread for this job.
     monitor_thread = MonitorThread(queue_item, worker, credentials)
     monitor_thread.start()
@@ -182,6 +193,7 @@ def handle_message_multiprocessing(
     if queue_item.service == "user":
         queue_item.service = "userservice"
 
+    result: Any = None
     try:
         call_method = getattr(worker.get_service(queue_item.service), queue_item.method)
         role = worker.get_role_for_credentials(credentials=credentials)
@@ -203,7 +215,7 @@ def handle_message_multiprocessing(
             user_verify_key=credentials,
         )
 
-        result: Any = call_method(context, *queue_item.args, **queue_item.kwargs)
+        result = call_method(context, *queue_item.args, **queue_item.kwargs)
         status = Status.COMPLETED
         job_status = JobStatus.COMPLETED
 
@@ -223,7 +235,7 @@ def handle_message_multiprocessing(
     except Exception as e:
         status = Status.ERRORED
         job_status = JobStatus.ERRORED
-        logger.error("Unhandled error in handle_message_multiprocessing", exc_info=e)
+        logger.error("Unhandled error in execute_queue_item", exc_info=e)
 
     queue_item.result = result
     queue_item.resolved = True
@@ -246,38 +258,183 @@ def handle_message_multiprocessing(
     monitor_thread.stop()
 
 
+def load_queue_item(worker: Any, message: bytes) -> QueueItem:
+    """Deserializes the QueueItem a consumer forwarded as it came from the producer."""
+    queue_item = deserialize(message, from_bytes=True)
+    queue_item.status = Status.PROCESSING
+    queue_item.server_uid = worker.id
+    return queue_item
+
+
+def handle_message_multiprocessing(
+    worker_settings: WorkerSettings,
+    message: bytes,
+) -> None:
+    # this is a temp hack to prevent some multithreading issues
+    time.sleep(0.5)
+    worker = build_job_worker(worker_settings)
+    queue_item = load_queue_item(worker, message)
+    execute_queue_item(worker, queue_item, queue_item.syft_client_verify_key)
+
+
+def job_worker_loop(
+    worker_settings: WorkerSettings,
+    conn: Connection,
+    parent_conn: Connection,
+) -> None:
+    # the consumer end of the pipe is inherited on fork, without closing it here
+    # recv would never see EOF once the consumer goes away
+    parent_conn.close()
+    worker = build_job_worker(worker_settings)
+
+    while True:
+        try:
+            message = conn.recv_bytes()
+        except (EOFError, OSError):
+            break
+        try:
+            queue_item = load_queue_item(worker, message)
+            execute_queue_item(worker, queue_item, queue_item.syft_client_verify_key)
+        except Exception as e:
+            logger.error("Failed to execute queue item", exc_info=e)
+        # tell the consumer this process is free for the next queue item
+        conn.send_bytes(b"")
+
+    conn.close()
+
+
+class JobWorkerPool:
+    """Long-lived processes that each keep one initialized worker Server.
+
+    Queue items are sent to an idle process over a pipe, so the cost of building a
+    Server is only paid when a process is started. A process killed together with
+    its job (see `MonitorThread.terminate`) is replaced by a fresh one.
+
+    Parameters:
+        `worker_settings`: WorkerSettings
+            Settings used to build the Server of every process
+        `size`: int
+            Number of processes started upfront, more are started when all of
+            them are busy
+    """
+
+    def __init__(self, worker_settings: WorkerSettings, size: int = 1) -> None:
+        self.worker_settings = worker_settings
+        self.lock = threading.Lock()
+        self.idle: list[tuple[Process, Connection]] = [
+            self._start_process() for _ in range(size)
+        ]
+
+    def _start_process(self) -> tuple[Process, Connection]:
+        parent_conn, child_conn = Pipe()
+        process = Process(
+            target=job_worker_loop,
+            args=(self.worker_settings, child_conn, parent_conn),
+        )
+        process.start()
+        child_conn.close()
+        return process, parent_conn
+
+    def _acquire(self) -> tuple[Process, Connection]:
+        with self.lock:
+            while self.idle:
+                process, conn = self.idle.pop()
+                if process.is_alive():
+                    return process, conn
+                conn.close()
+                process.join()
+        return self._start_process()
+
+    def _release(self, process: Process, conn: Connection) -> None:
+        with self.lock:
+            self.idle.append((process, conn))
+
+    def run(
+        self,
+        message: bytes,
+        on_start: Callable[[int | None], None] | None = None,
+    ) -> None:
+        """Runs the serialized QueueItem in one of the processes and waits for it."""
+        process, conn = self._acquire()
+        try:
+            if on_start is not None:
+                on_start(process.pid)
+            conn.send_bytes(message)
+            conn.recv_bytes()
+        except (EOFError, OSError):
+            # the process went down with the job, e.g. it was killed
+            conn.close()
+            process.join()
+            process, conn = self._start_process()
+        self._release(process, conn)
+
+    def close(self) -> None:
+        with self.lock:
+            idle, self.idle = self.idle, []
+        for process, conn in idle:
+            conn.close()
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+
+
+# WorkerSettings.id -> JobWorkerPool of this consumer process
+JOB_WORKER_POOLS: dict[UID, JobWorkerPool] = {}
+JOB_WORKER_POOLS_LOCK = threading.Lock()
+
+
+def get_job_worker_pool(worker_settings: WorkerSettings) -> JobWorkerPool:
+    with JOB_WORKER_POOLS_LOCK:
+        pool = JOB_WORKER_POOLS.get(worker_settings.id)
+        if pool is None:
+            pool = JobWorkerPool(worker_settings)
+            JOB_WORKER_POOLS[worker_settings.id] = pool
+        return pool
+
+
+@atexit.register
+def close_job_worker_pools() -> None:
+    with JOB_WORKER_POOLS_LOCK:
+        pools = list(JOB_WORKER_POOLS.values())
+        JOB_WORKER_POOLS.clear()
+    for pool in pools:
+        pool.close()
+
+
+# WorkerSettings.id -> Server used by the consumers of this process
+CONSUMER_WORKERS: dict[UID, Any] = {}
+CONSUMER_WORKERS_LOCK = threading.Lock()
+
+
+def get_consumer_worker(worker_settings: WorkerSettings) -> Any:
+    with CONSUMER_WORKERS_LOCK:
+        worker = CONSUMER_WORKERS.get(worker_settings.id)
+        if worker is None:
+            worker = build_job_worker(worker_settings)
+            CONSUMER_WORKERS[worker_settings.id] = worker
+        return worker
+
+
 @serializable()
 class APICallMessageHandler(AbstractMessageHandler):
     queue_name = "api_call"
 
     @staticmethod
     def handle_message(message: bytes, syft_worker_id: UID) -> None:
-        # relative
-        from ...server.server import Server
-
         queue_item = deserialize(message, from_bytes=True)
-        worker_settings = queue_item.worker_settings
+        APICallMessageHandler.handle_queue_item(queue_item, message, syft_worker_id)
 
+    @classmethod
+    def handle_queue_item(
+        cls, queue_item: QueueItem, message: bytes, syft_worker_id: UID
+    ) -> None:
+        worker_settings = queue_item.worker_settings
+        if worker_settings is None:
+            raise ValueError(f"{queue_item} has no worker settings!")
         queue_config = worker_settings.queue_config
-        queue_config.client_config.create_producer = False
-        queue_config.client_config.n_consumers = 0
-
-        worker = Server(
-            id=worker_settings.id,
-            name=worker_settings.name,
-            signing_key=worker_settings.signing_key,
-            document_store_config=worker_settings.document_store_config,
-            action_store_config=worker_settings.action_store_config,
-            blob_storage_config=worker_settings.blob_store_config,
-            server_side_type=worker_settings.server_side_type,
-            queue_config=queue_config,
-            is_subprocess=True,
-            migrate=False,
-        )
 
-        # otherwise it reads it from env, resulting in the wrong credentials
-        worker.id = worker_settings.id
-        worker.signing_key = worker_settings.signing_key
+        # the Server is built once per consumer process and reused for every message
+        worker = get_consumer_worker(worker_settings)
 
         credentials = queue_item.syft_client_verify_key
         res = worker.job_stash.get_by_uid(credentials, queue_item.job_id)
@@ -304,27 +461,38 @@ class APICallMessageHandler(AbstractMessageHandler):
         if isinstance(job_result, SyftError):
             raise Exception(f"{job_result.err()}")
 
+        thread_workers = getattr(queue_config, "thread_workers", False)
+        isolate_jobs = getattr(queue_config, "isolate_jobs", False)
         logger.info(
             f"Handling queue item: id={queue_item.id}, method={queue_item.method} "
             f"args={queue_item.args}, kwargs={queue_item.kwargs} "
-            f"service={queue_item.service}, as_thread={queue_config.thread_workers}"
+            f"service={queue_item.service}, as_thread={thread_workers}, "
+            f"isolated={isolate_jobs}"
         )
 
-        if queue_config.thread_workers:
+        def set_job_pid(pid: int | None) -> None:
+            job_item.job_pid = pid
+            worker.job_stash.set_result(credentials, job_item)
+
+        if thread_workers:
             thread = Thread(
-                target=handle_message_multiprocessing,
-                args=(worker_settings, queue_item, credentials),
+                target=execute_queue_item,
+                args=(worker, queue_item, credentials),
             )
             thread.start()
             thread.join()
-        else:
+        elif isolate_jobs:
             # if psutil.pid_exists(job_item.job_pid):
             #     psutil.Process(job_item.job_pid).terminate()
+            # the job process gets the bytes received from the producer instead of
+            # serializing the item, and its arguments, once more
             process = Process(
                 target=handle_message_multiprocessing,
-                args=(worker_settings, queue_item, credentials),
+                args=(worker_settings, message),
             )
             process.start()
-            job_item.job_pid = process.pid
-            worker.job_stash.set_result(credentials, job_item)
+            set_job_pid(process.pid)
             process.join()
+        else:
+            pool = get_job_worker_pool(worker_settings)
+            pool.run(message, on_start=set_job_pid)
@@ -11,7 +11,6 @@ from ...serde.serializable import serializable
 from ...server.credentials import SyftVerifyKey
 from ...server.worker_settings import WorkerSettings
 from ...store.document_store import BaseStash
-from ...store.document_store import DocumentStore
 from ...store.document_store import PartitionKey
 from ...store.document_store import PartitionSettings
 from ...store.document_store import QueryKeys
@@ -98,15 +97,15 @@ class APIEndpointQueueItem(QueueItem):
 
 
 @instrument
-@serializable()
+@serializable(without=["listeners"])
 class QueueStash(BaseStash):
     object_type = QueueItem
     settings: PartitionSettings = PartitionSettings(
         name=QueueItem.__canonical_name__, object_type=QueueItem
     )
 
-    def __init__(self, store: DocumentStore) -> None:
-        super().__init__(store=store)
+    # listeners are called with the id of every new QueueItem, e.g. to wake up
+    # the producer
 
     def set_result(
         self,
@@ -134,7 +133,10 @@ class QueueStash(BaseStash):
                 valid = self.check_type(item, self.object_type)
                 if valid.is_err():
                     return SyftError(message=valid.err())
-                return super().set(credentials, item, add_permissions)
+                res = super().set(credentials, item, add_permissions)
+                if res.is_ok():
+                    self._notify(item.id)
+                return res
         return item
 
     def get_by_uid(
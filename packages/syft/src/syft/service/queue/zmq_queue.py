@@ -1,22 +1,21 @@
 # stdlib
 from binascii import hexlify
 from collections import defaultdict
-import itertools
+from collections import deque
 import logging
+from queue import Empty
+from queue import Queue
 import socketserver
 import sys
 import threading
 from threading import Event
 import time
-from time import sleep
 from typing import Any
 from typing import cast
 
 # third party
 from pydantic import field_validator
-from result import Result
 import zmq
-from zmq import Frame
 from zmq import LINGER
 from zmq.error import ContextTerminated
 
@@ -45,6 +44,7 @@ from .base_queue import QueueConfig
 from .base_queue import QueueConsumer
 from .base_queue import QueueProducer
 from .queue_stash import ActionQueueItem
+from .queue_stash import QueueItem
 from .queue_stash import QueueStash
 from .queue_stash import Status
 
@@ -57,12 +57,28 @@ THREAD_TIMEOUT_SEC = 30
 # Max duration (in ms) to wait for ZMQ poller to return
 ZMQ_POLLER_TIMEOUT_MSEC = 1000
 
+# Duration (in seconds) between full scans of the QueueStash for CREATED items
+QUEUE_SWEEP_INTERVAL_SEC = 30
+
+# Duration (in seconds) after which items waiting for their inputs are first retried,
+# it doubles with every retry up to QUEUE_RETRY_MAX_INTERVAL_SEC
+QUEUE_RETRY_INTERVAL_SEC = 1
+QUEUE_RETRY_MAX_INTERVAL_SEC = 30
+
+# Duration (in seconds) after which the producer reloads a SyftWorker it has cached,
+# changes made by this server are applied to the cache right away
+SYFT_WORKER_CACHE_TTL_SEC = 60
+
 # Duration (in seconds) after which a worker without a heartbeat will be marked as expired
 WORKER_TIMEOUT_SEC = 60
 
 # Duration (in seconds) after which producer without a heartbeat will be marked as expired
 PRODUCER_TIMEOUT_SEC = 60
 
+# Priority class of queue items without a configured priority, lower classes are
+# dispatched first
+DEFAULT_QUEUE_PRIORITY = 1
+
 # Lock for working on ZMQ socket
 ZMQ_SOCKET_LOCK = threading.Lock()
 
@@ -76,6 +92,12 @@ class QueueMsgProtocol:
     W_REPLY = b"0x03"
     W_HEARTBEAT = b"0x04"
     W_DISCONNECT = b"0x05"
+    # sent by servers without a producer to announce a new QueueItem
+    W_NEW_ITEM = b"0x06"
+    # sent by servers without a producer to announce a resolved Job
+    W_JOB_RESOLVED = b"0x07"
+    # a serialized QueueItem, preceded by a frame with the id of its job
+    W_QUEUE_ITEM = b"0x08"
 
 
 MAX_RECURSION_NESTED_ACTIONOBJECTS = 5
@@ -103,11 +125,95 @@ class Timeout:
         return time.time()
 
 
+class RateMeter:
+    """Counts events, e.g. store reads, over a sliding window of `window_sec`."""
+
+    def __init__(self, window_sec: float = 60.0) -> None:
+        self.window_sec = window_sec
+        self.total = 0
+        self.__events: deque[tuple[float, int]] = deque()
+
+    def add(self, count: int = 1) -> None:
+        self.total += count
+        self.__events.append((time.time(), count))
+
+    def per_sec(self) -> float:
+        horizon = time.time() - self.window_sec
+        while self.__events and self.__events[0][0] < horizon:
+            self.__events.popleft()
+        return sum(count for _, count in self.__events) / self.window_sec
+
+
+class DispatchQueue:
+    """Requests of a worker pool waiting for a worker.
+
+    Requests are dispatched by priority class, lowest first. Within a class the
+    owners of the requests (e.g. users) take turns, so one owner queueing many items
+    does not starve the others. Holds at most `max_depth` requests.
+    """
+
+    def __init__(self, max_depth: int | None = None) -> None:
+        self.max_depth = max_depth
+        # priority -> owner -> requests of that owner
+        self.__requests: dict[int, dict[Any, deque[list[bytes]]]] = {}
+        # priority -> owners with requests, in dispatch order
+        self.__turns: dict[int, deque[Any]] = {}
+        self.__size = 0
+        # requests are added by the producer thread and popped by the socket thread
+        self.__lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self.__size
+
+    def is_full(self) -> bool:
+        return self.max_depth is not None and self.__size >= self.max_depth
+
+    def push(
+        self,
+        msg: list[bytes],
+        owner: Any = None,
+        priority: int = DEFAULT_QUEUE_PRIORITY,
+    ) -> bool:
+        """Returns False if the queue is full."""
+        with self.__lock:
+            if self.is_full():
+                return False
+            owners = self.__requests.setdefault(priority, {})
+            if owner not in owners:
+                owners[owner] = deque()
+                self.__turns.setdefault(priority, deque()).append(owner)
+            owners[owner].append(msg)
+            self.__size += 1
+        return True
+
+    def pop(self) -> list[bytes] | None:
+        with self.__lock:
+            if not self.__turns:
+                return None
+            # only classes with requests are kept, there are a handful at most
+            priority = min(self.__turns)
+            turns = self.__turns[priority]
+            owners = self.__requests[priority]
+            owner = turns.popleft()
+            requests = owners[owner]
+            msg = requests.popleft()
+            if requests:
+                turns.append(owner)
+            else:
+                del owners[owner]
+            if not turns:
+                del self.__turns[priority]
+                del self.__requests[priority]
+            self.__size -= 1
+        return msg
+
+
 class Service:
-    def __init__(self, name: str) -> None:
+    def __init__(self, name: str, max_depth: int | None = None) -> None:
         self.name = name
-        self.requests: list[bytes] = []
-        self.waiting: list[Worker] = []  # List of waiting workers
+        self.requests = DispatchQueue(max_depth=max_depth)
+        # identity -> waiting worker, oldest first
+        self.waiting: dict[bytes, Worker] = {}
 
 
 class Worker(SyftBaseModel):
@@ -133,11 +239,6 @@ class Worker(SyftBaseModel):
     def reset_expiry(self) -> None:
         self.expiry_t.reset()
 
-    def _syft_worker(
-        self, stash: WorkerStash, credentials: SyftVerifyKey
-    ) -> Result[SyftWorker | None, str]:
-        return stash.get_by_uid(credentials=credentials, uid=self.syft_worker_id)
-
     def __str__(self) -> str:
         svc = self.service.name if self.service else None
         return (
@@ -157,15 +258,25 @@ class ZMQProducer(QueueProducer):
         worker_stash: WorkerStash,
         port: int,
         context: AuthedServiceContext,
+        max_queue_depth: int | None = None,
+        priorities: dict[SyftVerifyKey | UID, int] | None = None,
     ) -> None:
         self.id = UID().short()
         self.port = port
+        # max number of requests held per worker pool, None for no limit
+        self.max_queue_depth = max_queue_depth
+        # user verify key or job id -> priority class of its queue items
+        self.priorities = priorities or {}
         self.queue_stash = queue_stash
         self.worker_stash = worker_stash
         self.queue_name = queue_name
         self.auth_context = context
         self._stop = Event()
         self.post_init()
+        if self.queue_stash is not None:
+            self.queue_stash.add_listener(self.notify_new_item)
+        if self.worker_stash is not None:
+            self.worker_stash.add_listener(self.syft_worker_changed)
 
     @property
     def address(self) -> str:
@@ -176,7 +287,8 @@ class ZMQProducer(QueueProducer):
 
         self.services: dict[str, Service] = {}
         self.workers: dict[bytes, Worker] = {}
-        self.waiting: list[Worker] = []
+        # identity -> waiting worker, oldest first
+        self.waiting: dict[bytes, Worker] = {}
         self.heartbeat_t = Timeout(HEARTBEAT_INTERVAL_SEC)
         self.context = zmq.Context(1)
         self.socket = self.context.socket(zmq.ROUTER)
@@ -187,9 +299,27 @@ class ZMQProducer(QueueProducer):
         self.bind(f"tcp://*:{self.port}")
         self.thread: threading.Thread | None = None
         self.producer_thread: threading.Thread | None = None
+        # ids of new QueueItems, pushed by the QueueStash, None once dispatch made
+        # room for held items
+        self.new_items: Queue[UID | None] = Queue()
+        # ids of QueueItems waiting for their inputs or worker pool
+        # -> (time of the next retry, retry interval)
+        self.retry_items: dict[UID, tuple[float, float]] = {}
+        # worker pool name -> ids of QueueItems held back while its requests are
+        # full, oldest first
+        self.held_items: dict[str, deque[UID]] = {}
+        self.held_ids: set[UID] = set()
+        # SyftWorker.id -> (SyftWorker, expiry), kept up to date by the WorkerStash
+        self.syft_workers: dict[UID, tuple[SyftWorker, Timeout]] = {}
+        # reads of the worker stash done by the producer loop
+        self.store_reads = RateMeter()
 
     def close(self) -> None:
         self._stop.set()
+        if self.queue_stash is not None:
+            self.queue_stash.remove_listener(self.notify_new_item)
+        if self.worker_stash is not None:
+            self.worker_stash.remove_listener(self.syft_worker_changed)
         try:
             if self.thread:
                 self.thread.join(THREAD_TIMEOUT_SEC)
@@ -337,89 +467,205 @@ class ZMQProducer(QueueProducer):
             )
         return None
 
+    def notify_new_item(self, uid: UID) -> None:
+        """Called by the QueueStash for every new QueueItem."""
+        self.new_items.put(uid)
+
+    def notify_job_resolved(self, uid: UID) -> None:
+        """Wakes up the job.wait_for calls of this server waiting on uid."""
+        if self.auth_context.server is not None:
+            self.auth_context.server.get_service("jobservice").events.notify(uid)
+
+    def get_service(self, name: str) -> Service:
+        service = self.services.get(name)
+        if service is None:
+            service = Service(name, max_depth=self.max_queue_depth)
+            self.services[name] = service
+        return service
+
+    def get_priority(self, item: QueueItem) -> int:
+        if item.job_id in self.priorities:
+            return self.priorities[item.job_id]
+        return self.priorities.get(item.syft_client_verify_key, DEFAULT_QUEUE_PRIORITY)
+
+    def is_full(self, worker_pool_name: str) -> bool:
+        """Whether the requests of the worker pool reached max_queue_depth."""
+        service = self.services.get(worker_pool_name)
+        return service is not None and service.requests.is_full()
+
+    def queue_item(self, item: QueueItem, held: bool = False) -> bool:
+        """Adds a CREATED item to the requests of its service.
+
+        Returns False if the inputs or the worker pool of the item are not there yet
+        and it should be retried. While the requests of its worker pool are full the
+        item is held back until `dispatch` makes room, `held` is True when a held
+        item gets its turn. Either way the item stays CREATED in the stash.
+        """
+        try:
+            # TODO: if resolving fails, set queueitem to errored, and jobitem as well
+            if isinstance(item, ActionQueueItem):
+                action = item.kwargs["action"]
+                if self.contains_unresolved_action_objects(
+                    action.args
+                ) or self.contains_unresolved_action_objects(action.kwargs):
+                    return False
+
+            worker_pool = item.worker_pool.resolve_with_context(self.auth_context)
+            worker_pool = worker_pool.ok()
+            service_name = worker_pool.name
+            service: Service | None = self.services.get(service_name)
+
+            # Skip adding message if corresponding service/pool
+            # is not registered.
+            if service is None:
+                return False
+
+            # new items line up behind the held ones, and are only serialized once
+            # there is room for them
+            if service.requests.is_full() or (
+                not held and self.held_items.get(service_name)
+            ):
+                self.hold_item(service_name, item.id, first=held)
+                return True
+
+            if isinstance(item, ActionQueueItem):
+                for arg in action.args:
+                    self.preprocess_action_arg(arg)
+                for _, arg in action.kwargs.items():
+                    self.preprocess_action_arg(arg)
+
+            # the job id travels in its own frame, so the consumer can mark its
+            # worker busy without deserializing the item
+            job_id = b"" if item.job_id is None else str(item.job_id).encode()
+            msg = [job_id, serialize(item, to_bytes=True)]
+
+            # add request message to the corresponding service
+            # The requests are processed in dispatch method.
+
+            # TODO: Logic to evaluate the CAN RUN Condition
+            if not service.requests.push(
+                msg,
+                owner=item.syft_client_verify_key,
+                priority=self.get_priority(item),
+            ):
+                self.hold_item(service_name, item.id, first=True)
+                return True
+            item.status = Status.PROCESSING
+            res = self.queue_stash.update(item.syft_client_verify_key, item)
+            if res.is_err():
+                logger.error(f"Failed to update queue item={item} error={res.err()}")
+        except Exception as e:
+            print(e, file=sys.stderr)
+            item.status = Status.ERRORED
+            res = self.queue_stash.update(item.syft_client_verify_key, item)
+            if res.is_err():
+                logger.error(f"Failed to update queue item={item} error={res.err()}")
+        return True
+
+    def hold_item(self, worker_pool_name: str, uid: UID, first: bool = False) -> None:
+        if uid in self.held_ids:
+            return
+        self.held_ids.add(uid)
+        held_items = self.held_items.setdefault(worker_pool_name, deque())
+        if first:
+            held_items.appendleft(uid)
+        else:
+            held_items.append(uid)
+
+    def retry_item(self, uid: UID) -> None:
+        retry = self.retry_items.get(uid)
+        if retry is None:
+            interval = float(QUEUE_RETRY_INTERVAL_SEC)
+        else:
+            interval = min(retry[1] * 2, QUEUE_RETRY_MAX_INTERVAL_SEC)
+        self.retry_items[uid] = (Timeout.now() + interval, interval)
+
+    def queue_item_by_uid(self, uid: UID, held: bool = False) -> None:
+        if not held and uid in self.held_ids:
+            return
+        item = self.queue_stash.get_by_uid(
+            self.queue_stash.partition.root_verify_key, uid
+        ).ok()
+        if item is None or item.status != Status.CREATED or self.queue_item(item, held):
+            self.retry_items.pop(uid, None)
+        else:
+            self.retry_item(uid)
+
+    def queue_held_items(self) -> None:
+        """Queues the held items of every worker pool that has room again."""
+        for worker_pool_name, uids in list(self.held_items.items()):
+            service = self.services.get(worker_pool_name)
+            while uids and service is not None and not service.requests.is_full():
+                uid = uids.popleft()
+                self.held_ids.discard(uid)
+                self.queue_item_by_uid(uid, held=True)
+            if not uids:
+                del self.held_items[worker_pool_name]
+
+    def sweep_items(self) -> None:
+        """Queues every CREATED item of the stash.
+
+        New items are pushed by the QueueStash, this only picks up the ones that were
+        stored without notifying this producer, e.g. before a restart.
+        """
+        items_to_queue = self.queue_stash.get_by_status(
+            self.queue_stash.partition.root_verify_key,
+            status=Status.CREATED,
+        ).ok()
+
+        items_to_queue = [] if items_to_queue is None else items_to_queue
+
+        for item in items_to_queue:
+            # held items get their turn from dispatch, the others back off
+            if item.id in self.held_ids or item.id in self.retry_items:
+                continue
+            if not self.queue_item(item):
+                self.retry_item(item.id)
+
+        # TODO: Evaluate Retry condition for items in the PROCESSING state
+        # If job running and timeout or job status is KILL
+        # or heartbeat fails
+        # or container id doesn't exists, kill process or container
+        # else decrease retry count and mark status as CREATED.
+
     def read_items(self) -> None:
-        while True:
-            if self._stop.is_set():
-                break
+        sweep_t = Timeout(QUEUE_SWEEP_INTERVAL_SEC)
+        retry_t = Timeout(QUEUE_RETRY_INTERVAL_SEC)
+        # pick up the items left over from a previous run
+        self.sweep_items()
+
+        while not self._stop.is_set():
             try:
-                sleep(1)
-
-                # Items to be queued
-                items_to_queue = self.queue_stash.get_by_status(
-                    self.queue_stash.partition.root_verify_key,
-                    status=Status.CREATED,
-                ).ok()
-
-                items_to_queue = [] if items_to_queue is None else items_to_queue
-
-                # Queue Items that are in the processing state
-                items_processing = self.queue_stash.get_by_status(
-                    self.queue_stash.partition.root_verify_key,
-                    status=Status.PROCESSING,
-                ).ok()
-
-                items_processing = [] if items_processing is None else items_processing
-
-                for item in itertools.chain(items_to_queue, items_processing):
-                    # TODO: if resolving fails, set queueitem to errored, and jobitem as well
-                    if item.status == Status.CREATED:
-                        if isinstance(item, ActionQueueItem):
-                            action = item.kwargs["action"]
-                            if self.contains_unresolved_action_objects(
-                                action.args
-                            ) or self.contains_unresolved_action_objects(action.kwargs):
-                                continue
-                            for arg in action.args:
-                                self.preprocess_action_arg(arg)
-                            for _, arg in action.kwargs.items():
-                                self.preprocess_action_arg(arg)
-
-                        msg_bytes = serialize(item, to_bytes=True)
-                        worker_pool = item.worker_pool.resolve_with_context(
-                            self.auth_context
-                        )
-                        worker_pool = worker_pool.ok()
-                        service_name = worker_pool.name
-                        service: Service | None = self.services.get(service_name)
-
-                        # Skip adding message if corresponding service/pool
-                        # is not registered.
-                        if service is None:
-                            continue
-
-                        # append request message to the corresponding service
-                        # This list is processed in dispatch method.
-
-                        # TODO: Logic to evaluate the CAN RUN Condition
-                        service.requests.append(msg_bytes)
-                        item.status = Status.PROCESSING
-                        res = self.queue_stash.update(item.syft_client_verify_key, item)
-                        if res.is_err():
-                            logger.error(
-                                f"Failed to update queue item={item} error={res.err()}"
-                            )
-                    elif item.status == Status.PROCESSING:
-                        # Evaluate Retry condition here
-                        # If job running and timeout or job status is KILL
-                        # or heartbeat fails
-                        # or container id doesn't exists, kill process or container
-                        # else decrease retry count and mark status as CREATED.
-                        pass
+                if sweep_t.has_expired():
+                    self.sweep_items()
+                    sweep_t.reset()
+
+                if self.retry_items and retry_t.has_expired():
+                    now = Timeout.now()
+                    for retry_uid, (retry_ts, _) in list(self.retry_items.items()):
+                        if retry_ts <= now:
+                            self.queue_item_by_uid(retry_uid)
+                    retry_t.reset()
+
+                try:
+                    uid = self.new_items.get(timeout=QUEUE_RETRY_INTERVAL_SEC)
+                except Empty:
+                    continue
+                if uid is None:
+                    self.queue_held_items()
+                else:
+                    self.queue_item_by_uid(uid)
             except Exception as e:
-                print(e, file=sys.stderr)
-                item.status = Status.ERRORED
-                res = self.queue_stash.update(item.syft_client_verify_key, item)
-                if res.is_err():
-                    logger.error(
-                        f"Failed to update queue item={item} error={res.err()}"
-                    )
+                logger.exception("ZMQProducer failed to read queue items", exc_info=e)
 
     def run(self) -> None:
         self.thread = threading.Thread(target=self._run)
         self.thread.start()
 
-        self.producer_thread = threading.Thread(target=self.read_items)
-        self.producer_thread.start()
+        # a producer without a queue stash only dispatches the messages it is sent
+        if self.queue_stash is not None:
+            self.producer_thread = threading.Thread(target=self.read_items)
+            self.producer_thread.start()
 
     def send(self, worker: bytes, message: bytes | list[bytes]) -> None:
         worker_obj = self.require_worker(worker)
@@ -433,9 +679,37 @@ class ZMQProducer(QueueProducer):
     def send_heartbeats(self) -> None:
         """Send heartbeats to idle workers if it's time"""
         if self.heartbeat_t.has_expired():
-            for worker in self.waiting:
+            for worker in list(self.waiting.values()):
                 self.send_to_worker(worker, QueueMsgProtocol.W_HEARTBEAT)
             self.heartbeat_t.reset()
+            logger.debug(
+                f"ZMQProducer {self.queue_name} worker store reads/s: "
+                f"{self.store_reads.per_sec():.2f}"
+            )
+
+    def syft_worker_changed(self, uid: UID, syft_worker: SyftWorker | None) -> None:
+        """Called by the WorkerStash for every updated or deleted SyftWorker."""
+        if syft_worker is None:
+            self.syft_workers.pop(uid, None)
+        else:
+            self.syft_workers[uid] = (syft_worker, Timeout(SYFT_WORKER_CACHE_TTL_SEC))
+
+    def get_syft_worker(self, uid: UID | None) -> SyftWorker | None:
+        """Returns the SyftWorker with uid, only reading the store on a cache miss."""
+        if uid is None:
+            return None
+
+        cached = self.syft_workers.get(uid)
+        if cached is not None and not cached[1].has_expired():
+            return cached[0]
+
+        self.store_reads.add()
+        res = self.worker_stash.get_by_uid(
+            credentials=self.worker_stash.partition.root_verify_key, uid=uid
+        )
+        syft_worker = res.ok() if res.is_ok() else None
+        self.syft_worker_changed(uid, syft_worker)
+        return syft_worker
 
     def purge_workers(self) -> None:
         """Look for & kill expired workers.
@@ -443,9 +717,9 @@ class ZMQProducer(QueueProducer):
         Workers are oldest to most recent, so we stop at the first alive worker.
         """
         # work on a copy of the iterator
-        for worker in self.waiting:
-            res = worker._syft_worker(self.worker_stash, self.auth_context.credentials)
-            if res.is_err() or (syft_worker := res.ok()) is None:
+        for worker in list(self.waiting.values()):
+            syft_worker = self.get_syft_worker(worker.syft_worker_id)
+            if syft_worker is None:
                 logger.info(f"Failed to retrieve SyftWorker {worker.syft_worker_id}")
                 continue
 
@@ -472,13 +746,11 @@ class ZMQProducer(QueueProducer):
 
         try:
             # Check if worker is present in the database
-            worker = self.worker_stash.get_by_uid(
-                credentials=self.worker_stash.partition.root_verify_key,
-                uid=syft_worker_id,
-            )
-            if worker.is_ok() and worker.ok() is None:
+            syft_worker = self.get_syft_worker(syft_worker_id)
+            if syft_worker is None or syft_worker.consumer_state == consumer_state:
                 return
 
+            self.store_reads.add()
             res = self.worker_stash.update_consumer_state(
                 credentials=self.worker_stash.partition.root_verify_key,
                 worker_uid=syft_worker_id,
@@ -498,26 +770,37 @@ class ZMQProducer(QueueProducer):
     def worker_waiting(self, worker: Worker) -> None:
         """This worker is now waiting for work."""
         # Queue to broker and service waiting lists
-        if worker not in self.waiting:
-            self.waiting.append(worker)
-        if worker.service is not None and worker not in worker.service.waiting:
-            worker.service.waiting.append(worker)
+        self.waiting.setdefault(worker.identity, worker)
+        if worker.service is not None:
+            worker.service.waiting.setdefault(worker.identity, worker)
         worker.reset_expiry()
         self.update_consumer_state_for_worker(worker.syft_worker_id, ConsumerState.IDLE)
         self.dispatch(worker.service, None)
 
-    def dispatch(self, service: Service, msg: bytes) -> None:
+    def dispatch(self, service: Service, msg: list[bytes] | None) -> None:
         """Dispatch requests to waiting workers as possible"""
         if msg is not None:  # Queue message if any
-            service.requests.append(msg)
+            service.requests.push(msg)
 
         self.purge_workers()
+        dispatched = False
         while service.waiting and service.requests:
             # One worker consuming only one message at a time.
-            msg = service.requests.pop(0)
-            worker = service.waiting.pop(0)
-            self.waiting.remove(worker)
-            self.send_to_worker(worker, QueueMsgProtocol.W_REQUEST, msg)
+            msg = service.requests.pop()
+            if msg is None:
+                break
+            dispatched = True
+            identity = next(iter(service.waiting))
+            worker = service.waiting.pop(identity)
+            self.waiting.pop(identity, None)
+            self.send_to_worker(worker, QueueMsgProtocol.W_QUEUE_ITEM, msg)
+            # the consumer updates its own state, which may not reach this server
+            if worker.syft_worker_id is not None:
+                self.syft_workers.pop(worker.syft_worker_id, None)
+
+        # the producer thread queues the items held back while the requests were full
+        if dispatched and self.held_ids:
+            self.new_items.put(None)
 
     def send_to_worker(
         self,
@@ -604,6 +887,15 @@ class ZMQProducer(QueueProducer):
         return worker
 
     def process_worker(self, address: bytes, command: bytes, data: list[bytes]) -> None:
+        if QueueMsgProtocol.W_NEW_ITEM == command:
+            # not a worker, see ZMQQueueNotifier
+            self.notify_new_item(UID(data.pop(0).decode()))
+            return
+        if QueueMsgProtocol.W_JOB_RESOLVED == command:
+            # not a worker, see ZMQQueueNotifier
+            self.notify_job_resolved(UID(data.pop(0).decode()))
+            return
+
         worker_ready = hexlify(address) in self.workers
         worker = self.require_worker(address)
 
@@ -618,13 +910,7 @@ class ZMQProducer(QueueProducer):
                 self.delete_worker(worker, True)
             else:
                 # Attach worker to service and mark as idle
-                if service_name in self.services:
-                    service: Service | None = self.services.get(service_name)
-                else:
-                    service = Service(service_name)
-                    self.services[service_name] = service
-                if service is not None:
-                    worker.service = service
+                worker.service = self.get_service(service_name)
                 logger.info(f"New worker: {worker}")
                 worker.syft_worker_id = UID(syft_worker_id)
                 self.worker_waiting(worker)
@@ -649,11 +935,10 @@ class ZMQProducer(QueueProducer):
         if disconnect:
             self.send_to_worker(worker, QueueMsgProtocol.W_DISCONNECT)
 
-        if worker.service and worker in worker.service.waiting:
-            worker.service.waiting.remove(worker)
+        if worker.service:
+            worker.service.waiting.pop(worker.identity, None)
 
-        if worker in self.waiting:
-            self.waiting.remove(worker)
+        self.waiting.pop(worker.identity, None)
 
         self.workers.pop(worker.identity, None)
 
@@ -808,11 +1093,27 @@ class ZMQConsumer(QueueConsumer):
                         # log everything except the last frame which contains serialized data
                         logger.info(f"ZMQConsumer recv: {msg[:-4]}")
 
-                    if command == QueueMsgProtocol.W_REQUEST:
-                        # Call Message Handler
+                    if command == QueueMsgProtocol.W_QUEUE_ITEM:
+                        try:
+                            job_id, message = data[-2:]
+                            self.associate_job(job_id)
+                            # deserialized once, the handler gets the QueueItem and
+                            # the bytes to forward to other processes
+                            queue_item = _deserialize(message, from_bytes=True)
+                            self.message_handler.handle_queue_item(
+                                queue_item=queue_item,
+                                message=message,
+                                syft_worker_id=self.syft_worker_id,
+                            )
+                        except Exception as e:
+                            logger.exception("Couldn't handle message", exc_info=e)
+                        finally:
+                            self.clear_job()
+                    elif command == QueueMsgProtocol.W_REQUEST:
+                        # sent by producers without W_QUEUE_ITEM, and by `send`
                         try:
                             message = data.pop()
-                            self.associate_job(message)
+                            self.associate_job_of(message)
                             self.message_handler.handle_message(
                                 message=message,
                                 syft_worker_id=self.syft_worker_id,
@@ -860,7 +1161,13 @@ class ZMQConsumer(QueueConsumer):
         self.thread = threading.Thread(target=self._run)
         self.thread.start()
 
-    def associate_job(self, message: Frame) -> None:
+    def associate_job(self, job_id: bytes) -> None:
+        try:
+            self._set_worker_job(UID(job_id.decode()) if job_id else None)
+        except Exception as e:
+            logger.exception("Could not associate job", exc_info=e)
+
+    def associate_job_of(self, message: bytes) -> None:
         try:
             queue_item = _deserialize(message, from_bytes=True)
             self._set_worker_job(queue_item.job_id)
@@ -890,6 +1197,43 @@ class ZMQConsumer(QueueConsumer):
         return not self.socket.closed and self.is_producer_alive()
 
 
+class ZMQQueueNotifier:
+    """Announces new QueueItems and resolved Jobs to the producer of another process.
+
+    Used by servers without a producer, e.g. job workers queueing subjobs, so the
+    producer does not have to wait for its next sweep of the QueueStash, and
+    job.wait_for calls on the server of the producer return right away.
+    """
+
+    def __init__(self, address: str) -> None:
+        self.address = address
+        self.context = zmq.Context()
+        self.socket = self.context.socket(zmq.DEALER)
+        self.socket.linger = 0
+        self.socket.connect(address)
+        self.lock = threading.Lock()
+
+    def notify(self, uid: UID) -> None:
+        self._send(QueueMsgProtocol.W_NEW_ITEM, uid)
+
+    def notify_job_resolved(self, uid: UID) -> None:
+        self._send(QueueMsgProtocol.W_JOB_RESOLVED, uid)
+
+    def _send(self, command: bytes, uid: UID) -> None:
+        # ZMQQueueNotifier send frames: [empty, header, command, uid]
+        msg = [b"", QueueMsgProtocol.W_WORKER, command, str(uid).encode()]
+        with self.lock:
+            try:
+                self.socket.send_multipart(msg, flags=zmq.NOBLOCK)
+            except zmq.ZMQError as e:
+                # the sweep of the producer picks up the item anyway
+                logger.warning(f"Failed to notify producer at {self.address}: {e}")
+
+    def close(self) -> None:
+        self.socket.close()
+        self.context.destroy()
+
+
 @serializable()
 class ZMQClientConfig(SyftObject, QueueClientConfig):
     __canonical_name__ = "ZMQClientConfig"
@@ -932,6 +1276,8 @@ class ZMQClient(QueueClient):
         queue_stash: QueueStash | None = None,
         worker_stash: WorkerStash | None = None,
         context: AuthedServiceContext | None = None,
+        max_queue_depth: int | None = None,
+        priorities: dict[SyftVerifyKey | UID, int] | None = None,
     ) -> ZMQProducer:
         """Add a producer of a queue.
 
@@ -951,6 +1297,8 @@ class ZMQClient(QueueClient):
             port=port,
             context=context,
             worker_stash=worker_stash,
+            max_queue_depth=max_queue_depth,
+            priorities=priorities,
         )
         self.producers[queue_name] = producer
         return producer
@@ -1051,7 +1399,16 @@ class ZMQQueueConfig(QueueConfig):
         client_type: type[ZMQClient] | None = None,
         client_config: ZMQClientConfig | None = None,
         thread_workers: bool = False,
+        isolate_jobs: bool = False,
+        max_queue_depth: int | None = None,
+        priorities: dict[SyftVerifyKey | UID, int] | None = None,
     ):
         self.client_type = client_type or ZMQClient
         self.client_config: ZMQClientConfig = client_config or ZMQClientConfig()
         self.thread_workers = thread_workers
+        # run every job in a new process instead of the warm JobWorkerPool
+        self.isolate_jobs = isolate_jobs
+        # requests held in memory per worker pool before new items are rejected
+        self.max_queue_depth = max_queue_depth
+        # user verify key or job id -> priority class, lower is dispatched first
+        self.priorities = priorities
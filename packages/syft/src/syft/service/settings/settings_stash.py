@@ -7,12 +7,12 @@ from result import Result
 from ...serde.serializable import serializable
 from ...server.credentials import SyftVerifyKey
 from ...store.document_store import BaseUIDStoreStash
-from ...store.document_store import DocumentStore
 from ...store.document_store import PartitionKey
 from ...store.document_store import PartitionSettings
 from ...types.uid import UID
 from ...util.telemetry import instrument
 from ..action.action_permissions import ActionObjectPermission
+from ..response import SyftSuccess
 from .settings import ServerSettings
 
 NamePartitionKey = PartitionKey(key="name", type_=str)
@@ -20,15 +20,15 @@ ActionIDsPartitionKey = PartitionKey(key="action_ids", type_=list[UID])
 
 
 @instrument
-@serializable()
+@serializable(without=["listeners"])
 class SettingsStash(BaseUIDStoreStash):
     object_type = ServerSettings
     settings: PartitionSettings = PartitionSettings(
         name=ServerSettings.__canonical_name__, object_type=ServerSettings
     )
 
-    def __init__(self, store: DocumentStore) -> None:
-        super().__init__(store=store)
+    # listeners are called with the stored ServerSettings after every write, None
+    # on delete
 
     def set(
         self,
@@ -42,7 +42,10 @@ class SettingsStash(BaseUIDStoreStash):
         # we dont use and_then logic here as it is hard because of the order of the arguments
         if res.is_err():
             return res
-        return super().set(credentials=credentials, obj=res.ok())
+        result = super().set(credentials=credentials, obj=res.ok())
+        if result.is_ok():
+            self._notify(result.ok())
+        return result
 
     def update(
         self,
@@ -54,4 +57,15 @@ class SettingsStash(BaseUIDStoreStash):
         # we dont use and_then logic here as it is hard because of the order of the arguments
         if res.is_err():
             return res
-        return super().update(credentials=credentials, obj=res.ok())
+        result = super().update(credentials=credentials, obj=res.ok())
+        if result.is_ok():
+            self._notify(result.ok())
+        return result
+
+    def delete_by_uid(
+        self, credentials: SyftVerifyKey, uid: UID
+    ) -> Result[SyftSuccess, str]:
+        result = super().delete_by_uid(credentials=credentials, uid=uid)
+        if result.is_ok():
+            self._notify(None)
+        return result
@@ -1,4 +1,8 @@
 # stdlib
+import threading
+
+# third party
+from cachetools import TTLCache
 
 # relative
 from ...abstract_server import ServerType
@@ -26,7 +30,6 @@ from ..service import AbstractService
 from ..service import SERVICE_TO_TYPES
 from ..service import TYPE_TO_SERVICE
 from ..service import service_method
-from ..settings.settings_stash import SettingsStash
 from .user import User
 from .user import UserCreate
 from .user import UserPrivateKey
@@ -44,9 +47,16 @@ from .user_roles import ServiceRole
 from .user_roles import ServiceRoleCapability
 from .user_stash import UserStash
 
+# Number of users whose role is kept in memory by the UserService
+ROLE_CACHE_SIZE = 1024
+
+# Duration (in seconds) after which a cached role is read again, changes made
+# through this server's UserStash are applied to the cache right away
+ROLE_CACHE_TTL_SEC = 30
+
 
 @instrument
-@serializable()
+@serializable(without=["role_cache", "role_cache_lock"])
 class UserService(AbstractService):
     store: DocumentStore
     stash: UserStash
@@ -54,6 +64,26 @@ class UserService(AbstractService):
     def __init__(self, store: DocumentStore) -> None:
         self.store = store
         self.stash = UserStash(store=store)
+        # verify key -> (User.id or None for unknown keys, role)
+        self.role_cache: TTLCache = TTLCache(
+            maxsize=ROLE_CACHE_SIZE, ttl=ROLE_CACHE_TTL_SEC
+        )
+        self.role_cache_lock = threading.Lock()
+        # bumped on every invalidation, so a lookup that raced with one is not cached
+        self.role_cache_generation = 0
+        self.role_cache_hits = 0
+        self.role_cache_misses = 0
+        self.stash.add_listener(self.user_changed)
+
+    def user_changed(self, uid: UID, user: User | None) -> None:
+        """Called by the UserStash for every stored or deleted User."""
+        with self.role_cache_lock:
+            self.role_cache_generation += 1
+            if user is None:
+                # only the id of a deleted user is known
+                self.role_cache.clear()
+            else:
+                self.role_cache.pop(user.verify_key, None)
 
     @service_method(path="user.create", name="create")
     def create(
@@ -153,6 +183,19 @@ class UserService(AbstractService):
     def get_role_for_credentials(
         self, credentials: SyftVerifyKey | SyftSigningKey
     ) -> ServiceRole | None | SyftError:
+        verify_key = (
+            credentials
+            if isinstance(credentials, SyftVerifyKey)
+            else credentials.verify_key
+        )
+        with self.role_cache_lock:
+            cached = self.role_cache.get(verify_key)
+            if cached is not None:
+                self.role_cache_hits += 1
+                return cached[1]
+            self.role_cache_misses += 1
+            generation = self.role_cache_generation
+
         # they could be different
         if isinstance(credentials, SyftVerifyKey):
             result = self.stash.get_by_verify_key(
@@ -162,12 +205,16 @@ class UserService(AbstractService):
             result = self.stash.get_by_signing_key(
                 credentials=credentials, signing_key=credentials
             )
-        if result.is_ok():
-            # this seems weird that we get back None as Ok(None)
-            user = result.ok()
-            if user:
-                return user.role
-        return ServiceRole.GUEST
+        if result.is_err():
+            return ServiceRole.GUEST
+
+        # this seems weird that we get back None as Ok(None)
+        user = result.ok()
+        role = user.role if user else ServiceRole.GUEST
+        with self.role_cache_lock:
+            if generation == self.role_cache_generation:
+                self.role_cache[verify_key] = (user.id if user else None, role)
+        return role
 
     @service_method(path="user.search", name="search", autosplat=["user_search"])
     def search(
@@ -354,7 +401,7 @@ class UserService(AbstractService):
 
         user = result.ok()
         if user.role == ServiceRole.ADMIN:
-            settings_stash = SettingsStash(store=self.store)
+            settings_stash = context.server.settings_stash
             settings = settings_stash.get_all(context.credentials)
             if settings.is_ok() and len(settings.ok()) > 0:
                 settings_data = settings.ok()[0]
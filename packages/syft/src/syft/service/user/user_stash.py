@@ -9,7 +9,6 @@ from ...serde.serializable import serializable
 from ...server.credentials import SyftSigningKey
 from ...server.credentials import SyftVerifyKey
 from ...store.document_store import BaseStash
-from ...store.document_store import DocumentStore
 from ...store.document_store import PartitionKey
 from ...store.document_store import PartitionSettings
 from ...store.document_store import QueryKeys
@@ -29,7 +28,7 @@ VerifyKeyPartitionKey = PartitionKey(key="verify_key", type_=SyftVerifyKey)
 
 
 @instrument
-@serializable()
+@serializable(without=["listeners"])
 class UserStash(BaseStash):
     object_type = User
     settings: PartitionSettings = PartitionSettings(
@@ -37,8 +36,8 @@ class UserStash(BaseStash):
         object_type=User,
     )
 
-    def __init__(self, store: DocumentStore) -> None:
-        super().__init__(store=store)
+    # listeners are called with (User.id, User) for every stored User, and
+    # (User.id, None) on delete
 
     def set(
         self,
@@ -52,13 +51,16 @@ class UserStash(BaseStash):
         # we dont use and_then logic here as it is hard because of the order of the arguments
         if res.is_err():
             return res
-        return super().set(
+        result = super().set(
             credentials=credentials,
             obj=res.ok(),
             add_permissions=add_permissions,
             ignore_duplicates=ignore_duplicates,
             add_storage_permission=add_storage_permission,
         )
+        if result.is_ok():
+            self._notify(user.id, result.ok())
+        return result
 
     def admin_verify_key(self) -> Result[SyftVerifyKey | None, str]:
         return Ok(self.partition.root_verify_key)
@@ -117,6 +119,7 @@ class UserStash(BaseStash):
             credentials=credentials, qk=qk, has_permission=has_permission
         )
         if result.is_ok():
+            self._notify(uid, None)
             return Ok(SyftSuccess(message=f"ID: {uid} deleted"))
         return result
 
@@ -127,6 +130,9 @@ class UserStash(BaseStash):
         # we dont use and_then logic here as it is hard because of the order of the arguments
         if res.is_err():
             return res
-        return super().update(
+        result = super().update(
             credentials=credentials, obj=res.ok(), has_permission=has_permission
         )
+        if result.is_ok():
+            self._notify(user.id, result.ok())
+        return result
@@ -9,7 +9,6 @@ from result import Result
 from ...serde.serializable import serializable
 from ...server.credentials import SyftVerifyKey
 from ...store.document_store import BaseUIDStoreStash
-from ...store.document_store import DocumentStore
 from ...store.document_store import PartitionKey
 from ...store.document_store import PartitionSettings
 from ...store.document_store import QueryKeys
@@ -17,6 +16,7 @@ from ...types.uid import UID
 from ...util.telemetry import instrument
 from ..action.action_permissions import ActionObjectPermission
 from ..action.action_permissions import ActionPermission
+from ..response import SyftSuccess
 from .worker_pool import ConsumerState
 from .worker_pool import SyftWorker
 
@@ -24,15 +24,15 @@ WorkerContainerNamePartitionKey = PartitionKey(key="container_name", type_=str)
 
 
 @instrument
-@serializable()
+@serializable(without=["listeners"])
 class WorkerStash(BaseUIDStoreStash):
     object_type = SyftWorker
     settings: PartitionSettings = PartitionSettings(
         name=SyftWorker.__canonical_name__, object_type=SyftWorker
     )
 
-    def __init__(self, store: DocumentStore) -> None:
-        super().__init__(store=store)
+    # listeners are called with the id and new state of every updated SyftWorker,
+    # the state is None once it is deleted
 
     def set(
         self,
@@ -55,6 +55,25 @@ class WorkerStash(BaseUIDStoreStash):
             add_storage_permission=add_storage_permission,
         )
 
+    def update(
+        self,
+        credentials: SyftVerifyKey,
+        obj: SyftWorker,
+        has_permission: bool = False,
+    ) -> Result[SyftWorker, str]:
+        res = super().update(credentials, obj, has_permission=has_permission)
+        if res.is_ok():
+            self._notify(obj.id, res.ok())
+        return res
+
+    def delete_by_uid(
+        self, credentials: SyftVerifyKey, uid: UID
+    ) -> Result[SyftSuccess, str]:
+        res = super().delete_by_uid(credentials=credentials, uid=uid)
+        if res.is_ok():
+            self._notify(uid, None)
+        return res
+
     def get_worker_by_name(
         self, credentials: SyftVerifyKey, worker_name: str
     ) -> Result[SyftWorker | None, str]:
@@ -41,13 +41,20 @@ Read/retrieve SyftObject from blob storage
 """
 
 # stdlib
+import asyncio
+from collections import deque
 from collections.abc import Callable
 from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
+import itertools
 import logging
+import os
 from typing import Any
+from typing import BinaryIO
 
 # third party
+import httpx
 from pydantic import BaseModel
 import requests
 from typing_extensions import Self
@@ -80,6 +87,16 @@ logger = logging.getLogger(__name__)
 DEFAULT_TIMEOUT = 10
 MAX_RETRIES = 20
 
+# number of parts of a blob that are uploaded or downloaded at the same time
+MAX_TRANSFER_WORKERS: int = int(os.getenv("SYFT_BLOB_TRANSFER_WORKERS", 4))
+
+
+def range_bounds(offset: int, length: int | None, size: int) -> tuple[int, int]:
+    """Returns the [start, end) bytes of a blob of size that read_range reads."""
+    start = max(size + offset, 0) if offset < 0 else min(offset, size)
+    end = size if length is None else min(start + length, size)
+    return start, end
+
 
 @serializable()
 class BlobRetrieval(SyftObject):
@@ -91,6 +108,18 @@ class BlobRetrieval(SyftObject):
     syft_blob_storage_entry_id: UID | None = None
     file_size: int | None = None
 
+    @property
+    def supports_range_reads(self) -> bool:
+        """Whether read_range reads only the requested bytes."""
+        return False
+
+    def read_range(self, offset: int, length: int | None = None) -> bytes:
+        """Reads length bytes from offset, or the bytes up to the end of the blob.
+
+        A negative offset counts from the end of the blob.
+        """
+        raise NotImplementedError
+
 
 @serializable()
 class SyftObjectRetrieval(BlobRetrieval):
@@ -117,21 +146,41 @@ class SyftObjectRetrieval(BlobRetrieval):
     def read(self, _deserialize: bool = True) -> SyftObject | SyftError:
         return self._read_data(_deserialize=_deserialize)
 
+    async def read_async(self) -> SyftObject | SyftError:
+        return self.read()
+
+    @property
+    def supports_range_reads(self) -> bool:
+        return True
+
+    def read_range(self, offset: int, length: int | None = None) -> bytes:
+        start, end = range_bounds(offset, length, len(self.syft_object))
+        return self.syft_object[start:end]
+
 
 def syft_iter_content(
     blob_url: str | ServerURL,
     chunk_size: int,
     max_retries: int = MAX_RETRIES,
     timeout: int = DEFAULT_TIMEOUT,
+    start: int = 0,
+    end: int | None = None,
 ) -> Generator:
-    """Custom iter content with smart retries (start from last byte read)"""
-    current_byte = 0
+    """Custom iter content with smart retries (start from last byte read)
+
+    Only the bytes [start, end) are read when a range is given.
+    """
+    current_byte = start
+    range_end = "" if end is None else str(end - 1)
     for attempt in range(max_retries):
-        headers = {"Range": f"bytes={current_byte}-"}
+        headers = {"Range": f"bytes={current_byte}-{range_end}"}
         try:
             with requests.get(
                 str(blob_url), stream=True, headers=headers, timeout=(timeout, timeout)
             ) as response:
+                if response.status_code == 416:
+                    # the range starts at the end of the blob, nothing left to read
+                    return
                 response.raise_for_status()
                 for chunk in response.iter_content(
                     chunk_size=chunk_size, decode_unicode=False
@@ -140,7 +189,12 @@ def syft_iter_content(
                     yield chunk
             return  # If successful, exit the function
         except requests.exceptions.RequestException as e:
-            if attempt < max_retries:
+            client_error = (
+                isinstance(e, requests.exceptions.HTTPError)
+                and e.response is not None
+                and e.response.status_code < 500
+            )
+            if attempt < max_retries - 1 and not client_error:
                 logger.debug(
                     f"Attempt {attempt}/{max_retries} failed: {e} at byte {current_byte}. Retrying..."
                 )
@@ -149,6 +203,38 @@ def syft_iter_content(
                 raise
 
 
+def syft_iter_content_parallel(
+    blob_url: str | ServerURL,
+    chunk_size: int,
+    file_size: int,
+    max_workers: int = MAX_TRANSFER_WORKERS,
+) -> Generator:
+    """Downloads consecutive ranges of a blob concurrently and yields them in order.
+
+    At most max_workers ranges of at least DEFAULT_CHUNK_SIZE bytes are held in
+    memory, each one retried from its last byte read by syft_iter_content.
+    """
+    part_size = max(chunk_size, DEFAULT_CHUNK_SIZE)
+
+    def fetch(start: int) -> bytes:
+        end = min(start + part_size, file_size)
+        return b"".join(syft_iter_content(blob_url, chunk_size, start=start, end=end))
+
+    starts = iter(range(0, file_size, part_size))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque(
+            executor.submit(fetch, start)
+            for start in itertools.islice(starts, max_workers)
+        )
+        while pending:
+            part = pending.popleft().result()
+            next_start = next(starts, None)
+            if next_start is not None:
+                pending.append(executor.submit(fetch, next_start))
+            for offset in range(0, len(part), chunk_size):
+                yield part[offset : offset + chunk_size]
+
+
 @serializable()
 class BlobRetrievalByURLV4(BlobRetrieval):
     __canonical_name__ = "BlobRetrievalByURL"
@@ -177,13 +263,41 @@ class BlobRetrievalByURL(BlobRetrieval):
         else:
             return self._read_data()
 
-    def _read_data(
-        self,
-        stream: bool = False,
-        chunk_size: int = DEFAULT_CHUNK_SIZE,
-        *args: Any,
-        **kwargs: Any,
-    ) -> Any:
+    async def read_async(self) -> SyftObject | SyftError:
+        """Async counterpart of `read`.
+
+        The blob is downloaded through the AsyncHTTPConnection of the api the
+        retrieval belongs to. Without one, it is read in a worker thread.
+        """
+        # relative
+        from ...client.api import APIRegistry
+        from .on_disk import local_blob_path
+
+        if self.type_ is BlobFileType:
+            return self.read()
+
+        api = APIRegistry.api_for(
+            server_uid=self.syft_server_location,
+            user_verify_key=self.syft_client_verify_key,
+        )
+        async_connection = None if api is None else api.async_connection
+        if (
+            async_connection is None
+            or local_blob_path(self.url, self.syft_server_location) is not None
+        ):
+            return await asyncio.to_thread(self.read)
+
+        try:
+            response = await async_connection.client.get(str(self._resolve_url()))
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            return SyftError(message=f"Failed to retrieve with error: {e}")
+
+        if self.type_ is not None and issubclass(self.type_, BlobFileType):
+            return response.content
+        return deserialize(response.content, from_bytes=True)
+
+    def _resolve_url(self) -> str | ServerURL:
         # relative
         from ...client.api import APIRegistry
 
@@ -194,27 +308,104 @@ class BlobRetrievalByURL(BlobRetrieval):
 
         if api and api.connection and isinstance(self.url, ServerURL):
             if self.proxy_server_uid is None:
-                blob_url = api.connection.to_blob_route(
+                return api.connection.to_blob_route(
                     self.url.url_path, host=self.url.host_or_ip
                 )
-            else:
-                blob_url = api.connection.stream_via(
-                    self.proxy_server_uid, self.url.url_path
-                )
-                stream = True
-        else:
-            blob_url = self.url
+            return api.connection.stream_via(self.proxy_server_uid, self.url.url_path)
+        return self.url
 
-        try:
-            is_blob_file = self.type_ is not None and issubclass(
-                self.type_, BlobFileType
+    @property
+    def supports_range_reads(self) -> bool:
+        # the proxy stream route does not forward Range headers
+        return self.proxy_server_uid is None
+
+    def read_range(self, offset: int, length: int | None = None) -> bytes:
+        # relative
+        from .on_disk import iter_file_range
+        from .on_disk import local_blob_path
+
+        if length == 0:
+            return b""
+
+        local_path = local_blob_path(self.url, self.syft_server_location)
+        if local_path is not None:
+            start, end = range_bounds(offset, length, local_path.stat().st_size)
+            return b"".join(iter_file_range(local_path, start, end))
+
+        blob_url = self._resolve_url()
+        if not self.supports_range_reads:
+            content = b"".join(syft_iter_content(blob_url, DEFAULT_CHUNK_SIZE))
+            start, end = range_bounds(offset, length, len(content))
+            return content[start:end]
+
+        if offset < 0:
+            # suffix range, the last -offset bytes
+            response = requests.get(
+                str(blob_url),
+                headers={"Range": f"bytes={offset}"},
+                timeout=(DEFAULT_TIMEOUT, DEFAULT_TIMEOUT),
             )
+            response.raise_for_status()
+            return response.content[:length]
+
+        range_end = None if length is None else offset + length
+        return b"".join(
+            syft_iter_content(blob_url, DEFAULT_CHUNK_SIZE, start=offset, end=range_end)
+        )
+
+    def _read_data(
+        self,
+        stream: bool = False,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_workers: int = MAX_TRANSFER_WORKERS,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        # relative
+        from .on_disk import iter_file_range
+        from .on_disk import local_blob_path
+
+        is_blob_file = self.type_ is not None and issubclass(self.type_, BlobFileType)
+
+        # on-disk blob on a filesystem we share with the server
+        local_path = local_blob_path(self.url, self.syft_server_location)
+        if local_path is not None:
             if is_blob_file and stream:
+                return iter_file_range(local_path, chunk_size=chunk_size)
+            data = local_path.read_bytes()
+            return data if is_blob_file else deserialize(data, from_bytes=True)
+
+        blob_url = self._resolve_url()
+        if self.proxy_server_uid is not None:
+            stream = True
+
+        # large blobs are downloaded in ranges over several connections, which
+        # the proxy stream route does not support
+        file_size = self.file_size or 0
+        parallel = (
+            self.proxy_server_uid is None
+            and max_workers > 1
+            and file_size > DEFAULT_CHUNK_SIZE
+        )
+
+        try:
+            if is_blob_file and stream:
+                if parallel:
+                    return syft_iter_content_parallel(
+                        blob_url, chunk_size, file_size, max_workers
+                    )
                 return syft_iter_content(blob_url, chunk_size)
 
-            response = requests.get(str(blob_url), stream=stream)  # nosec
-            resp_content = response.content
-            response.raise_for_status()
+            if parallel:
+                resp_content = b"".join(
+                    syft_iter_content_parallel(
+                        blob_url, DEFAULT_CHUNK_SIZE, file_size, max_workers
+                    )
+                )
+            else:
+                response = requests.get(str(blob_url), stream=stream)  # nosec
+                resp_content = response.content
+                response.raise_for_status()
 
             return (
                 resp_content
@@ -235,6 +426,10 @@ class BlobDeposit(SyftObject):
     def write(self, data: BytesIO) -> SyftSuccess | SyftError:
         raise NotImplementedError
 
+    async def write_async(self, data: BinaryIO) -> SyftSuccess | SyftError:
+        """Async counterpart of `write`, for apis logged in with `login_async`."""
+        raise NotImplementedError
+
 
 @serializable()
 class BlobStorageClientConfig(BaseModel):
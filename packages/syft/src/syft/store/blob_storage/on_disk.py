@@ -1,7 +1,19 @@
 # stdlib
+from collections.abc import Callable
+from collections.abc import Generator
+import hashlib
+import hmac
+import inspect
 from io import BytesIO
+import mmap
+import os
 from pathlib import Path
+import secrets
+import time
 from typing import Any
+from typing import BinaryIO
+from urllib.parse import parse_qs
+from urllib.parse import urlencode
 
 # third party
 from typing_extensions import Self
@@ -9,18 +21,159 @@ from typing_extensions import Self
 # relative
 from . import BlobDeposit
 from . import BlobRetrieval
+from . import BlobRetrievalByURL
 from . import BlobStorageClient
 from . import BlobStorageClientConfig
 from . import BlobStorageConfig
 from . import BlobStorageConnection
-from . import SyftObjectRetrieval
 from ...serde.serializable import serializable
 from ...service.response import SyftError
 from ...service.response import SyftSuccess
 from ...types.blob_storage import BlobStorageEntry
 from ...types.blob_storage import CreateBlobStorageEntry
+from ...types.blob_storage import DEFAULT_CHUNK_SIZE
+from ...types.blob_storage import READ_EXPIRATION_TIME
 from ...types.blob_storage import SecureFilePathLocation
+from ...types.server_url import ServerURL
 from ...types.syft_object import SYFT_OBJECT_VERSION_2
+from ...types.uid import UID
+
+# route of the server API that serves on-disk blobs
+ON_DISK_BLOB_ROUTE = "/blob_disk"
+
+# file in the blob directory holding the key that signs blob urls
+BLOB_URL_KEY_FILE = ".blob_url_key"
+
+
+def load_url_key(base_directory: Path) -> bytes:
+    """Returns the url signing key of a blob directory, creating it if needed.
+
+    The key lives next to the blobs, so every process that can serve them signs alike.
+    """
+    key_file = base_directory / BLOB_URL_KEY_FILE
+    if not key_file.exists():
+        tmp_file = base_directory / f"{BLOB_URL_KEY_FILE}.{os.getpid()}"
+        tmp_file.write_bytes(secrets.token_bytes(32))
+        tmp_file.chmod(0o600)
+        try:
+            # linking does not replace a key another process created meanwhile
+            os.link(tmp_file, key_file)
+        except FileExistsError:
+            pass
+        finally:
+            tmp_file.unlink()
+    return key_file.read_bytes()
+
+
+def sign_blob_url(key: bytes, file_name: str, expires: int) -> str:
+    message = f"{file_name}:{expires}".encode()
+    return hmac.new(key, message, hashlib.sha256).hexdigest()
+
+
+def resolve_blob_url(
+    base_directory: Path, file_name: str, expires: int, signature: str
+) -> Path | None:
+    """Returns the path of a blob if the signed url is valid, otherwise None."""
+    if expires < time.time() or Path(file_name).name != file_name:
+        return None
+    if not (base_directory / BLOB_URL_KEY_FILE).exists():
+        return None
+    expected = sign_blob_url(load_url_key(base_directory), file_name, expires)
+    if not hmac.compare_digest(expected, signature):
+        return None
+    return base_directory / file_name
+
+
+def local_blob_path(url: ServerURL | str, server_uid: UID | None) -> Path | None:
+    """Returns the local path of an on-disk blob url.
+
+    This is only possible when the server runs in this process, otherwise the blob
+    has to be fetched over HTTP.
+    """
+    # relative
+    from ...server.server import ServerRegistry
+
+    if not isinstance(url, ServerURL) or ON_DISK_BLOB_ROUTE not in url.path:
+        return None
+    server = None if server_uid is None else ServerRegistry.server_for(server_uid)
+    if server is None or not isinstance(
+        server.blob_storage_client, OnDiskBlobStorageClient
+    ):
+        return None
+    base_directory = server.blob_storage_client.config.base_directory
+    query = parse_qs(url.query)
+    try:
+        expires = int(query["expires"][0])
+        signature = query["signature"][0]
+    except (KeyError, ValueError):
+        return None
+    try:
+        path = resolve_blob_url(
+            base_directory, url.path.rsplit("/", 1)[-1], expires, signature
+        )
+    except OSError:
+        return None
+    if path is None or not path.is_file():
+        return None
+    return path
+
+
+def parse_range(header: str | None, size: int) -> tuple[int, int] | None:
+    """Parses a `bytes=start-end` Range header into a [start, end) slice.
+
+    Returns None when the whole file is requested and raises a ValueError
+    when the range can't be satisfied.
+    """
+    if header is None or size == 0:
+        return None
+    unit, _, byte_range = header.partition("=")
+    if unit.strip() != "bytes" or "," in byte_range:
+        raise ValueError(f"Unsupported range: {header}")
+    first, _, last = byte_range.strip().partition("-")
+    if first == "":
+        # suffix range, the last n bytes
+        start, end = max(size - int(last), 0), size
+    else:
+        start = int(first)
+        end = size if last == "" else min(int(last) + 1, size)
+    if start >= size or start >= end:
+        raise ValueError(f"Range {header} not satisfiable for size {size}")
+    return start, end
+
+
+def iter_file_range(
+    path: Path,
+    start: int = 0,
+    end: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Generator[bytes, None, None]:
+    """Yields the bytes [start, end) of a file in chunks read from a memory map."""
+    with path.open("rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        end = size if end is None else min(end, size)
+        if start >= end:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for offset in range(start, end, chunk_size):
+                yield mm[offset : min(offset + chunk_size, end)]
+
+
+def iter_write_chunks(
+    data: BinaryIO, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Generator[tuple[int, bytes], None, None]:
+    """Yields (offset, chunk) for the chunks of data written to a deposit.
+
+    Empty data still yields one empty chunk, which creates the file.
+    """
+    offset = 0
+    while True:
+        chunk = data.read(chunk_size)
+        if offset > 0 and len(chunk) == 0:
+            return
+        yield offset, chunk
+        if len(chunk) < chunk_size:
+            return
+        offset += len(chunk)
 
 
 @serializable()
@@ -28,18 +181,46 @@ class OnDiskBlobDeposit(BlobDeposit):
     __canonical_name__ = "OnDiskBlobDeposit"
     __version__ = SYFT_OBJECT_VERSION_2
 
-    def write(self, data: BytesIO) -> SyftSuccess | SyftError:
+    def _write_to_disk_method(self) -> Callable | None:
         # relative
         from ...service.service import from_api_or_context
 
-        write_to_disk_method = from_api_or_context(
+        return from_api_or_context(
             func_or_path="blob_storage.write_to_disk",
             syft_server_location=self.syft_server_location,
             syft_client_verify_key=self.syft_client_verify_key,
         )
+
+    def write(self, data: BytesIO) -> SyftSuccess | SyftError:
+        write_to_disk_method = self._write_to_disk_method()
+        if write_to_disk_method is None:
+            return SyftError(message="write_to_disk_method is None")
+
+        # send the data in chunks, so it never has to be in memory at once
+        res: Any = None
+        for offset, chunk in iter_write_chunks(data):
+            res = write_to_disk_method(
+                data=chunk, uid=self.blob_storage_entry_id, offset=offset
+            )
+            if isinstance(res, SyftError):
+                return res
+        return res
+
+    async def write_async(self, data: BinaryIO) -> SyftSuccess | SyftError:
+        write_to_disk_method = self._write_to_disk_method()
         if write_to_disk_method is None:
             return SyftError(message="write_to_disk_method is None")
-        return write_to_disk_method(data=data.read(), uid=self.blob_storage_entry_id)
+
+        res: Any = None
+        for offset, chunk in iter_write_chunks(data):
+            res = write_to_disk_method(
+                data=chunk, uid=self.blob_storage_entry_id, offset=offset
+            )
+            if inspect.isawaitable(res):
+                res = await res
+            if isinstance(res, SyftError):
+                return res
+        return res
 
 
 class OnDiskBlobStorageConnection(BlobStorageConnection):
@@ -57,12 +238,27 @@ class OnDiskBlobStorageConnection(BlobStorageConnection):
     def read(
         self, fp: SecureFilePathLocation, type_: type | None, **kwargs: Any
     ) -> BlobRetrieval:
+        # relative
+        from ...client.client import API_PATH
+
         file_path = self._base_directory / fp.path
-        return SyftObjectRetrieval(
-            syft_object=file_path.read_bytes(),
-            file_name=file_path.name,
-            type_=type_,
+        if not file_path.is_file():
+            raise FileNotFoundError(f"No such blob file: {file_path}")
+
+        # the blob is streamed by the server, or read in place by clients in
+        # the same process, either resolves the file name in its blob directory
+        expires = int(time.time()) + READ_EXPIRATION_TIME
+        key = load_url_key(self._base_directory)
+        query = urlencode(
+            {
+                "expires": expires,
+                "signature": sign_blob_url(key, file_path.name, expires),
+            }
+        )
+        url = ServerURL(
+            path=f"{API_PATH}{ON_DISK_BLOB_ROUTE}/{file_path.name}", query=query
         )
+        return BlobRetrievalByURL(url=url, file_name=file_path.name, type_=type_)
 
     def allocate(
         self, obj: CreateBlobStorageEntry
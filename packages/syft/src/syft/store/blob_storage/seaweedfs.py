@@ -1,11 +1,15 @@
 # stdlib
+import asyncio
+from collections.abc import AsyncGenerator
 from collections.abc import Generator
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 import logging
 import math
-from queue import Queue
 import threading
 from typing import Any
+from typing import BinaryIO
 
 # third party
 import boto3
@@ -13,6 +17,7 @@ from botocore.client import BaseClient as S3BaseClient
 from botocore.client import ClientError as BotoClientError
 from botocore.client import Config
 from botocore.exceptions import ConnectionError
+import httpx
 import requests
 from tenacity import retry
 from tenacity import retry_if_exception_type
@@ -28,6 +33,7 @@ from . import BlobStorageClient
 from . import BlobStorageClientConfig
 from . import BlobStorageConfig
 from . import BlobStorageConnection
+from . import MAX_TRANSFER_WORKERS
 from ...serde.serializable import serializable
 from ...service.blob_storage.remote_profile import AzureRemoteProfile
 from ...service.response import SyftError
@@ -44,12 +50,49 @@ from ...util.constants import DEFAULT_TIMEOUT
 
 logger = logging.getLogger(__name__)
 
-MAX_QUEUE_SIZE = 100
+MAX_UPLOAD_RETRIES = 3
 WRITE_EXPIRATION_TIME = 900  # seconds
-DEFAULT_FILE_PART_SIZE = 1024**3  # 1GB
+DEFAULT_FILE_PART_SIZE = 1024**2 * 256  # 256MB
 DEFAULT_UPLOAD_CHUNK_SIZE = 1024 * 800  # 800KB
 
 
+class PartReader:
+    """Reads one part of a file that is shared with the readers of other parts."""
+
+    def __init__(
+        self, data: BytesIO, lock: threading.Lock, start: int, end: int, pbar: tqdm
+    ) -> None:
+        self.data = data
+        self.lock = lock
+        self.start = start
+        self.end = end
+        self.pbar = pbar
+        self.sent = 0
+        self.no_lines = 0
+
+    def __iter__(self) -> Generator[bytes, None, None]:
+        offset = self.start
+        while offset < self.end:
+            with self.lock:
+                self.data.seek(offset)
+                chunk = self.data.read(
+                    min(DEFAULT_UPLOAD_CHUNK_SIZE, self.end - offset)
+                )
+            if not chunk:
+                break
+            offset += len(chunk)
+            self.sent += len(chunk)
+            self.no_lines += chunk.count(b"\n")
+            self.pbar.update(len(chunk))
+            yield chunk
+
+
+async def aiter_chunks(chunks: Iterable[bytes]) -> AsyncGenerator[bytes, None]:
+    # httpx.AsyncClient only streams request bodies from async iterables
+    for chunk in chunks:
+        yield chunk
+
+
 @serializable()
 class SeaweedFSBlobDeposit(BlobDeposit):
     __canonical_name__ = "SeaweedFSBlobDeposit"
@@ -59,119 +102,160 @@ class SeaweedFSBlobDeposit(BlobDeposit):
     size: int
     proxy_server_uid: UID | None = None
 
-    def write(self, data: BytesIO) -> SyftSuccess | SyftError:
+    def _api(self) -> Any:
         # relative
         from ...client.api import APIRegistry
 
-        api = APIRegistry.api_for(
+        return APIRegistry.api_for(
             server_uid=self.syft_server_location,
             user_verify_key=self.syft_client_verify_key,
         )
 
-        etags = []
+    def _part_url(self, api: Any, url: ServerURL) -> ServerURL:
+        if api is None or api.connection is None:
+            return url
+        if self.proxy_server_uid is None:
+            return api.connection.to_blob_route(url.url_path, host=url.host_or_ip)
+        return api.connection.stream_via(self.proxy_server_uid, url.url_path)
+
+    def _part_bounds(self, part_no: int, data_start: int) -> tuple[int, int]:
+        # the file is split in parts, a part may for instance be 256MB, which are
+        # uploaded concurrently. Parts are streamed in chunks which are MBs
+        part_size = math.ceil(self.size / len(self.urls))
+        start = data_start + (part_no - 1) * part_size
+        return start, min(start + part_size, data_start + self.size)
+
+    def _progress_bar(self) -> tqdm:
+        return tqdm(
+            total=self.size,
+            desc="Uploading progress",
+            colour="green",
+            unit="B",
+            unit_scale=True,
+        )
 
-        try:
-            no_lines = 0
-            # this loops over the parts, we have multiple parts to allow for
-            # concurrent uploads of a single file. (We are currently not using that)
-            # a part may for instance be 5GB
-            # parts are then splitted into chunks which are MBs (order of magnitude)
-            part_size = math.ceil(self.size / len(self.urls))
-            chunk_size = DEFAULT_UPLOAD_CHUNK_SIZE
-
-            # this is the total nr of chunks in all parts
-            total_iterations = math.ceil(part_size / chunk_size) * len(self.urls)
-
-            with tqdm(
-                total=total_iterations,
-                desc=f"Uploading progress",  # noqa
-                colour="green",
-            ) as pbar:
-                for part_no, url in enumerate(
-                    self.urls,
-                    start=1,
-                ):
-                    if api is not None and api.connection is not None:
-                        if self.proxy_server_uid is None:
-                            blob_url = api.connection.to_blob_route(
-                                url.url_path, host=url.host_or_ip
-                            )
-                        else:
-                            blob_url = api.connection.stream_via(
-                                self.proxy_server_uid, url.url_path
-                            )
-                    else:
-                        blob_url = url
-
-                    # read a chunk untill we have read part_size
-                    class PartGenerator:
-                        def __init__(self) -> None:
-                            self.no_lines = 0
-
-                        def async_generator(
-                            self, chunk_size: int = DEFAULT_UPLOAD_CHUNK_SIZE
-                        ) -> Generator:
-                            item_queue: Queue = Queue(maxsize=MAX_QUEUE_SIZE)
-                            threading.Thread(
-                                target=self.add_chunks_to_queue,
-                                kwargs={"queue": item_queue, "chunk_size": chunk_size},
-                                daemon=True,
-                            ).start()
-                            item = item_queue.get()
-                            while item != 0:
-                                yield item
-                                pbar.update(1)
-                                item = item_queue.get()
-
-                        def add_chunks_to_queue(
-                            self,
-                            queue: Queue,
-                            chunk_size: int = DEFAULT_UPLOAD_CHUNK_SIZE,
-                        ) -> None:
-                            """Creates a data geneator for the part"""
-                            n = 0
-
-                            try:
-                                while n * chunk_size <= part_size:
-                                    chunk = data.read(chunk_size)
-                                    if not chunk:
-                                        break
-                                    self.no_lines += chunk.count(b"\n")
-                                    n += 1
-                                    queue.put(chunk)
-                            except BlockingIOError:
-                                pass
-                            # if end of file or part, stop
-                            queue.put(0)
-
-                    gen = PartGenerator()
+    def _mark_write_complete_kwargs(self, results: list[tuple[dict, int]]) -> dict:
+        return {
+            "etags": [etag for etag, _ in results],
+            "uid": self.blob_storage_entry_id,
+            "no_lines": sum(part_lines for _, part_lines in results),
+        }
 
+    def _mark_write_complete(self, results: list[tuple[dict, int]]) -> Any:
+        mark_write_complete_method = from_api_or_context(
+            func_or_path="blob_storage.mark_write_complete",
+            syft_server_location=self.syft_server_location,
+            syft_client_verify_key=self.syft_client_verify_key,
+        )
+        if mark_write_complete_method is None:
+            return SyftError(message="mark_write_complete_method is None")
+        return mark_write_complete_method(**self._mark_write_complete_kwargs(results))
+
+    def write(
+        self, data: BytesIO, max_workers: int = MAX_TRANSFER_WORKERS
+    ) -> SyftSuccess | SyftError:
+        api = self._api()
+        data_start = data.tell()
+        data_lock = threading.Lock()
+
+        def upload_part(part_no: int, url: ServerURL) -> tuple[dict, int]:
+            blob_url = self._part_url(api, url)
+            start, end = self._part_bounds(part_no, data_start)
+            attempt = 0
+            while True:
+                part = PartReader(data, data_lock, start, end, pbar)
+                try:
                     response = requests.put(
                         url=str(blob_url),
-                        data=gen.async_generator(chunk_size),
+                        data=iter(part),
                         timeout=DEFAULT_TIMEOUT,
                         stream=True,
                     )
-
                     response.raise_for_status()
-                    no_lines += gen.no_lines
-                    etag = response.headers["ETag"]
-                    etags.append({"ETag": etag, "PartNumber": part_no})
+                    etag = {"ETag": response.headers["ETag"], "PartNumber": part_no}
+                    return etag, part.no_lines
+                except requests.RequestException as e:
+                    # the part is sent again from its start
+                    pbar.update(-part.sent)
+                    attempt += 1
+                    if attempt >= MAX_UPLOAD_RETRIES:
+                        raise
+                    logger.debug(f"Uploading part {part_no} failed: {e}. Retrying...")
 
+        try:
+            with self._progress_bar() as pbar:
+                n_workers = max(1, min(max_workers, len(self.urls)))
+                with ThreadPoolExecutor(max_workers=n_workers) as executor:
+                    results = list(
+                        executor.map(
+                            upload_part, range(1, len(self.urls) + 1), self.urls
+                        )
+                    )
         except requests.RequestException as e:
             logger.error(f"Failed to upload file to SeaweedFS - {e}")
             return SyftError(message=str(e))
 
-        mark_write_complete_method = from_api_or_context(
-            func_or_path="blob_storage.mark_write_complete",
-            syft_server_location=self.syft_server_location,
-            syft_client_verify_key=self.syft_client_verify_key,
-        )
-        if mark_write_complete_method is None:
-            return SyftError(message="mark_write_complete_method is None")
-        return mark_write_complete_method(
-            etags=etags, uid=self.blob_storage_entry_id, no_lines=no_lines
+        return self._mark_write_complete(results)
+
+    async def write_async(
+        self, data: BinaryIO, max_workers: int = MAX_TRANSFER_WORKERS
+    ) -> SyftSuccess | SyftError:
+        api = self._api()
+        if api is None or api.async_connection is None:
+            return SyftError(message="The blob deposit has no async API connection")
+        client = api.async_connection.client
+        data_start = data.tell()
+        data_lock = threading.Lock()
+        workers = asyncio.Semaphore(max(1, max_workers))
+
+        async def upload_part(part_no: int, url: ServerURL) -> tuple[dict, int]:
+            blob_url = self._part_url(api, url)
+            start, end = self._part_bounds(part_no, data_start)
+            attempt = 0
+            async with workers:
+                while True:
+                    part = PartReader(data, data_lock, start, end, pbar)
+                    try:
+                        response = await client.put(
+                            str(blob_url),
+                            content=aiter_chunks(part),
+                            timeout=DEFAULT_TIMEOUT,
+                        )
+                        response.raise_for_status()
+                        etag = {"ETag": response.headers["ETag"], "PartNumber": part_no}
+                        return etag, part.no_lines
+                    except httpx.HTTPError as e:
+                        pbar.update(-part.sent)
+                        attempt += 1
+                        if attempt >= MAX_UPLOAD_RETRIES:
+                            raise
+                        logger.debug(
+                            f"Uploading part {part_no} failed: {e}. Retrying..."
+                        )
+
+        try:
+            with self._progress_bar() as pbar:
+                results = await asyncio.gather(
+                    *[
+                        upload_part(part_no, url)
+                        for part_no, url in enumerate(self.urls, start=1)
+                    ]
+                )
+        except httpx.HTTPError as e:
+            logger.error(f"Failed to upload file to SeaweedFS - {e}")
+            return SyftError(message=str(e))
+
+        # relative
+        from ...client.api import SyftAPICall
+
+        call = SyftAPICall(
+            server_uid=api.server_uid,
+            path="blob_storage.mark_write_complete",
+            args=[],
+            kwargs=self._mark_write_complete_kwargs(results),
+            blocking=True,
         )
+        return await api.make_call_async(call)
 
 
 @serializable()
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 # stdlib
 from collections.abc import Callable
+import logging
 import types
 import typing
 from typing import Any
@@ -33,6 +34,8 @@ from .locks import LockingConfig
 from .locks import NoLockingConfig
 from .locks import SyftLock
 
+logger = logging.getLogger(__name__)
+
 
 @serializable()
 class BasePartitionSettings(SyftBaseModel):
@@ -318,6 +321,10 @@ class StorePartition:
         self.settings = settings
         self.store_config = store_config
         self.has_admin_permissions = has_admin_permissions
+        # bumped after every set, update, delete and migration through this partition,
+        # so what was read from it, after reading the generation, can be cached until
+        # it changes
+        self.generation = 0
         res = self.init_store()
         if res.is_err():
             raise RuntimeError(
@@ -372,7 +379,7 @@ class StorePartition:
         add_storage_permission: bool = True,
         ignore_duplicates: bool = False,
     ) -> Result[SyftObject, str]:
-        return self._thread_safe_cbk(
+        res = self._thread_safe_cbk(
             self._set,
             credentials=credentials,
             obj=obj,
@@ -380,6 +387,8 @@ class StorePartition:
             add_storage_permission=add_storage_permission,
             ignore_duplicates=ignore_duplicates,
         )
+        self.generation += 1
+        return res
 
     def get(
         self,
@@ -425,13 +434,15 @@ class StorePartition:
         obj: SyftObject,
         has_permission: bool = False,
     ) -> Result[SyftObject, str]:
-        return self._thread_safe_cbk(
+        res = self._thread_safe_cbk(
             self._update,
             credentials=credentials,
             qk=qk,
             obj=obj,
             has_permission=has_permission,
         )
+        self.generation += 1
+        return res
 
     def get_all_from_store(
         self,
@@ -446,9 +457,11 @@ class StorePartition:
     def delete(
         self, credentials: SyftVerifyKey, qk: QueryKey, has_permission: bool = False
     ) -> Result[SyftSuccess, Err]:
-        return self._thread_safe_cbk(
+        res = self._thread_safe_cbk(
             self._delete, credentials, qk, has_permission=has_permission
         )
+        self.generation += 1
+        return res
 
     def all(
         self,
@@ -464,9 +477,11 @@ class StorePartition:
         context: AuthedServiceContext,
         has_permission: bool | None = False,
     ) -> Result[bool, str]:
-        return self._thread_safe_cbk(
+        res = self._thread_safe_cbk(
             self._migrate_data, to_klass, context, has_permission
         )
+        self.generation += 1
+        return res
 
     # Potentially thread-unsafe methods.
     # CAUTION:
@@ -642,6 +657,28 @@ class BaseStash:
     def __init__(self, store: DocumentStore) -> None:
         self.store = store
         self.partition = store.partition(type(self).settings)
+        # called with whatever a stash passes to `_notify` when its objects change,
+        # stashes with listeners leave them out of serde
+        self.listeners: list[Callable[..., None]] = []
+
+    def _listeners(self) -> list[Callable[..., None]]:
+        # a stash deserialized with its server is created without __init__
+        return self.__dict__.setdefault("listeners", [])
+
+    def add_listener(self, listener: Callable[..., None]) -> None:
+        self._listeners().append(listener)
+
+    def remove_listener(self, listener: Callable[..., None]) -> None:
+        if listener in self._listeners():
+            self._listeners().remove(listener)
+
+    def _notify(self, *args: Any) -> None:
+        # a failing listener must not fail the write that it is notified about
+        for listener in list(self._listeners()):
+            try:
+                listener(*args)
+            except Exception as e:
+                logger.error(f"Listener of {type(self).__name__} failed", exc_info=e)
 
     def check_type(self, obj: Any, type_: type) -> Result[Any, str]:
         return (
@@ -106,12 +106,6 @@ class KeyValueStorePartition(StorePartition):
             self.data = self.store_config.backing_store(
                 "data", self.settings, self.store_config
             )
-            self.unique_keys = self.store_config.backing_store(
-                "unique_keys", self.settings, self.store_config
-            )
-            self.searchable_keys = self.store_config.backing_store(
-                "searchable_keys", self.settings, self.store_config
-            )
             # uid -> set['<uid>_permission']
             self.permissions: dict[UID, set[str]] = self.store_config.backing_store(
                 "permissions", self.settings, self.store_config, ddtype=set
@@ -127,20 +121,32 @@ class KeyValueStorePartition(StorePartition):
                 )
             )
 
-            for partition_key in self.unique_cks:
-                pk_key = partition_key.key
-                if pk_key not in self.unique_keys:
-                    self.unique_keys[pk_key] = {}
-
-            for partition_key in self.searchable_cks:
-                pk_key = partition_key.key
-                if pk_key not in self.searchable_keys:
-                    self.searchable_keys[pk_key] = defaultdict(list)
+            self._init_keys()
         except BaseException as e:
             return Err(str(e))
 
         return Ok(True)
 
+    def _init_keys(self) -> None:
+        # pk_key -> {pk_value: uid}
+        self.unique_keys = self.store_config.backing_store(
+            "unique_keys", self.settings, self.store_config
+        )
+        # pk_key -> {pk_value: [uid, ...]}
+        self.searchable_keys = self.store_config.backing_store(
+            "searchable_keys", self.settings, self.store_config
+        )
+
+        for partition_key in self.unique_cks:
+            pk_key = partition_key.key
+            if pk_key not in self.unique_keys:
+                self.unique_keys[pk_key] = {}
+
+        for partition_key in self.searchable_cks:
+            pk_key = partition_key.key
+            if pk_key not in self.searchable_keys:
+                self.searchable_keys[pk_key] = defaultdict(list)
+
     def __len__(self) -> int:
         return len(self.data)
 
@@ -1,5 +1,6 @@
 # stdlib
 from collections.abc import Callable
+import logging
 from typing import Any
 from typing import Set  # noqa: UP035
 
@@ -47,6 +48,8 @@ from .locks import NoLockingConfig
 from .mongo_client import MongoClient
 from .mongo_client import MongoStoreClientConfig
 
+logger = logging.getLogger(__name__)
+
 
 @serializable()
 class MongoDict(SyftBaseObject):
@@ -163,7 +166,11 @@ class MongoStorePartition(StorePartition):
         self._permissions = collection_permissions_status.ok()
         self._storage_permissions = collection_storage_permissions_status.ok()
 
-        return self._create_update_index()
+        index_status = self._create_update_index()
+        if index_status.is_err():
+            return index_status
+
+        return self._create_search_indexes()
 
     # Potentially thread-unsafe methods.
     #
@@ -227,6 +234,44 @@ class MongoStorePartition(StorePartition):
 
         return Ok(True)
 
+    def _create_search_indexes(self) -> Result[Ok, Err]:
+        """Create mongo indexes for the searchable keys
+
+        Documents stored before a searchable key was added get its value here.
+        """
+        collection_status = self.collection
+        if collection_status.is_err():
+            return collection_status
+        collection: MongoCollection = collection_status.ok()
+
+        syft_obj = self.settings.object_type
+        object_name = syft_obj.__canonical_name__
+
+        for attr in getattr(syft_obj, "__attr_searchable__", []):
+            try:
+                collection.create_index(
+                    [(attr, ASCENDING)], name=f"{object_name}_{attr}_index"
+                )
+            except Exception:
+                return Err(f"Failed to create index for {object_name} with key: {attr}")
+
+            for storage_obj in collection.find({attr: {"$exists": False}}):
+                try:
+                    obj = _deserialize(storage_obj["__blob__"], from_bytes=True)
+                    value = getattr(obj, attr, None)
+                    if callable(value):
+                        value = value()
+                    collection.update_one(
+                        filter={"_id": storage_obj["_id"]},
+                        update={"$set": {attr: value}},
+                    )
+                except Exception as e:
+                    logger.warning(
+                        f"Could not index {attr} of {storage_obj['_id']} in {object_name}: {e}"
+                    )
+
+        return Ok(True)
+
     @property
     def collection(self) -> Result[MongoCollection, Err]:
         if not hasattr(self, "_collection"):
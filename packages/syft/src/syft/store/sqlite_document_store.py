@@ -3,6 +3,7 @@ from __future__ import annotations
 
 # stdlib
 from collections import defaultdict
+from collections.abc import Iterable
 from copy import deepcopy
 import logging
 from pathlib import Path
@@ -20,16 +21,23 @@ from typing_extensions import Self
 
 # relative
 from ..serde.deserialize import _deserialize
+from ..serde.recursive import rs_object2proto
 from ..serde.serializable import serializable
 from ..serde.serialize import _serialize
+from ..service.response import SyftSuccess
+from ..types.syft_object import SyftObject
 from ..types.uid import UID
 from ..util.util import thread_ident
 from .document_store import DocumentStore
+from .document_store import PartitionKey
 from .document_store import PartitionSettings
+from .document_store import QueryKey
+from .document_store import QueryKeys
 from .document_store import StoreClientConfig
 from .document_store import StoreConfig
 from .kv_document_store import KeyValueBackingStore
 from .kv_document_store import KeyValueStorePartition
+from .kv_document_store import UniqueKeyCheck
 from .locks import LockingConfig
 from .locks import NoLockingConfig
 from .locks import SyftLock
@@ -205,6 +213,20 @@ class SQLiteBackingStore(KeyValueBackingStore):
 
             return Ok(cursor)
 
+    def _execute_many(
+        self, sql: str, rows: list[list[Any]]
+    ) -> Result[Ok[sqlite3.Cursor], Err[str]]:
+        with self.lock:
+            cursor: sqlite3.Cursor | None = None
+            try:
+                cursor = self.cur.executemany(sql, rows)
+            except Exception as e:
+                raise_exception(self.table_name, e)
+
+            # a single commit for all the rows
+            self.db.commit()
+            return Ok(cursor)
+
     def _set(self, key: UID, value: Any) -> None:
         if self._exists(key):
             self._update(key, value)
@@ -361,6 +383,130 @@ class SQLiteBackingStore(KeyValueBackingStore):
             logger.error("Could not close connection", exc_info=e)
 
 
+def index_value(value: Any) -> bytes:
+    # the capnp encoding does not depend on the FLAT_SERDE flag, so the index
+    # stays readable whichever serde format is used
+    return rs_object2proto(value, for_hashing=True).to_bytes()
+
+
+# bump when the layout of the index rows changes, so existing partitions are
+# re-indexed on their next start
+INDEX_VERSION = 1
+
+
+class SQLiteIndex(SQLiteBackingStore):
+    """Unique or searchable keys of a SQLiteStorePartition.
+
+    Every (key, value, uid) is its own row, next to an index on (key, value), so
+    keys are added, removed and looked up without loading the rest of the index.
+    A list value gets a row per item, and only matches a search for that exact
+    item.
+
+    The version of each index table, together with the keys it was built for, is
+    kept in the `index_version` table, so a partition only has to be re-indexed
+    when either of them changes.
+
+    Parameters:
+        `unique`: bool
+            If True, a (key, value) can only point to a single uid
+    """
+
+    def __init__(
+        self,
+        index_name: str,
+        settings: PartitionSettings,
+        store_config: StoreConfig,
+        unique: bool = False,
+    ) -> None:
+        self.unique = unique
+        super().__init__(index_name, settings, store_config)
+
+    def create_table(self) -> None:
+        unique = "unique " if self.unique else ""
+        try:
+            with self.lock:
+                self.cur.execute(
+                    f"create table if not exists {self.table_name} "  # nosec
+                    + "(key TEXT NOT NULL, value BLOB NOT NULL, "  # nosec
+                    + "uid VARCHAR(32) NOT NULL)"  # nosec
+                )
+                self.cur.execute(
+                    f"create {unique}index if not exists {self.table_name}_key_value "  # nosec
+                    + f"on {self.table_name} (key, value)"  # nosec
+                )
+                self.cur.execute(
+                    f"create index if not exists {self.table_name}_uid "  # nosec
+                    + f"on {self.table_name} (uid, key)"  # nosec
+                )
+                self.cur.execute(
+                    "create table if not exists index_version "
+                    + "(table_name TEXT NOT NULL PRIMARY KEY, version TEXT NOT NULL)"
+                )
+                self.db.commit()
+        except Exception as e:
+            raise_exception(self.table_name, e)
+
+    def add(self, uid: UID, keys: list[tuple[str, Any]]) -> None:
+        if not keys:
+            return
+        # a unique (key, value) moves over to the new uid
+        insert = "insert or replace" if self.unique else "insert"
+        insert_sql = (
+            f"{insert} into {self.table_name} (key, value, uid) VALUES (?, ?, ?)"  # nosec
+        )
+        rows = [[key, index_value(value), str(uid)] for key, value in keys]
+        res = self._execute_many(insert_sql, rows)
+        if res.is_err():
+            raise ValueError(res.err())
+
+    def remove(self, uid: UID, keys: list[str] | None = None) -> None:
+        """Removes the rows of uid, only those of `keys` if given."""
+        delete_sql = f"delete from {self.table_name} where uid = ?"  # nosec
+        args: list[Any] = [str(uid)]
+        if keys is not None:
+            if not keys:
+                return
+            delete_sql += f" and key in ({', '.join('?' * len(keys))})"
+            args += keys
+        res = self._execute(delete_sql, args)
+        if res.is_err():
+            raise ValueError(res.err())
+
+    def version(self) -> str | None:
+        select_sql = "select version from index_version where table_name = ?"
+        res = self._execute(select_sql, [self.table_name])
+        if res.is_err():
+            raise ValueError(res.err())
+        row = res.ok().fetchone()
+        return None if row is None else row[0]
+
+    def set_version(self, version: str) -> None:
+        insert_sql = (
+            "insert or replace into index_version (table_name, version) VALUES (?, ?)"
+        )
+        res = self._execute(insert_sql, [self.table_name, version])
+        if res.is_err():
+            raise ValueError(res.err())
+
+    def drop_table(self, table_name: str) -> None:
+        res = self._execute(f"drop table if exists {table_name}")  # nosec
+        if res.is_err():
+            raise ValueError(res.err())
+
+    def find(self, key: str, values: list[Any]) -> set[UID]:
+        """Returns the uids with any of values for key."""
+        if not values:
+            return set()
+        select_sql = (
+            f"select uid from {self.table_name} where key = ? "  # nosec
+            + f"and value in ({', '.join('?' * len(values))})"
+        )
+        res = self._execute(select_sql, [key] + [index_value(v) for v in values])
+        if res.is_err():
+            raise ValueError(res.err())
+        return {UID(row[0]) for row in res.ok().fetchall()}
+
+
 @serializable()
 class SQLiteStorePartition(KeyValueStorePartition):
     """SQLite StorePartition
@@ -372,6 +518,164 @@ class SQLiteStorePartition(KeyValueStorePartition):
             SQLite specific configuration
     """
 
+    def _init_keys(self) -> None:
+        self.unique_keys = SQLiteIndex(
+            "unique_index", self.settings, self.store_config, unique=True
+        )
+        self.searchable_keys = SQLiteIndex(
+            "searchable_index", self.settings, self.store_config
+        )
+
+        unique_version = self._index_version(self.unique_cks)
+        searchable_version = self._index_version(self.searchable_cks)
+        if (
+            self.unique_keys.version() == unique_version
+            and self.searchable_keys.version() == searchable_version
+        ):
+            return
+
+        # the index was written by an older version, which kept the whole index
+        # in a single row of the `unique_keys` and `searchable_keys` tables, or
+        # the object type gained keys since its objects were indexed
+        if len(self.data) > 0:
+            self._rebuild_keys()
+        for legacy_index in ("unique_keys", "searchable_keys"):
+            self.unique_keys.drop_table(f"{self.settings.name}_{legacy_index}")
+        self.unique_keys.set_version(unique_version)
+        self.searchable_keys.set_version(searchable_version)
+
+    @staticmethod
+    def _index_version(cks: Iterable[PartitionKey]) -> str:
+        return f"{INDEX_VERSION}:" + ",".join(sorted(pk.key for pk in cks))
+
+    def _rebuild_keys(self) -> None:
+        self.unique_keys.clear()
+        self.searchable_keys.clear()
+        for uid, obj in self.data.items():
+            try:
+                unique_query_keys = self.settings.unique_keys.with_obj(obj)
+                searchable_query_keys = self.settings.searchable_keys.with_obj(obj)
+            except Exception as e:
+                logger.warning(f"Could not index {uid} in {self.settings.name}: {e}")
+                continue
+            self.unique_keys.add(uid, self._index_rows(unique_query_keys))
+            self.searchable_keys.add(uid, self._index_rows(searchable_query_keys))
+
+    @staticmethod
+    def _index_rows(query_keys: QueryKeys) -> list[tuple[str, Any]]:
+        rows = []
+        for qk in query_keys.all:
+            if qk.type_list:
+                # one row per item, which a search for any of the items matches
+                rows += [(qk.key, item) for item in qk.value]
+            else:
+                rows.append((qk.key, qk.value))
+        return rows
+
+    def _set_data_and_keys(
+        self,
+        store_query_key: QueryKey,
+        unique_query_keys: QueryKeys,
+        searchable_query_keys: QueryKeys,
+        obj: SyftObject,
+    ) -> None:
+        uid = store_query_key.value
+        self.unique_keys.add(uid, self._index_rows(unique_query_keys))
+        self.searchable_keys.add(uid, self._index_rows(searchable_query_keys))
+        self.data[uid] = obj
+
+    def _remove_keys(
+        self,
+        store_key: QueryKey,
+        unique_query_keys: QueryKeys,
+        searchable_query_keys: QueryKeys,
+    ) -> None:
+        self.unique_keys.remove(
+            store_key.value, keys=[qk.key for qk in unique_query_keys.all]
+        )
+        self.searchable_keys.remove(
+            store_key.value, keys=[qk.key for qk in searchable_query_keys.all]
+        )
+
+    def _delete_unique_keys_for(self, obj: SyftObject) -> Result[SyftSuccess, str]:
+        self.unique_keys.remove(self.settings.store_key.with_obj(obj).value)
+        return Ok(SyftSuccess(message="Deleted"))
+
+    def _delete_search_keys_for(self, obj: SyftObject) -> Result[SyftSuccess, str]:
+        self.searchable_keys.remove(self.settings.store_key.with_obj(obj).value)
+        return Ok(SyftSuccess(message="Deleted"))
+
+    def _get_keys_index(self, qks: QueryKeys) -> Result[set[Any], str]:
+        try:
+            unique_keys = {pk.key for pk in self.unique_cks}
+            # match AND
+            subsets: list = []
+            for qk in qks.all:
+                if qk.key not in unique_keys:
+                    return Err(f"Failed to query index with {qk}")
+                uids = self.unique_keys.find(qk.key, [qk.value])
+                if not uids:
+                    # must be at least one in all query keys
+                    continue
+                subsets.append(uids)
+
+            if len(subsets) == 0:
+                return Ok(set())
+            # AND
+            return Ok(set.intersection(*subsets))
+        except Exception as e:
+            return Err(f"Failed to query with {qks}. {e}")
+
+    def _find_keys_search(self, qks: QueryKeys) -> Result[set[QueryKey], str]:
+        try:
+            searchable_keys = {pk.key for pk in self.searchable_cks}
+            # match AND
+            subsets = []
+            for qk in qks.all:
+                if qk.key not in searchable_keys:
+                    return Err(f"Failed to search with {qk}")
+                if qk.type_list:
+                    # match OR against the items of the list, each item has to be
+                    # equal to an indexed item rather than a substring of one
+                    matches = self.searchable_keys.find(qk.key, list(qk.value))
+                    if len(matches):
+                        subsets.append(matches)
+                else:
+                    subsets.append(self.searchable_keys.find(qk.key, [qk.value]))
+
+            if len(subsets) == 0:
+                return Ok(set())
+            # AND
+            return Ok(set.intersection(*subsets))
+        except Exception as e:
+            return Err(f"Failed to query with {qks}. {e}")
+
+    def _check_partition_keys_unique(
+        self, unique_query_keys: QueryKeys
+    ) -> UniqueKeyCheck:
+        unique_keys = {pk.key for pk in self.unique_cks}
+        # dont check the store key
+        qks = [
+            x
+            for x in unique_query_keys.all
+            if x.partition_key != self.settings.store_key
+        ]
+        matches = []
+        for qk in qks:
+            if qk.key not in unique_keys:
+                raise Exception(
+                    f"pk_key: {qk.key} not in unique_keys: {sorted(unique_keys)}"
+                )
+            if self.unique_keys.find(qk.key, [qk.value]):
+                matches.append(qk.key)
+
+        if len(matches) == 0:
+            return UniqueKeyCheck.EMPTY
+        elif len(matches) == len(qks):
+            return UniqueKeyCheck.MATCHES
+
+        return UniqueKeyCheck.ERROR
+
     def close(self) -> None:
         self.lock.acquire()
         try:
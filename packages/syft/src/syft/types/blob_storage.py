@@ -3,12 +3,12 @@ from collections.abc import Callable
 from collections.abc import Iterator
 from datetime import datetime
 from datetime import timedelta
+import itertools
 import mimetypes
 from pathlib import Path
 from queue import Queue
 import sys
 import threading
-from time import sleep
 from typing import Any
 from typing import ClassVar
 from typing import TYPE_CHECKING
@@ -17,6 +17,7 @@ from typing import TYPE_CHECKING
 from azure.storage.blob import BlobSasPermissions
 from azure.storage.blob import generate_blob_sas
 from botocore.client import ClientError as BotoClientError
+from cachetools import LRUCache
 from typing_extensions import Self
 
 # relative
@@ -48,6 +49,7 @@ from .uid import UID
 
 if TYPE_CHECKING:
     # relative
+    from ..store.blob_storage import BlobRetrieval
     from ..store.blob_storage import BlobRetrievalByURL
     from ..store.blob_storage import BlobStorageConnection
 
@@ -55,6 +57,14 @@ if TYPE_CHECKING:
 READ_EXPIRATION_TIME = 1800  # seconds
 DEFAULT_CHUNK_SIZE = 10000 * 1024
 
+# lines handed at once from the reading thread to the consumer of iter_lines
+LINE_BATCH_SIZE = 1000
+
+# every how many lines of a BlobFile the offset is kept by read_lines
+LINE_INDEX_STRIDE = 10_000
+# line offsets of BlobFiles, by blob storage entry id
+LINE_INDEX_CACHE: LRUCache = LRUCache(maxsize=256)
+
 
 @serializable()
 class BlobFile(SyftObject):
@@ -87,6 +97,75 @@ class BlobFile(SyftObject):
         else:
             return None
 
+    def _retrieval(self) -> "BlobRetrieval | None":
+        read_method = from_api_or_context(
+            "blob_storage.read", self.syft_server_location, self.syft_client_verify_key
+        )
+        if read_method is None:
+            return None
+        return read_method(self.syft_blob_storage_entry_id)
+
+    def read_range(self, offset: int, length: int | None = None) -> bytes | None:
+        """Reads length bytes from offset, or the bytes up to the end of the file.
+
+        A negative offset counts from the end of the file.
+        """
+        blob_retrieval_object = self._retrieval()
+        if blob_retrieval_object is None:
+            return None
+        return blob_retrieval_object.read_range(offset, length)
+
+    def _iter_lines_from(
+        self, blob_retrieval_object: "BlobRetrieval", offset: int, chunk_size: int
+    ) -> Iterator[tuple[int, bytes]]:
+        """Yields the lines from offset on, with the offset each of them starts at."""
+        pending = b""
+        line_offset = offset
+        while True:
+            chunk = blob_retrieval_object.read_range(offset, chunk_size)
+            offset += len(chunk)
+            lines = (pending + chunk).split(b"\n")
+            pending = lines.pop()
+            for line in lines:
+                yield line_offset, line
+                line_offset += len(line) + 1
+            if len(chunk) < chunk_size:
+                break
+        if pending:
+            yield line_offset, pending
+
+    def read_lines(
+        self, start: int = 0, stop: int | None = None, chunk_size: int = 1024**2
+    ) -> list[bytes] | None:
+        """Returns the lines [start, stop) of the file, reading only the bytes they span.
+
+        The offsets of every LINE_INDEX_STRIDE-th line found on the way are kept,
+        so later reads start close to the lines they need.
+        """
+        blob_retrieval_object = self._retrieval()
+        if blob_retrieval_object is None:
+            return None
+
+        line_index = LINE_INDEX_CACHE.get(self.syft_blob_storage_entry_id)
+        if line_index is None:
+            line_index = [0]
+            LINE_INDEX_CACHE[self.syft_blob_storage_entry_id] = line_index
+
+        position = min(start // LINE_INDEX_STRIDE, len(line_index) - 1)
+        line_no = position * LINE_INDEX_STRIDE
+        lines = []
+        for line_offset, line in self._iter_lines_from(
+            blob_retrieval_object, line_index[position], chunk_size
+        ):
+            if line_no == len(line_index) * LINE_INDEX_STRIDE:
+                line_index.append(line_offset)
+            if stop is not None and line_no >= stop:
+                break
+            if line_no >= start:
+                lines.append(line)
+            line_no += 1
+        return lines
+
     @classmethod
     def upload_from_path(cls, path: str | Path, client: SyftClient) -> Any:
         # syft absolute
@@ -144,15 +223,13 @@ class BlobFile(SyftObject):
         if pending is not None:
             yield pending
 
-    def read_queue(
-        self,
-        queue: Queue,
-        chunk_size: int,
-        progress: bool = False,
-        buffer_lines: int = 10000,
-    ) -> None:
+    def _iter_line_items(self, chunk_size: int, progress: bool) -> Iterator[Any]:
+        if not progress:
+            yield from self._iter_lines(chunk_size=chunk_size)
+            return
+
         total_read = 0
-        for _i, line in enumerate(self._iter_lines(chunk_size=chunk_size)):
+        for line in self._iter_lines(chunk_size=chunk_size):
             line_size = len(line) + 1  # add byte for \n
             if self.file_size is not None:
                 total_read = min(self.file_size, total_read + line_size)
@@ -160,28 +237,90 @@ class BlobFile(SyftObject):
                 # naive way of doing this, max be 1 byte off because the last
                 # byte can also be a \n
                 total_read += line_size
-            if progress:
-                queue.put((total_read, line))
-            else:
-                queue.put(line)
-            while queue.qsize() > buffer_lines:
-                sleep(0.1)
-        # Put anything not a string at the end
+            yield (total_read, line)
+
+    def read_queue(
+        self,
+        queue: Queue,
+        chunk_size: int,
+        progress: bool = False,
+        batch_size: int = LINE_BATCH_SIZE,
+        cancel: threading.Event | None = None,
+    ) -> None:
+        """Puts lists of up to batch_size lines into queue, followed by a 0.
+
+        Puts block while a bounded queue is full. Reading stops without the 0 once
+        cancel is set, and an error while reading is put into the queue instead.
+        """
+        items = self._iter_line_items(chunk_size, progress)
+        try:
+            while batch := list(itertools.islice(items, batch_size)):
+                queue.put(batch)
+                if cancel is not None and cancel.is_set():
+                    return
+        except Exception as e:
+            queue.put(e)
+            return
+        finally:
+            items.close()
         queue.put(0)
 
-    def iter_lines(
-        self, chunk_size: int = DEFAULT_CHUNK_SIZE, progress: bool = False
-    ) -> Iterator[str]:
-        item_queue: Queue = Queue()
+    def _iter_queued_batches(
+        self, chunk_size: int, progress: bool, batch_size: int, buffer_lines: int
+    ) -> Iterator[list]:
+        """Yields batches of lines read by a thread at most buffer_lines ahead."""
+        item_queue: Queue = Queue(maxsize=max(buffer_lines // batch_size, 1))
+        cancel = threading.Event()
         threading.Thread(
             target=self.read_queue,
-            args=(item_queue, chunk_size, progress),
+            args=(item_queue, chunk_size, progress, batch_size, cancel),
             daemon=True,
         ).start()
-        item = item_queue.get()
-        while item != 0:
-            yield item
-            item = item_queue.get()
+        try:
+            while (item := item_queue.get()) != 0:
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            # the consumer stopped, let the reader run into the cancel event
+            # instead of waiting for room in the queue forever
+            cancel.set()
+            while not item_queue.empty():
+                item_queue.get_nowait()
+
+    def iter_lines(
+        self,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        progress: bool = False,
+        buffer_lines: int = 10000,
+    ) -> Iterator[Any]:
+        for batch in self._iter_queued_batches(
+            chunk_size, progress, LINE_BATCH_SIZE, buffer_lines
+        ):
+            yield from batch
+
+    def iter_line_batches(
+        self,
+        n: int,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        as_arrow: bool = False,
+        buffer_lines: int = 10000,
+    ) -> Iterator[Any]:
+        """Yields lists of n lines, the last one possibly shorter.
+
+        With as_arrow, each batch is an Arrow record batch with a binary `line`
+        column instead.
+        """
+        # third party
+        import pyarrow as pa
+
+        for batch in self._iter_queued_batches(chunk_size, False, n, buffer_lines):
+            if as_arrow:
+                yield pa.RecordBatch.from_arrays(
+                    [pa.array(batch, type=pa.binary())], names=["line"]
+                )
+            else:
+                yield batch
 
     def _coll_repr_(self) -> dict[str, str]:
         return {"file_name": self.file_name}
@@ -118,7 +118,7 @@ class SyftHashableObject:
         return int.from_bytes(self.__sha256__(), byteorder="big")
 
     def __sha256__(self) -> bytes:
-        self.__hash_exclude_attrs__.extend(DYNAMIC_SYFT_ATTRIBUTES)
+        # DYNAMIC_SYFT_ATTRIBUTES are excluded by the for_hashing serde plans
         _bytes = serialize(self, to_bytes=True, for_hashing=True)
         return sha256(_bytes).digest()
 
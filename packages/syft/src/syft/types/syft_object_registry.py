@@ -13,12 +13,17 @@ SYFT_086_PROTOCOL_VERSION = "4"
 # relative
 if TYPE_CHECKING:
     # relative
+    from ..serde.recursive import SerdePlan
     from .syft_object import SyftObject
 
 
 class SyftObjectRegistry:
     __object_transform_registry__: dict[str, Callable] = {}
     __object_serialization_registry__: dict[str, dict[int, tuple]] = {}
+    # compiled serde plans by (canonical_name, version, for_hashing)
+    __serde_plan_registry__: dict[tuple[str, int, bool], "SerdePlan"] = {}
+    # serde plans by (type of the serialized object, for_hashing)
+    __serde_plan_type_cache__: dict[tuple[type, bool], "SerdePlan"] = {}
 
     @classmethod
     def register_cls(
@@ -29,6 +34,50 @@ class SyftObjectRegistry:
         cls.__object_serialization_registry__[canonical_name][version] = (
             serde_attributes
         )
+        # a (re-)registered class invalidates the plans compiled for it
+        for for_hashing in (False, True):
+            cls.__serde_plan_registry__.pop(
+                (canonical_name, version, for_hashing), None
+            )
+        cls.__serde_plan_type_cache__.clear()
+
+    @classmethod
+    def get_serde_plan(
+        cls, canonical_name: str, version: int, for_hashing: bool = False
+    ) -> "SerdePlan":
+        key = (canonical_name, version, for_hashing)
+        plan = cls.__serde_plan_registry__.get(key, None)
+        if plan is None:
+            # relative
+            from ..serde.recursive import compile_serde_plan
+
+            if not cls.has_serde_class("", canonical_name, version):
+                raise Exception(
+                    f"{canonical_name} version {version} not in SyftObjectRegistry"
+                )
+            plan = compile_serde_plan(
+                canonical_name,
+                version,
+                cls.get_serde_properties(canonical_name, version),
+                for_hashing=for_hashing,
+            )
+            cls.__serde_plan_registry__[key] = plan
+        return plan
+
+    @classmethod
+    def get_serde_plan_for(cls, obj: Any, for_hashing: bool = False) -> "SerdePlan":
+        # the canonical name and version only depend on the type of obj
+        key = (type(obj), for_hashing)
+        plan = cls.__serde_plan_type_cache__.get(key, None)
+        if plan is None:
+            canonical_name = cls.get_canonical_name(obj)
+            if isinstance(obj, type):
+                version = 1
+            else:
+                version = getattr(obj, "__version__", 1)
+            plan = cls.get_serde_plan(canonical_name, version, for_hashing=for_hashing)
+            cls.__serde_plan_type_cache__[key] = plan
+        return plan
 
     @classmethod
     def get_versions(cls, canonical_name: str) -> list[int]:
@@ -16,10 +16,23 @@ class ApacheArrowCompression(Enum):
     NONE = 0
 
 
+# codec names of the compressions Arrow IPC streams support
+ARROW_IPC_CODECS = {
+    ApacheArrowCompression.ZSTD: "zstd",
+    ApacheArrowCompression.LZ4: "lz4",
+    ApacheArrowCompression.NONE: None,
+}
+
+
 class ExperimentalFlags:
     def __init__(self) -> None:
         self._APACHE_ARROW_TENSOR_SERDE = True
         self._APACHE_ARROW_COMPRESSION = ApacheArrowCompression.ZSTD
+        # codec of the Arrow IPC streams pandas objects are serialized to
+        self._APACHE_ARROW_IPC_COMPRESSION = ApacheArrowCompression.LZ4
+        # writing the flat format is opt-in, as servers and clients without it
+        # cannot read its messages. Both formats are always read.
+        self._FLAT_SERDE = str_to_bool(os.getenv("FLAT_SERDE", "False"))
         self._CAN_REGISTER = str_to_bool(
             os.getenv(
                 "ENABLE_SIGNUP",
@@ -47,6 +60,26 @@ class ExperimentalFlags:
     def APACHE_ARROW_COMPRESSION(self, value: ApacheArrowCompression) -> None:
         self._APACHE_ARROW_COMPRESSION = value
 
+    @property
+    def APACHE_ARROW_IPC_COMPRESSION(self) -> ApacheArrowCompression:
+        return self._APACHE_ARROW_IPC_COMPRESSION
+
+    @APACHE_ARROW_IPC_COMPRESSION.setter
+    def APACHE_ARROW_IPC_COMPRESSION(self, value: ApacheArrowCompression) -> None:
+        if value not in ARROW_IPC_CODECS:
+            raise ValueError(
+                f"Arrow IPC streams only support {list(ARROW_IPC_CODECS)} compression"
+            )
+        self._APACHE_ARROW_IPC_COMPRESSION = value
+
+    @property
+    def FLAT_SERDE(self) -> bool:
+        return self._FLAT_SERDE
+
+    @FLAT_SERDE.setter
+    def FLAT_SERDE(self, value: bool) -> None:
+        self._FLAT_SERDE = value
+
     @property
     def USE_NEW_SERVICE(self) -> bool:
         return str_to_bool(os.getenv("USE_NEW_SERVICE", "False"))
@@ -1,5 +1,6 @@
 # stdlib
 from collections.abc import Callable
+from unittest import mock
 
 # third party
 import numpy as np
@@ -7,7 +8,12 @@ import pytest
 
 # syft absolute
 import syft as sy
+from syft.client.api import BatchedAPICall
+from syft.client.api import SyftAPI
+from syft.client.api import SyftAPICall
 from syft.service.response import SyftAttributeError
+from syft.service.response import SyftError
+from syft.service.response import SyftException
 from syft.service.user.user import UserUpdate
 from syft.service.user.user_roles import ServiceRole
 
@@ -75,3 +81,135 @@ def test_api_cache_invalidation_login(root_verify_key, worker):
     guest_client = guest_client.login(email="a@b.org", password="aaa")
 
     assert guest_client.upload_dataset(dataset)
+
+
+def test_api_call_many(worker):
+    root_client = worker.root_client
+    user_ids = [user.id for user in root_client.users.get_all()]
+    api_calls = [
+        SyftAPICall(
+            server_uid=worker.id,
+            path="user.view",
+            args=[uid],
+            kwargs={"communication_protocol": root_client.api.communication_protocol},
+        )
+        for uid in user_ids
+    ]
+    api_calls.append(
+        SyftAPICall(
+            server_uid=worker.id, path="user.does_not_exist", args=[], kwargs={}
+        )
+    )
+
+    results = root_client.api.call_many(api_calls)
+    assert [user.id for user in results[:-1]] == user_ids
+    # a failing call does not fail the rest of the batch
+    assert isinstance(results[-1], SyftError)
+
+
+def test_api_batch(worker):
+    root_client = worker.root_client
+    user = root_client.users.get_all()[0]
+    connection_type = type(root_client.api.connection)
+
+    with mock.patch.object(
+        connection_type,
+        "make_call",
+        autospec=True,
+        side_effect=connection_type.make_call,
+    ) as make_call:
+        with root_client.batch():
+            calls = [root_client.api.services.user.view(user.id) for _ in range(10)]
+            with pytest.raises(SyftException):
+                calls[0].get()
+
+    make_call.assert_called_once()
+    assert all(isinstance(call, BatchedAPICall) for call in calls)
+    assert all(call.get().id == user.id for call in calls)
+
+
+def test_api_batch_does_not_send_on_error(worker):
+    root_client = worker.root_client
+    with pytest.raises(ValueError):
+        with root_client.batch() as batch:
+            root_client.api.services.user.get_all()
+            raise ValueError
+    assert len(batch) == 1
+    assert not batch[0].is_sent
+    assert root_client.api.pending_batch is None
+
+
+def test_queued_signed_call_keeps_credentials(worker):
+    root_client = worker.root_client
+    api_call = SyftAPICall(
+        server_uid=worker.id,
+        path="user.view",
+        args=[root_client.users.get_all()[0].id],
+        kwargs={},
+    )
+    signed_call = api_call.sign(root_client.credentials)
+
+    with mock.patch.object(
+        worker, "add_queueitem_to_queue", return_value=None
+    ) as add_queueitem:
+        worker.add_api_call_to_queue(signed_call)
+
+    queue_item = add_queueitem.call_args.kwargs["queue_item"]
+    assert add_queueitem.call_args.kwargs["credentials"] == root_client.verify_key
+    assert queue_item.syft_client_verify_key == root_client.verify_key
+
+
+def test_serialized_api_cache(worker):
+    root_client = worker.root_client
+    guest_client = worker.guest_client
+    protocol = root_client.communication_protocol
+
+    etag, api_bytes = worker.get_serialized_api(
+        root_client.verify_key, communication_protocol=protocol
+    )
+    assert worker.get_serialized_api(
+        root_client.verify_key, communication_protocol=protocol
+    ) == (etag, api_bytes)
+    assert isinstance(sy.deserialize(api_bytes, from_bytes=True), sy.client.api.SyftAPI)
+
+    # a different role gets a different API
+    guest_etag, _ = worker.get_serialized_api(
+        guest_client.verify_key, communication_protocol=protocol
+    )
+    assert guest_etag != etag
+
+    # the user code and endpoints are read again only once they change
+    with mock.patch.object(
+        SyftAPI, "user_endpoints_for", wraps=SyftAPI.user_endpoints_for
+    ) as user_endpoints_for:
+        worker.get_serialized_api(
+            root_client.verify_key, communication_protocol=protocol
+        )
+        assert user_endpoints_for.call_count == 0
+
+        # new user code changes the API of its owner
+        @sy.syft_function()
+        def my_func():
+            return 1
+
+        assert root_client.code.submit(my_func)
+        new_etag, _ = worker.get_serialized_api(
+            root_client.verify_key, communication_protocol=protocol
+        )
+        assert new_etag != etag
+        assert user_endpoints_for.call_count > 0
+
+        reads = user_endpoints_for.call_count
+        worker.get_serialized_api(
+            root_client.verify_key, communication_protocol=protocol
+        )
+        assert user_endpoints_for.call_count == reads
+
+    # so does a renamed server
+    name = worker.name
+    worker.name = "renamed"
+    renamed_etag, _ = worker.get_serialized_api(
+        root_client.verify_key, communication_protocol=protocol
+    )
+    worker.name = name
+    assert renamed_etag != new_etag
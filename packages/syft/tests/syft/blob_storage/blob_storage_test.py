@@ -1,23 +1,36 @@
 # stdlib
+import asyncio
 import io
 import random
+import threading
+from urllib.parse import parse_qs
 
 # third party
 import numpy as np
+import pandas as pd
 import pytest
+import requests
 
 # syft absolute
 import syft as sy
 from syft import ActionObject
 from syft.client.datasite_client import DatasiteClient
+from syft.serde.array import read_array_slice
 from syft.service.blob_storage.util import can_upload_to_blob_storage
+from syft.service.blob_storage.util import estimate_serialized_size
 from syft.service.blob_storage.util import min_size_for_blob_storage_upload
 from syft.service.context import AuthedServiceContext
 from syft.service.response import SyftSuccess
 from syft.service.user.user import UserCreate
 from syft.store.blob_storage import BlobDeposit
-from syft.store.blob_storage import SyftObjectRetrieval
+from syft.store.blob_storage import BlobRetrievalByURL
+from syft.store.blob_storage import syft_iter_content_parallel
+from syft.store.blob_storage.on_disk import iter_file_range
+from syft.store.blob_storage.on_disk import local_blob_path
+from syft.store.blob_storage.on_disk import parse_range
+from syft.types.blob_storage import BlobFile
 from syft.types.blob_storage import CreateBlobStorageEntry
+from syft.types.blob_storage import LINE_INDEX_CACHE
 
 raw_data = {"test": "test"}
 data = sy.serialize(raw_data, to_bytes=True)
@@ -92,11 +105,67 @@ def test_blob_storage_read():
         authed_context, blob_deposit.blob_storage_entry_id
     )
 
-    assert isinstance(syft_retrieved_data, SyftObjectRetrieval)
+    assert isinstance(syft_retrieved_data, BlobRetrievalByURL)
     assert syft_retrieved_data.read() == raw_data
     worker.cleanup()
 
 
+def test_blob_storage_write_chunks(authed_context, blob_storage):
+    blob_data = CreateBlobStorageEntry.from_obj(data)
+    blob_deposit = blob_storage.allocate(authed_context, blob_data)
+    uid = blob_deposit.blob_storage_entry_id
+
+    chunks = [b"a" * 10, b"b" * 10, b"c" * 5]
+    offset = 0
+    for chunk in chunks:
+        res = blob_storage.write_to_disk(authed_context, uid, chunk, offset=offset)
+        assert isinstance(res, SyftSuccess)
+        offset += len(chunk)
+
+    retrieval = blob_storage.read(authed_context, uid)
+    path = local_blob_path(retrieval.url, authed_context.server.id)
+    assert path is not None
+    assert path.read_bytes() == b"".join(chunks)
+
+    # the url only holds the file name, the server resolves it in its blob directory
+    assert set(parse_qs(retrieval.url.query)) == {"expires", "signature"}
+
+    # a tampered url is not resolved
+    retrieval.url.query = retrieval.url.query.replace("signature=", "signature=0")
+    assert local_blob_path(retrieval.url, authed_context.server.id) is None
+
+
+def test_blob_storage_write_and_read_async(authed_context, blob_storage):
+    obj = list(range(1000))
+    content = sy.serialize(obj, to_bytes=True)
+    blob_data = CreateBlobStorageEntry.from_obj(content)
+    blob_deposit = blob_storage.allocate(authed_context, blob_data)
+    result = asyncio.run(blob_deposit.write_async(io.BytesIO(content)))
+    assert isinstance(result, SyftSuccess)
+
+    # without an async api connection the blob is read in a worker thread
+    retrieval = blob_storage.read(authed_context, blob_deposit.blob_storage_entry_id)
+    assert asyncio.run(retrieval.read_async()) == obj
+
+
+def test_blob_storage_read_range(tmp_path):
+    path = tmp_path / "blob"
+    content = bytes(range(256)) * 4
+    path.write_bytes(content)
+
+    assert b"".join(iter_file_range(path, chunk_size=100)) == content
+    assert b"".join(iter_file_range(path, 10, 20, chunk_size=3)) == content[10:20]
+    assert list(iter_file_range(path, 2000)) == []
+
+    assert parse_range(None, 1024) is None
+    assert parse_range("bytes=10-19", 1024) == (10, 20)
+    assert parse_range("bytes=1000-", 1024) == (1000, 1024)
+    assert parse_range("bytes=-24", 1024) == (1000, 1024)
+    assert parse_range("bytes=0-", 0) is None
+    with pytest.raises(ValueError):
+        parse_range("bytes=2000-", 1024)
+
+
 def test_blob_storage_delete(authed_context, blob_storage):
     blob_data = CreateBlobStorageEntry.from_obj(data)
     blob_deposit = blob_storage.allocate(authed_context, blob_data)
@@ -106,7 +175,46 @@ def test_blob_storage_delete(authed_context, blob_storage):
         blob_storage.read(authed_context, blob_deposit.blob_storage_entry_id)
 
 
-def test_action_obj_send_save_to_blob_storage(worker):
+class RangeResponse:
+    def __init__(self, content: bytes, range_header: str) -> None:
+        start, end = parse_range(range_header, len(content))
+        self.content = content[start:end]
+        self.status_code = 206
+
+    def __enter__(self) -> "RangeResponse":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        pass
+
+    def raise_for_status(self) -> None:
+        pass
+
+    def iter_content(self, chunk_size: int, decode_unicode: bool = False):
+        for offset in range(0, len(self.content), chunk_size):
+            yield self.content[offset : offset + chunk_size]
+
+
+def test_syft_iter_content_parallel(monkeypatch):
+    content = bytes(range(256)) * 100
+    requested = []
+
+    def get(url, stream, headers, timeout):
+        requested.append(headers["Range"])
+        return RangeResponse(content, headers["Range"])
+
+    monkeypatch.setattr(requests, "get", get)
+    monkeypatch.setattr("syft.store.blob_storage.DEFAULT_CHUNK_SIZE", 1000)
+
+    chunks = list(
+        syft_iter_content_parallel("http://blob", 300, len(content), max_workers=3)
+    )
+    assert b"".join(chunks) == content
+    assert all(len(chunk) <= 300 for chunk in chunks)
+    assert len(requested) == 26
+
+
+def test_action_obj_send_save_to_blob_storage(worker, flat_serde):
     # this small object should not be saved to blob storage
     data_small: np.ndarray = np.array([1, 2, 3])
     action_obj = ActionObject.from_obj(data_small)
@@ -131,9 +239,111 @@ def test_action_obj_send_save_to_blob_storage(worker):
     syft_retrieved_data = blob_storage.read(
         root_authed_ctx, action_obj_2.syft_blob_storage_entry_id
     )
-    assert isinstance(syft_retrieved_data, SyftObjectRetrieval)
+    assert isinstance(syft_retrieved_data, BlobRetrievalByURL)
     assert all(syft_retrieved_data.read() == data_big)
 
+    # a slice only reads the blocks of the rows it needs
+    assert syft_retrieved_data.supports_range_reads
+    data_slice = read_array_slice(syft_retrieved_data.read_range, slice(10, 20))
+    assert all(data_slice == data_big[10:20])
+
+
+def test_estimate_serialized_size():
+    # buffers are measured instead of serialized
+    array = np.arange(1024 * 1024, dtype=np.int64)
+    assert estimate_serialized_size(array) >= array.nbytes
+    assert estimate_serialized_size(array) < array.nbytes * 1.01
+
+    df = pd.DataFrame({"a": np.arange(1000), "b": ["x" * 100] * 1000})
+    assert estimate_serialized_size(df) >= df.memory_usage(deep=True).sum()
+    assert estimate_serialized_size(df["b"]) >= df["b"].memory_usage(deep=True)
+    numeric_df = pd.DataFrame({"a": np.arange(1000), "b": np.arange(1000) / 2})
+    assert estimate_serialized_size(numeric_df) >= numeric_df.memory_usage().sum()
+
+    # other objects are serialized in chunks which are counted
+    obj = {"test": list(range(1000))}
+    assert estimate_serialized_size(obj) == len(sy.serialize(obj, to_bytes=True))
+
+
+def test_blob_storage_read_range_and_lines(authed_context, blob_storage, monkeypatch):
+    lines = [f"line {i}".encode() for i in range(25)]
+    content = b"\n".join(lines)
+    blob_data = CreateBlobStorageEntry.from_obj(content)
+    blob_deposit = blob_storage.allocate(authed_context, blob_data)
+    blob_deposit.write(io.BytesIO(content))
+    retrieval = blob_storage.read(authed_context, blob_deposit.blob_storage_entry_id)
+
+    assert retrieval.read_range(5, 10) == content[5:15]
+    assert retrieval.read_range(-6) == content[-6:]
+    assert retrieval.read_range(-10, 4) == content[-10:-6]
+    assert retrieval.read_range(len(content) + 10, 5) == b""
+
+    monkeypatch.setattr(BlobFile, "_retrieval", lambda self: retrieval)
+    monkeypatch.setattr("syft.types.blob_storage.LINE_INDEX_STRIDE", 5)
+    blob_file = BlobFile(
+        file_name="lines.txt",
+        syft_blob_storage_entry_id=blob_deposit.blob_storage_entry_id,
+    )
+    assert blob_file.read_range(0, 6) == b"line 0"
+    assert blob_file.read_lines(0, 3, chunk_size=8) == lines[:3]
+    assert blob_file.read_lines(20, chunk_size=8) == lines[20:]
+    assert blob_file.read_lines(12, 14, chunk_size=8) == lines[12:14]
+    line_index = LINE_INDEX_CACHE[blob_deposit.blob_storage_entry_id]
+    assert line_index == [content.index(line) for line in lines[::5]]
+
+
+def test_blob_file_iter_lines(monkeypatch):
+    content = b"".join(f"line {i}\n".encode() for i in range(2500))
+    chunks = [content[i : i + 1000] for i in range(0, len(content), 1000)]
+    monkeypatch.setattr(BlobFile, "read", lambda self, **kwargs: iter(chunks))
+    blob_file = BlobFile(file_name="lines.txt", file_size=len(content))
+
+    lines = content.splitlines()
+    assert list(blob_file.iter_lines(buffer_lines=100)) == lines
+    *_, (total_read, last_line) = blob_file.iter_lines(progress=True)
+    assert total_read == len(content)
+    assert last_line == lines[-1]
+
+    batches = list(blob_file.iter_line_batches(1000))
+    assert [len(batch) for batch in batches] == [1000, 1000, 500]
+    assert sum(batches, []) == lines
+
+    record_batches = list(blob_file.iter_line_batches(1000, as_arrow=True))
+    assert record_batches[2].num_rows == 500
+    assert record_batches[0].column("line")[0].as_py() == lines[0]
+
+
+def test_blob_file_iter_lines_stops_reader(monkeypatch):
+    closed = threading.Event()
+
+    def read(self, **kwargs):
+        try:
+            while True:
+                yield b"line\n" * 100
+        finally:
+            closed.set()
+
+    monkeypatch.setattr(BlobFile, "read", read)
+    blob_file = BlobFile(file_name="lines.txt")
+
+    lines = blob_file.iter_lines(buffer_lines=10)
+    assert next(lines) == b"line"
+    lines.close()
+    # the reader thread stops instead of blocking on a full queue
+    assert closed.wait(timeout=5)
+
+
+def test_blob_file_iter_lines_raises_read_errors(monkeypatch):
+    def read(self, **kwargs):
+        yield b"line\n"
+        raise ValueError("connection lost")
+
+    monkeypatch.setattr(BlobFile, "read", read)
+    blob_file = BlobFile(file_name="lines.txt")
+
+    with pytest.raises(ValueError, match="connection lost"):
+        list(blob_file.iter_lines())
+
 
 def test_upload_dataset_save_to_blob_storage(worker):
     root_client: DatasiteClient = worker.root_client
@@ -172,7 +382,7 @@ def test_upload_dataset_save_to_blob_storage(worker):
         context=root_authed_ctx
     )
     assert len(blob_entries) == 1
-    data_big_retrieved: SyftObjectRetrieval = blob_storage.read(
+    data_big_retrieved: BlobRetrievalByURL = blob_storage.read(
         context=root_authed_ctx, uid=blob_entries[0].id
     )
     assert all(data_big_retrieved.read() == data_big)
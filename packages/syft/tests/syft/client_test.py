@@ -1,3 +1,24 @@
+# stdlib
+import asyncio
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+import threading
+
+# third party
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.client.api import SyftAPICall
+from syft.client.client import AsyncHTTPConnection
+from syft.client.client import HTTPConnection
+from syft.client.client import StreamedCallBody
+from syft.serde.serialize import _serialize_body
+from syft.server.credentials import SyftSigningKey
+from syft.service.response import SyftSuccess
+from syft.types.uid import UID
+
+
 def test_client_logged_in_user(worker):
     guest_client = worker.guest_client
     assert guest_client.logged_in_user == ""
@@ -15,3 +36,84 @@ def test_client_logged_in_user(worker):
     client = client.login(email="sheldon@caltech.edu", password="bazinga")
 
     assert client.logged_in_user == "sheldon@caltech.edu"
+
+
+class EchoAPIHandler(BaseHTTPRequestHandler):
+    # keeps connections alive between requests
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:
+        length = int(self.headers["Content-Length"])
+        self.rfile.read(length)
+        body = sy.serialize(SyftSuccess(message="ok"), to_bytes=True)
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def echo_server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), EchoAPIHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_http_connection_reuses_connections(echo_server_url):
+    connection = HTTPConnection(url=echo_server_url, pool_size=4)
+    signed_call = SyftAPICall(
+        server_uid=UID(), path="user.get_all", args=[], kwargs={}
+    ).sign(SyftSigningKey.generate())
+
+    for _ in range(5):
+        assert connection.make_call(signed_call).message == "ok"
+
+    metadata = connection.transport_metadata
+    assert metadata["pool_size"] == 4
+    assert metadata["requests_sent"] == 5
+    assert metadata["connections_opened"] == 1
+
+
+def test_streamed_call_body_is_serialized_again(flat_serde):
+    signed_call = SyftAPICall(
+        server_uid=UID(), path="blob_storage.write", args=[b"x" * 2**16], kwargs={}
+    ).sign(SyftSigningKey.generate())
+    chunks = _serialize_body(signed_call, chunk_size=1024)
+    assert not isinstance(chunks, bytes)
+    body = StreamedCallBody(signed_call, chunks)
+
+    # a retry of the session iterates the body again after the first attempt
+    first_attempt = b"".join(body)
+    second_attempt = b"".join(body)
+    assert second_attempt == first_attempt
+    assert sy.deserialize(second_attempt, from_bytes=True).message == (
+        signed_call.message
+    )
+
+
+def test_async_http_connection_gathers_calls(echo_server_url):
+    connection = AsyncHTTPConnection(HTTPConnection(url=echo_server_url))
+    signed_call = SyftAPICall(
+        server_uid=UID(), path="user.get_all", args=[], kwargs={}
+    ).sign(SyftSigningKey.generate())
+
+    async def make_calls() -> list:
+        async with connection:
+            return await asyncio.gather(
+                *[connection.make_call(signed_call) for _ in range(10)]
+            )
+
+    results = asyncio.run(make_calls())
+    assert [result.message for result in results] == ["ok"] * 10
+
+    # the pool is closed on exit and made again in the next event loop
+    assert connection._client is None
+    results = asyncio.run(make_calls())
+    assert [result.message for result in results] == ["ok"] * 10
+    assert connection._client is None
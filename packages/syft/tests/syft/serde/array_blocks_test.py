@@ -0,0 +1,61 @@
+# third party
+import numpy as np
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.serde.array import ArrayBlocks
+from syft.serde.array import read_array_slice
+
+pytestmark = pytest.mark.usefixtures("flat_serde")
+
+
+def make_read_range(blob: bytes, reads: list):
+    def read_range(offset: int, length: int | None = None) -> bytes:
+        reads.append((offset, length))
+        if offset < 0:
+            return blob[offset:]
+        return blob[offset : None if length is None else offset + length]
+
+    return read_range
+
+
+@pytest.mark.parametrize(
+    "key",
+    [
+        3,
+        -1,
+        slice(10, 20),
+        slice(None, None, -3),
+        slice(95, 5, -7),
+        (slice(40, 60), 1),
+        (7, slice(None, 2)),
+        slice(50, 50),
+        [1, 50, 99],
+    ],
+)
+def test_array_blocks_slice(key):
+    array = np.arange(300, dtype=np.int64).reshape(100, 3)
+    # 10 rows of 24 bytes per block
+    blob = sy.serialize(ArrayBlocks(array, block_size=240), to_bytes=True)
+    assert (sy.deserialize(blob, from_bytes=True) == array).all()
+
+    reads: list = []
+    result = read_array_slice(make_read_range(blob, reads), key)
+    assert result.shape == array[key].shape
+    assert (result == array[key]).all()
+
+
+def test_array_blocks_reads_only_needed_blocks():
+    array = np.arange(100_000, dtype=np.float64)
+    blob = sy.serialize(ArrayBlocks(array, block_size=8_000), to_bytes=True)
+
+    reads: list = []
+    result = read_array_slice(make_read_range(blob, reads), slice(0, 10))
+    assert (result == array[:10]).all()
+    assert sum(length for _, length in reads if length is not None) < len(blob) / 10
+
+
+def test_array_slice_of_other_blobs():
+    blob = sy.serialize(np.arange(10), to_bytes=True)
+    assert read_array_slice(make_read_range(blob, []), slice(0, 2)) is None
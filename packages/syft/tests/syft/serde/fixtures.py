@@ -1,7 +1,27 @@
 # third party
 import pytest
 
+# syft absolute
+from syft.util.experimental_flags import flags
+
 
 @pytest.fixture
 def numpy_syft_instance(guest_client):
     yield guest_client.api.lib.numpy
+
+
+def _set_flat_serde(value: bool):
+    previous = flags.FLAT_SERDE
+    flags.FLAT_SERDE = value
+    yield
+    flags.FLAT_SERDE = previous
+
+
+@pytest.fixture
+def flat_serde():
+    yield from _set_flat_serde(True)
+
+
+@pytest.fixture
+def legacy_serde():
+    yield from _set_flat_serde(False)
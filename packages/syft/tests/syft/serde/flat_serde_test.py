@@ -0,0 +1,112 @@
+# stdlib
+from collections import OrderedDict
+
+# third party
+import numpy as np
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.serde.flat import FLAT_MAGIC
+from syft.serde.flat import is_flat_blob
+from syft.serde.recursive import combine_bytes
+from syft.types.uid import UID
+from syft.util.experimental_flags import ApacheArrowCompression
+from syft.util.experimental_flags import flags
+
+pytestmark = pytest.mark.usefixtures("flat_serde")
+
+
+def nested_lists(depth: int, leaf: object) -> object:
+    obj = leaf
+    for _ in range(depth):
+        obj = [obj]
+    return obj
+
+
+OBJECTS = [
+    1,
+    -3.5,
+    "text",
+    b"bytes",
+    None,
+    [1, "two", (3.0, None)],
+    {"key": [1, 2], 3: {"nested": True}},
+    OrderedDict(a=1, b=2),
+    {1, 2, 3},
+    frozenset({"a"}),
+    UID(),
+]
+
+
+@pytest.mark.parametrize("obj", OBJECTS)
+def test_flat_serde_roundtrip(obj) -> None:
+    blob = sy.serialize(obj, to_bytes=True)
+    assert blob.startswith(FLAT_MAGIC)
+    assert sy.deserialize(blob, from_bytes=True) == obj
+
+
+def test_flat_serde_keeps_hashes_on_capnp() -> None:
+    obj = {"key": [1, 2], "uid": UID()}
+    blob = sy.serialize(obj, to_bytes=True, for_hashing=True)
+    assert not is_flat_blob(blob)
+
+    flags.FLAT_SERDE = False
+    assert sy.serialize(obj, to_bytes=True, for_hashing=True) == blob
+
+
+def test_flat_serde_numpy_roundtrip() -> None:
+    array = np.arange(12, dtype=np.float32).reshape(3, 4)
+    blob = sy.serialize({"array": array}, to_bytes=True)
+    result = sy.deserialize(blob, from_bytes=True)
+    assert (result["array"] == array).all()
+    assert result["array"].dtype == array.dtype
+
+
+@pytest.mark.parametrize("obj", OBJECTS)
+def test_flat_serde_reads_legacy_blobs(obj, legacy_serde) -> None:
+    legacy_blob = sy.serialize(obj, to_bytes=True)
+    assert not is_flat_blob(legacy_blob)
+
+    flags.FLAT_SERDE = True
+    assert sy.deserialize(legacy_blob, from_bytes=True) == obj
+
+
+def test_flat_serde_writes_nested_payload_once() -> None:
+    payload = np.random.bytes(2**20)
+    depth = 256
+    obj = nested_lists(depth, payload)
+
+    # every level adds a node of a few bytes instead of copying its children
+    blob = sy.serialize(obj, to_bytes=True)
+    assert blob.count(payload) == 1
+    assert len(blob) < len(payload) + depth * 64
+    assert sy.deserialize(blob, from_bytes=True) == obj
+
+
+def test_combine_bytes_joins_chunks() -> None:
+    chunk = b"chunk"
+    assert combine_bytes([chunk]) is chunk
+    assert combine_bytes([b"a", b"bc", b"def"]) == b"abcdef"
+
+
+@pytest.mark.parametrize("blob_type", [bytes, bytearray, memoryview])
+def test_deserialize_accepts_buffers(blob_type) -> None:
+    obj = {"text": "héllo", "number": -(2**70), "items": [1.5, None]}
+    blob = blob_type(sy.serialize(obj, to_bytes=True))
+    assert sy.deserialize(blob, from_bytes=True) == obj
+
+
+def test_numpy_deserialize_is_zero_copy() -> None:
+    compression = flags.APACHE_ARROW_COMPRESSION
+    flags.APACHE_ARROW_COMPRESSION = ApacheArrowCompression.NONE
+    try:
+        array = np.arange(2**16, dtype=np.int64)
+        message = bytearray(sy.serialize({"array": array}, to_bytes=True))
+        result = sy.deserialize(message, from_bytes=True)["array"]
+    finally:
+        flags.APACHE_ARROW_COMPRESSION = compression
+
+    assert (result == array).all()
+    assert result.flags.writeable
+    assert np.shares_memory(result, np.frombuffer(message, dtype=np.uint8))
@@ -0,0 +1,143 @@
+# stdlib
+import timeit
+
+# third party
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.serde.third_party import ARROW_IPC_MAGIC
+from syft.serde.third_party import deserialize_dataframe
+from syft.serde.third_party import deserialize_series
+from syft.util.experimental_flags import ARROW_IPC_CODECS
+from syft.util.experimental_flags import ApacheArrowCompression
+from syft.util.experimental_flags import flags
+
+
+def make_frame(rows: int) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "int": np.arange(rows),
+            "float": np.linspace(0, 1, rows),
+            "int32": np.arange(rows, dtype=np.int32),
+            "text": [f"row {i}" for i in range(rows)],
+        }
+    )
+
+
+def parquet_blob(df: pd.DataFrame) -> bytes:
+    # DataFrames as serialized before the Arrow IPC format
+    sink = pa.BufferOutputStream()
+    pq.write_table(pa.Table.from_pandas(df), sink)
+    return sink.getvalue().to_pybytes()
+
+
+def roundtrip(obj: object) -> object:
+    return sy.deserialize(bytearray(sy.serialize(obj, to_bytes=True)), from_bytes=True)
+
+
+@pytest.fixture(params=list(ARROW_IPC_CODECS))
+def ipc_compression(request):
+    previous = flags.APACHE_ARROW_IPC_COMPRESSION
+    flags.APACHE_ARROW_IPC_COMPRESSION = request.param
+    yield request.param
+    flags.APACHE_ARROW_IPC_COMPRESSION = previous
+
+
+def test_unsupported_ipc_compression() -> None:
+    with pytest.raises(ValueError):
+        flags.APACHE_ARROW_IPC_COMPRESSION = ApacheArrowCompression.SNAPPY
+
+
+def test_dataframe_roundtrip(ipc_compression) -> None:
+    df = make_frame(100)
+    df["time"] = pd.Timestamp("2024-01-01")
+    df["nullable"] = pd.array([None, *range(99)], dtype="Int64")
+    df["category"] = pd.Categorical(["a", "b"] * 50)
+    df.index = [f"idx {i}" for i in range(100)]
+
+    blob = sy.serialize(df, to_bytes=True)
+    result = sy.deserialize(blob, from_bytes=True)
+    pd.testing.assert_frame_equal(result, df)
+
+    # columns read back are writable
+    result.iloc[0, 0] = -1
+    result["float"] += 1
+
+
+@pytest.mark.parametrize("name", [None, "name", 3])
+def test_series_roundtrip(ipc_compression, name) -> None:
+    series = pd.Series(np.arange(10.0), name=name, index=range(10, 20))
+    result = roundtrip(series)
+    pd.testing.assert_series_equal(result, series)
+    result.iloc[0] = 1.5
+
+
+def test_mixed_series_roundtrip() -> None:
+    # object columns arrow has no type for fall back to the legacy encoding
+    series = pd.Series([1, "a", 2.0], name="mixed")
+    blob = sy.serialize(series, to_bytes=True)
+    pd.testing.assert_series_equal(sy.deserialize(blob, from_bytes=True), series)
+
+
+def test_dataframe_is_read_without_copies(flat_serde) -> None:
+    previous = flags.APACHE_ARROW_IPC_COMPRESSION
+    flags.APACHE_ARROW_IPC_COMPRESSION = ApacheArrowCompression.NONE
+    try:
+        df = make_frame(1000)
+        message = bytearray(sy.serialize(df, to_bytes=True))
+        result = sy.deserialize(message, from_bytes=True)
+    finally:
+        flags.APACHE_ARROW_IPC_COMPRESSION = previous
+
+    pd.testing.assert_frame_equal(result, df)
+    values = result["int"].to_numpy()
+    assert values.flags.writeable
+    assert np.shares_memory(values, np.frombuffer(message, dtype=np.uint8))
+
+
+def test_legacy_pandas_blobs_are_readable() -> None:
+    df = make_frame(10)
+    pd.testing.assert_frame_equal(deserialize_dataframe(parquet_blob(df)), df)
+
+    series = pd.Series([1.0, 2.0], name="values")
+    legacy_blob = sy.serialize(pd.DataFrame(series).to_dict(), to_bytes=True)
+    assert not legacy_blob.startswith(ARROW_IPC_MAGIC)
+    pd.testing.assert_series_equal(deserialize_series(legacy_blob), series)
+
+
+def rows_per_second(rows: int, func) -> float:
+    return rows / min(timeit.repeat(func, number=1, repeat=3))
+
+
+def test_pandas_serde_benchmark() -> None:
+    rows = 1_000_000
+    df = make_frame(rows).drop(columns="text")
+
+    ipc = rows_per_second(
+        rows, lambda: sy.deserialize(sy.serialize(df, to_bytes=True), from_bytes=True)
+    )
+    parquet = rows_per_second(rows, lambda: deserialize_dataframe(parquet_blob(df)))
+    print(f"DataFrame rows/sec: arrow ipc {ipc:,.0f}, parquet {parquet:,.0f}")
+    assert ipc > parquet
+
+    series = df["float"]
+    ipc = rows_per_second(
+        rows,
+        lambda: sy.deserialize(sy.serialize(series, to_bytes=True), from_bytes=True),
+    )
+    # serializing a dict of every cell is too slow for 1M rows
+    legacy_rows = 10_000
+    legacy_series = series[:legacy_rows]
+    legacy = rows_per_second(
+        legacy_rows,
+        lambda: deserialize_series(
+            sy.serialize(pd.DataFrame(legacy_series).to_dict(), to_bytes=True)
+        ),
+    )
+    print(f"Series rows/sec: arrow ipc {ipc:,.0f}, dict {legacy:,.0f}")
+    assert ipc > legacy * 10
@@ -0,0 +1,73 @@
+# stdlib
+import dataclasses
+
+# third party
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.serde.serializable import serializable
+from syft.types.syft_object_registry import SyftObjectRegistry
+from syft.types.uid import UID
+
+
+@serializable(attrs=["key", "value", "flag"])
+class PlannedObject:
+    __hash_exclude_attrs__ = ["flag"]
+
+    def __init__(self, key, value, flag=None):
+        self.key = key
+        self.value = value
+        self.flag = flag
+
+    def __eq__(self, other):
+        return (self.key, self.value, self.flag) == (
+            other.key,
+            other.value,
+            other.flag,
+        )
+
+
+def test_serde_plan_is_cached() -> None:
+    obj = PlannedObject("key", "value")
+    plan = SyftObjectRegistry.get_serde_plan_for(obj)
+    assert SyftObjectRegistry.get_serde_plan_for(obj) is plan
+    assert SyftObjectRegistry.get_serde_plan(plan.canonical_name, plan.version) is plan
+    assert plan.cls is PlannedObject
+    assert [name for name, _ in plan.fields] == ["flag", "key", "value"]
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        plan.fields = ()
+
+
+def test_serde_plan_for_hashing_excludes_attrs() -> None:
+    obj = PlannedObject("key", "value", flag=True)
+    plan = SyftObjectRegistry.get_serde_plan_for(obj, for_hashing=True)
+    assert [name for name, _ in plan.fields] == ["key", "value"]
+
+    assert sy.serialize(obj, to_bytes=True, for_hashing=True) == sy.serialize(
+        PlannedObject("key", "value", flag=False), to_bytes=True, for_hashing=True
+    )
+
+
+def test_serde_plan_overrides() -> None:
+    uid = UID()
+    plan = SyftObjectRegistry.get_serde_plan_for(uid)
+    assert "value" in plan.field_serializers
+    assert "value" in plan.field_deserializers
+    assert sy.deserialize(sy.serialize(uid, to_bytes=True), from_bytes=True) == uid
+
+
+def test_serde_plan_invalidated_on_register() -> None:
+    obj = PlannedObject("key", "value")
+    plan = SyftObjectRegistry.get_serde_plan_for(obj)
+
+    serializable(attrs=["key", "value"], inherit=False)(PlannedObject)
+    try:
+        new_plan = SyftObjectRegistry.get_serde_plan_for(obj)
+        assert new_plan is not plan
+        assert [name for name, _ in new_plan.fields] == ["key", "value"]
+    finally:
+        serializable(attrs=["key", "value", "flag"], inherit=False)(PlannedObject)
+
+    assert sy.deserialize(sy.serialize(obj, to_bytes=True), from_bytes=True) == obj
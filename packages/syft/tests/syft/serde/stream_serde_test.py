@@ -0,0 +1,76 @@
+# stdlib
+import io
+import tempfile
+
+# third party
+import numpy as np
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.serde.flat import rs_object2flat_chunks
+from syft.serde.serialize import _serialize_body
+from syft.serde.serialize import _serialize_chunks
+from syft.types.uid import UID
+from syft.util.experimental_flags import flags
+
+pytestmark = pytest.mark.usefixtures("flat_serde")
+
+OBJ = {
+    "uid": UID(),
+    "items": [1, "two", (3.0, None), b"\x00" * 1024],
+    "nested": {"array": np.arange(1024)},
+}
+
+
+def assert_equal(result: dict) -> None:
+    assert result["uid"] == OBJ["uid"]
+    assert result["items"] == OBJ["items"]
+    assert (result["nested"]["array"] == OBJ["nested"]["array"]).all()
+
+
+@pytest.mark.parametrize("flat", [True, False])
+def test_serialize_to_roundtrip(flat: bool) -> None:
+    previous = flags.FLAT_SERDE
+    flags.FLAT_SERDE = flat
+    try:
+        with tempfile.TemporaryFile() as stream:
+            size = sy.serialize_to(OBJ, stream)
+            assert stream.tell() == size
+            stream.seek(0)
+            result = sy.deserialize_from(stream)
+    finally:
+        flags.FLAT_SERDE = previous
+
+    assert_equal(result)
+
+
+def test_serialize_chunks_match_serialize() -> None:
+    chunks = list(_serialize_chunks(OBJ, chunk_size=64))
+    assert len(chunks) > 1
+    assert b"".join(chunks) == sy.serialize(OBJ, to_bytes=True)
+    assert_equal(sy.deserialize_from(iter(chunks)))
+
+
+def test_serialize_chunks_hand_out_large_leaves() -> None:
+    payload = b"x" * 2**20
+    chunks = list(rs_object2flat_chunks([1, payload, 2], chunk_size=1024))
+    assert any(chunk is payload for chunk in chunks)
+    assert sy.deserialize_from(chunks) == [1, payload, 2]
+
+
+def test_deserialize_from_sized_stream() -> None:
+    blob = sy.serialize(OBJ, to_bytes=True)
+    stream = io.BufferedReader(io.BytesIO(blob + b"trailing data"))
+    assert_equal(sy.deserialize_from(stream, size=len(blob)))
+
+    with pytest.raises(ValueError):
+        sy.deserialize_from(io.BytesIO(blob), size=len(blob) + 1)
+
+
+def test_serialize_body() -> None:
+    assert _serialize_body([1, 2]) == sy.serialize([1, 2], to_bytes=True)
+
+    body = _serialize_body(b"x" * 2**16, chunk_size=1024)
+    assert not isinstance(body, bytes)
+    assert sy.deserialize_from(body) == b"x" * 2**16
@@ -0,0 +1,44 @@
+# third party
+import numpy as np
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.serde.arrow import ARROW_IPC_MAGIC
+from syft.serde.arrow import numpy_deserialize
+from syft.serde.arrow import numpy_serialize
+
+
+@pytest.mark.parametrize(
+    "array",
+    [
+        np.array(["héllo", "b", "", "dd"]).reshape(2, 2),
+        np.array(["x" * 10, "y"], dtype="<U12"),
+        np.array([], dtype=str),
+        np.array("scalar"),
+        np.array(["a", None, "c"], dtype=object),
+        np.array(["a\x00b", "\x00c"]),
+    ],
+)
+def test_string_array_roundtrip(array: np.ndarray) -> None:
+    blob = numpy_serialize(array)
+    assert blob.startswith(ARROW_IPC_MAGIC)
+
+    result = sy.deserialize(sy.serialize(array, to_bytes=True), from_bytes=True)
+    assert result.dtype == array.dtype
+    assert result.shape == array.shape
+    assert (result == array).all()
+
+
+def test_string_array_is_compact() -> None:
+    array = np.array([f"string {i}" for i in range(10_000)])
+    utf8_size = sum(len(s) for s in array)
+    assert len(numpy_serialize(array)) < utf8_size * 2
+
+
+def test_legacy_string_array_is_readable() -> None:
+    # ["ab", "é"] in the old layout, every byte, offset and dimension as uint64
+    encoded = list(b"ab" + "é".encode())
+    legacy = np.array([*encoded, 2, 4, 2, 2, 1], dtype=np.uint64)
+    result = numpy_deserialize(sy.serialize(legacy, to_bytes=True))
+    assert (result == np.array(["ab", "é"])).all()
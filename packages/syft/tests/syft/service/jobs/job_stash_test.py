@@ -2,12 +2,16 @@
 from datetime import datetime
 from datetime import timedelta
 from datetime import timezone
+from threading import Timer
+import time
 
 # third party
 import pytest
 
 # syft absolute
 import syft as sy
+from syft.service.job.job_events import JOB_EVENTS_WAIT_INTERVAL_SEC
+from syft.service.job.job_events import JobEvents
 from syft.service.job.job_stash import Job
 from syft.service.job.job_stash import JobStatus
 from syft.types.uid import UID
@@ -58,3 +62,53 @@ def test_job_no_consumer(worker):
     job = client.code.process_all(blocking=False)
     res = job.wait()
     assert not res, "Should return error when no consumers are available"
+
+
+def test_job_events_wait():
+    events = JobEvents()
+    uid, other = UID(), UID()
+
+    since = events.generation
+    assert not events.wait([uid], since, timeout=0.1)
+
+    events.notify(other)
+    assert not events.wait([uid], since, timeout=0.1)
+
+    # resolved before the wait started, but after the generation was read
+    events.notify(uid)
+    assert events.wait([uid, UID()], since, timeout=0)
+
+    since = events.generation
+    Timer(0.1, events.notify, args=(uid,)).start()
+    assert events.wait([uid], since, timeout=5)
+
+    # a single wait is short, so waiters re-check the store for missed notifications
+    start = time.time()
+    assert not events.wait([UID()], events.generation, timeout=60)
+    assert time.time() - start < JOB_EVENTS_WAIT_INTERVAL_SEC + 1
+
+
+def test_job_result_id():
+    result = sy.ActionObject.from_obj(1)
+    job = Job(id=UID(), server_uid=UID(), result=result)
+    assert job.result_id() == result.id.id
+
+    assert Job(id=UID(), server_uid=UID()).result_id() is None
+    assert "result_id" in Job._syft_searchable_keys_dict()
+
+
+def test_job_stash_get_by_result_id(worker):
+    stash = worker.get_service("jobservice").stash
+    credentials = worker.root_client.verify_key
+    result = sy.ActionObject.from_obj(1)
+    job = Job(id=UID(), server_uid=worker.id, result=result)
+    assert stash.set(credentials, job).is_ok()
+    assert stash.set(credentials, Job(id=UID(), server_uid=worker.id)).is_ok()
+
+    res = stash.get_by_result_id(credentials, result.id.id)
+    assert res.is_ok()
+    assert res.ok().id == job.id
+
+    res = stash.get_by_result_id(credentials, UID())
+    assert res.is_ok()
+    assert res.ok() is None
@@ -362,3 +362,22 @@ def test_user_register_for_role(monkeypatch: MonkeyPatch, faker: Faker):
             [u.email in emails_added for u in root_client.users.get_all()]
         )
         assert users_created_count == len(emails_added)
+
+
+def test_server_settings_cache(worker) -> None:
+    settings = worker.settings
+    signup_enabled = settings.signup_enabled
+
+    # repeated reads come from the cache, as copies of the cached settings
+    with mock.patch.object(worker.settings_stash, "get_all") as get_all:
+        assert worker.settings.id == settings.id
+        assert worker.settings is not settings
+        assert worker.metadata.name == settings.name
+        get_all.assert_not_called()
+
+    settings.name = "changed by a caller"
+    assert worker.settings.name != settings.name
+
+    # writes through the settings service are applied to the cache right away
+    assert worker.root_client.settings.allow_guest_signup(enable=not signup_enabled)
+    assert worker.settings.signup_enabled != signup_enabled
@@ -444,3 +444,22 @@ def test_basestash_cannot_query_non_searchable(
     assert base_stash.query_all(
         root_verify_key, QueryKeys(qks=[qk, UIDPartitionKey.with_obj(obj.id)])
     ).is_err()
+
+
+def test_basestash_notify_listeners(base_stash: MockStash, caplog) -> None:
+    received = []
+
+    def failing_listener(*args: Any) -> None:
+        raise ValueError("listener failed")
+
+    base_stash.add_listener(failing_listener)
+    base_stash.add_listener(received.append)
+
+    # a failing listener is logged, and does not stop the others
+    base_stash._notify(1)
+    assert received == [1]
+    assert "listener failed" in caplog.text
+
+    base_stash.remove_listener(received.append)
+    base_stash._notify(2)
+    assert received == [1]
@@ -5,8 +5,16 @@ from threading import Thread
 import pytest
 
 # syft absolute
+from syft.serde.serializable import serializable
+from syft.store.document_store import PartitionKey
+from syft.store.document_store import PartitionSettings
 from syft.store.document_store import QueryKeys
+from syft.store.sqlite_document_store import SQLiteStoreClientConfig
+from syft.store.sqlite_document_store import SQLiteStoreConfig
 from syft.store.sqlite_document_store import SQLiteStorePartition
+from syft.types.syft_object import SYFT_OBJECT_VERSION_1
+from syft.types.syft_object import SyftObject
+from syft.types.uid import UID
 
 # relative
 from .store_fixtures_test import sqlite_store_partition_fn
@@ -14,6 +22,47 @@ from .store_mocks_test import MockObjectType
 from .store_mocks_test import MockSyftObject
 
 
+@serializable()
+class MockIndexedObject(SyftObject):
+    __canonical_name__ = "MockIndexedObject"
+    __version__ = SYFT_OBJECT_VERSION_1
+
+    name: str
+    group: str
+    parents: list[UID] = []
+
+    __attr_unique__ = ["name"]
+    __attr_searchable__ = ["group", "parents"]
+
+
+NamePartitionKey = PartitionKey(key="name", type_=str)
+GroupPartitionKey = PartitionKey(key="group", type_=str)
+ParentsPartitionKey = PartitionKey(key="parents", type_=list[UID])
+
+
+def indexed_store_partition(root_verify_key, sqlite_workspace) -> SQLiteStorePartition:
+    workspace, db_name = sqlite_workspace
+    store_config = SQLiteStoreConfig(
+        client_config=SQLiteStoreClientConfig(filename=db_name, path=workspace)
+    )
+    settings = PartitionSettings(name="indexed", object_type=MockIndexedObject)
+    store = SQLiteStorePartition(
+        UID(), root_verify_key, settings=settings, store_config=store_config
+    )
+    assert store.init_store().is_ok()
+    return store
+
+
+def find_names(store, root_verify_key, index_qks=(), search_qks=()) -> set[str]:
+    res = store.find_index_or_search_keys(
+        root_verify_key,
+        index_qks=QueryKeys(qks=list(index_qks)),
+        search_qks=QueryKeys(qks=list(search_qks)),
+    )
+    assert res.is_ok()
+    return {obj.name for obj in res.ok()}
+
+
 def test_sqlite_store_partition_sanity(
     sqlite_store_partition: SQLiteStorePartition,
 ) -> None:
@@ -518,3 +567,102 @@ def test_sqlite_store_partition_set_delete_threading(
 #         ).ok()
 #     )
 #     assert stored_cnt == 0
+
+
+def test_sqlite_store_partition_keys_are_indexed_per_entry(
+    root_verify_key, sqlite_workspace
+) -> None:
+    store = indexed_store_partition(root_verify_key, sqlite_workspace)
+    parent = UID()
+    objs = [
+        MockIndexedObject(name="a", group="x", parents=[parent]),
+        MockIndexedObject(name="b", group="x"),
+        MockIndexedObject(name="c", group="y", parents=[UID(), parent]),
+    ]
+    for obj in objs:
+        assert store.set(root_verify_key, obj).is_ok()
+
+    # one row per (key, value, uid)
+    assert len(store.unique_keys) == 2 * len(objs)
+    assert len(store.searchable_keys) == 6
+
+    assert find_names(store, root_verify_key, [NamePartitionKey.with_obj("b")]) == {"b"}
+    by_group = [GroupPartitionKey.with_obj("x")]
+    assert find_names(store, root_verify_key, search_qks=by_group) == {"a", "b"}
+    by_parent = [ParentsPartitionKey.with_obj([parent])]
+    assert find_names(store, root_verify_key, search_qks=by_parent) == {"a", "c"}
+
+    duplicate = MockIndexedObject(name="a", group="z")
+    assert store.set(root_verify_key, duplicate).is_err()
+
+    qk = store.settings.store_key.with_obj(objs[0])
+    updated = MockIndexedObject(id=objs[0].id, name="d", group="y")
+    assert store.update(root_verify_key, qk, updated).is_ok()
+    assert not find_names(store, root_verify_key, [NamePartitionKey.with_obj("a")])
+    by_group = [GroupPartitionKey.with_obj("y")]
+    assert find_names(store, root_verify_key, search_qks=by_group) == {"c", "d"}
+    assert find_names(store, root_verify_key, search_qks=by_parent) == {"c"}
+
+    assert store.delete(root_verify_key, qk).is_ok()
+    assert find_names(store, root_verify_key, search_qks=by_group) == {"c"}
+    assert len(store.unique_keys) == 2 * (len(objs) - 1)
+    assert len(store.searchable_keys) == 4
+
+
+def test_sqlite_store_partition_rebuilds_missing_keys(
+    root_verify_key, sqlite_workspace
+) -> None:
+    store = indexed_store_partition(root_verify_key, sqlite_workspace)
+    for idx in range(5):
+        obj = MockIndexedObject(name=str(idx), group=str(idx % 2))
+        assert store.set(root_verify_key, obj).is_ok()
+
+    # data written before the keys had their own tables
+    store.unique_keys.clear()
+    store.searchable_keys.clear()
+    index = store.unique_keys
+    index._execute("delete from index_version")
+    legacy_table = f"{store.settings.name}_unique_keys"
+    index._execute(f"create table {legacy_table} (uid TEXT)")
+
+    store = indexed_store_partition(root_verify_key, sqlite_workspace)
+    assert len(store.unique_keys) == 10
+    by_group = [GroupPartitionKey.with_obj("1")]
+    assert find_names(store, root_verify_key, search_qks=by_group) == {"1", "3"}
+    res = store.unique_keys._execute(
+        "select name from sqlite_master where name = ?", [legacy_table]
+    )
+    assert res.ok().fetchone() is None
+
+
+def test_sqlite_store_partition_skips_indexed_keys(
+    root_verify_key, sqlite_workspace
+) -> None:
+    store = indexed_store_partition(root_verify_key, sqlite_workspace)
+    obj = MockIndexedObject(name="a", group="x")
+    assert store.set(root_verify_key, obj).is_ok()
+    assert store.unique_keys.version() is not None
+
+    # an up to date index is not rebuilt on start
+    store.searchable_keys.clear()
+    store = indexed_store_partition(root_verify_key, sqlite_workspace)
+    assert len(store.searchable_keys) == 0
+
+
+def test_sqlite_store_partition_indexes_new_keys(
+    root_verify_key, sqlite_workspace
+) -> None:
+    store = indexed_store_partition(root_verify_key, sqlite_workspace)
+    for idx in range(4):
+        obj = MockIndexedObject(name=str(idx), group=str(idx % 2))
+        assert store.set(root_verify_key, obj).is_ok()
+
+    # data indexed before `group` was searchable
+    index = store.searchable_keys
+    index._execute(f"delete from {index.table_name} where key = ?", ["group"])
+    index.set_version(index.version().replace("group", ""))
+
+    store = indexed_store_partition(root_verify_key, sqlite_workspace)
+    assert len(store.unique_keys) == 8
+    by_group = [GroupPartitionKey.with_obj("0")]
+    assert find_names(store, root_verify_key, search_qks=by_group) == {"0", "2"}
@@ -10,6 +10,8 @@ from result import Ok
 # syft absolute
 from syft.server.credentials import SyftVerifyKey
 from syft.server.worker import Worker
+from syft.service.action.action_permissions import ActionObjectPermission
+from syft.service.action.action_permissions import ActionPermission
 from syft.service.context import AuthedServiceContext
 from syft.service.context import ServerServiceContext
 from syft.service.context import UnauthedServiceContext
@@ -662,3 +664,40 @@ def test_userservice_exchange_credentials_get_email_fails(
     response = user_service.exchange_credentials(unauthed_context)
     assert isinstance(response, SyftError)
     assert response.message == expected_error_msg
+
+
+def test_userservice_role_cache(
+    user_service: UserService,
+    authed_context: AuthedServiceContext,
+    guest_user: User,
+) -> None:
+    verify_key = guest_user.verify_key
+    credentials = authed_context.credentials
+
+    # unknown keys are guests, the second lookup is served from the cache
+    assert user_service.get_role_for_credentials(verify_key) == ServiceRole.GUEST
+    assert user_service.get_role_for_credentials(verify_key) == ServiceRole.GUEST
+    assert user_service.role_cache_hits == 1
+    assert user_service.role_cache_misses == 1
+
+    # storing, updating and deleting the user invalidate its role
+    guest_user.role = ServiceRole.DATA_SCIENTIST
+    user_service.stash.set(
+        credentials,
+        guest_user,
+        add_permissions=[
+            ActionObjectPermission(
+                uid=guest_user.id, permission=ActionPermission.ALL_READ
+            ),
+        ],
+    )
+    assert (
+        user_service.get_role_for_credentials(verify_key) == ServiceRole.DATA_SCIENTIST
+    )
+
+    guest_user.role = ServiceRole.DATA_OWNER
+    user_service.stash.update(credentials, guest_user, has_permission=True)
+    assert user_service.get_role_for_credentials(verify_key) == ServiceRole.DATA_OWNER
+
+    user_service.stash.delete_by_uid(credentials, guest_user.id, has_permission=True)
+    assert user_service.get_role_for_credentials(verify_key) == ServiceRole.GUEST
@@ -1,25 +1,47 @@
 # stdlib
 from collections import defaultdict
+import multiprocessing
+import os
 from secrets import token_hex
 import sys
+import threading
 from time import sleep
+from types import SimpleNamespace
 
 # third party
 from faker import Faker
+import psutil
 import pytest
 from zmq import Socket
 
 # syft absolute
 import syft
+from syft.server.server import ServerRegistry
+from syft.server.worker_settings import WorkerSettings
+from syft.service.context import AuthedServiceContext
+from syft.service.queue import queue
 from syft.service.queue.base_queue import AbstractMessageHandler
+from syft.service.queue.queue import JobWorkerPool
 from syft.service.queue.queue import QueueManager
+from syft.service.queue.queue_stash import QueueItem
+from syft.service.queue.queue_stash import Status
+from syft.service.queue.zmq_queue import DispatchQueue
+from syft.service.queue.zmq_queue import QueueMsgProtocol
+from syft.service.queue.zmq_queue import RateMeter
+from syft.service.queue.zmq_queue import Timeout
+from syft.service.queue.zmq_queue import Worker
 from syft.service.queue.zmq_queue import ZMQClient
 from syft.service.queue.zmq_queue import ZMQClientConfig
 from syft.service.queue.zmq_queue import ZMQConsumer
 from syft.service.queue.zmq_queue import ZMQProducer
 from syft.service.queue.zmq_queue import ZMQQueueConfig
+from syft.service.queue.zmq_queue import ZMQQueueNotifier
 from syft.service.response import SyftError
 from syft.service.response import SyftSuccess
+from syft.service.user.user_roles import ServiceRole
+from syft.service.worker.worker_pool_service import SyftWorkerPoolService
+from syft.store.linked_obj import LinkedObject
+from syft.types.uid import UID
 from syft.util.util import get_queue_address
 from syft.util.util import get_random_available_port
 
@@ -150,6 +172,37 @@ def consumer(producer):
     del consumer
 
 
+@pytest.mark.flaky(reruns=3, reruns_delay=3)
+@pytest.mark.skipif(sys.platform == "win32", reason="does not run on windows")
+def test_zmq_consumer_queue_item(producer, consumer):
+    received = []
+
+    class MyMessageHandler(AbstractMessageHandler):
+        queue_name = producer.queue_name
+
+        @classmethod
+        def handle_queue_item(cls, queue_item, message, syft_worker_id):
+            received.append((queue_item, message))
+
+    consumer.message_handler = MyMessageHandler
+    consumer.run()
+    sleep(0.2)
+
+    item = UID()
+    message = syft.serialize(item, to_bytes=True)
+    worker = producer.require_worker(consumer.id.encode())
+    producer.send_to_worker(
+        worker, QueueMsgProtocol.W_QUEUE_ITEM, [str(UID()).encode(), message]
+    )
+    sleep(0.2)
+
+    # the item arrives deserialized, together with its bytes
+    assert received == [(item, message)]
+
+    producer.close()
+    consumer.close()
+
+
 @pytest.mark.flaky(reruns=3, reruns_delay=3)
 @pytest.mark.skipif(sys.platform == "win32", reason="does not run on windows")
 def test_zmq_pub_sub(faker: Faker, producer, consumer):
@@ -203,6 +256,38 @@ def test_zmq_pub_sub(faker: Faker, producer, consumer):
     assert consumer.alive is False
 
 
+@pytest.mark.flaky(reruns=3, reruns_delay=3)
+@pytest.mark.skipif(sys.platform == "win32", reason="does not run on windows")
+def test_zmq_queue_notifier(producer):
+    producer.run()
+    notifier = ZMQQueueNotifier(producer.address)
+
+    uid = UID()
+    notifier.notify(uid)
+
+    assert producer.new_items.get(timeout=5) == uid
+    # the notifier is not registered as a worker
+    assert len(producer.workers) == 0
+
+    notifier.close()
+    producer.close()
+
+
+def test_server_stop_closes_queue_notifier(worker):
+    address = get_queue_address(get_random_available_port())
+    worker.add_queue_notifier(address)
+    notifier = worker.queue_notifier
+    assert notifier.notify in worker.queue_stash._listeners()
+    assert notifier.notify_job_resolved in worker.job_stash._listeners()
+
+    worker.stop()
+
+    assert worker.queue_notifier is None
+    assert notifier.notify not in worker.queue_stash._listeners()
+    assert notifier.notify_job_resolved not in worker.job_stash._listeners()
+    assert notifier.socket.closed
+
+
 @pytest.fixture
 def queue_manager():
     # Create a consumer
@@ -276,3 +361,234 @@ def test_zmq_client_serde():
     deser = syft.deserialize(bytes_data, from_bytes=True)
 
     assert type(deser) == type(client)
+
+
+def test_zmq_queue_config_serde():
+    config = ZMQQueueConfig(isolate_jobs=True)
+
+    bytes_data = syft.serialize(config, to_bytes=True)
+
+    deser = syft.deserialize(bytes_data, from_bytes=True)
+
+    assert deser.isolate_jobs is True
+    assert ZMQQueueConfig().isolate_jobs is False
+
+
+def test_rate_meter():
+    meter = RateMeter(window_sec=10)
+    assert meter.per_sec() == 0
+
+    meter.add()
+    meter.add(4)
+
+    assert meter.total == 5
+    assert meter.per_sec() == 0.5
+
+
+def test_dispatch_queue():
+    queue = DispatchQueue(max_depth=5)
+    assert queue.pop() is None
+
+    assert queue.push(b"a1", owner="a")
+    assert queue.push(b"a2", owner="a")
+    assert queue.push(b"a3", owner="a")
+    assert queue.push(b"b1", owner="b")
+    assert queue.push(b"c1", owner="c", priority=0)
+
+    # full, the producer holds back the item
+    assert queue.is_full()
+    assert not queue.push(b"b2", owner="b")
+    assert len(queue) == 5
+
+    # lower priority class first, then owners take turns
+    assert [queue.pop() for _ in range(5)] == [b"c1", b"a1", b"b1", b"a2", b"a3"]
+    assert len(queue) == 0
+    assert not queue
+    assert queue.pop() is None
+
+
+def fake_load_queue_item(worker, message: bytes) -> SimpleNamespace:
+    # the test items are file paths, the job writes the pid of its process there
+    return SimpleNamespace(path=message.decode(), syft_client_verify_key=None)
+
+
+def fake_execute_queue_item(worker, queue_item, credentials) -> None:
+    path = queue_item.path
+    if path.endswith("hang"):
+        sleep(60)
+    with open(path, "w") as f:
+        f.write(str(os.getpid()))
+
+
+@pytest.fixture
+def job_worker_pool(worker, monkeypatch):
+    # forked processes inherit the patched module, so no Server is built in them
+    monkeypatch.setattr(queue, "build_job_worker", lambda worker_settings: None)
+    monkeypatch.setattr(queue, "load_queue_item", fake_load_queue_item)
+    monkeypatch.setattr(queue, "execute_queue_item", fake_execute_queue_item)
+    pool = JobWorkerPool(WorkerSettings.from_server(worker))
+    yield pool
+    pool.close()
+
+
+@pytest.mark.skipif(
+    multiprocessing.get_start_method() != "fork", reason="needs forked processes"
+)
+def test_job_worker_pool_reuses_processes(job_worker_pool, tmp_path):
+    pids = []
+    for name in ["job_1", "job_2"]:
+        path = tmp_path / name
+        job_worker_pool.run(str(path).encode(), on_start=pids.append)
+        assert path.read_text() == str(pids[-1])
+
+    # both items ran in the same process, which is idle again
+    assert pids[0] == pids[1]
+    assert [process.pid for process, _ in job_worker_pool.idle] == pids[:1]
+
+
+@pytest.mark.skipif(
+    multiprocessing.get_start_method() != "fork", reason="needs forked processes"
+)
+def test_job_worker_pool_replaces_killed_processes(job_worker_pool, tmp_path):
+    pids = []
+
+    def kill_job(pid: int | None) -> None:
+        # like MonitorThread.terminate, the process is killed together with its job
+        pids.append(pid)
+        threading.Timer(0.5, psutil.Process(pid).terminate).start()
+
+    job_worker_pool.run(str(tmp_path / "hang").encode(), on_start=kill_job)
+    assert not psutil.pid_exists(pids[0])
+    assert not (tmp_path / "hang").exists()
+
+    path = tmp_path / "job"
+    job_worker_pool.run(str(path).encode(), on_start=pids.append)
+    assert pids[1] != pids[0]
+    assert path.read_text() == str(pids[1])
+
+
+@pytest.mark.skipif(
+    multiprocessing.get_start_method() != "fork", reason="needs forked processes"
+)
+def test_job_worker_pool_close(job_worker_pool):
+    processes = [process for process, _ in job_worker_pool.idle]
+    assert all(process.is_alive() for process in processes)
+
+    job_worker_pool.close()
+
+    assert job_worker_pool.idle == []
+    assert not any(process.is_alive() for process in processes)
+    assert all(process.exitcode is not None for process in processes)
+
+
+def test_consumer_worker_is_built_once(worker, monkeypatch):
+    built = []
+
+    def build_job_worker(worker_settings):
+        built.append(worker_settings.id)
+        return build_server(worker_settings)
+
+    build_server = queue.build_job_worker
+    monkeypatch.setattr(queue, "build_job_worker", build_job_worker)
+    monkeypatch.setattr(queue, "CONSUMER_WORKERS", {})
+    worker_settings = WorkerSettings.from_server(worker)
+
+    consumer_worker = queue.get_consumer_worker(worker_settings)
+    assert consumer_worker.id == worker.id
+    assert consumer_worker is not worker
+    assert queue.get_consumer_worker(worker_settings) is consumer_worker
+    assert built == [worker.id]
+
+    other_settings = WorkerSettings.from_server(worker)
+    other_settings.id = UID()
+    other_worker = queue.get_consumer_worker(other_settings)
+    assert other_worker is not consumer_worker
+    assert built == [worker.id, other_settings.id]
+    ServerRegistry.remove_server(other_settings.id)
+
+
+@pytest.fixture
+def worker_producer(worker):
+    context = AuthedServiceContext(
+        server=worker, credentials=worker.verify_key, role=ServiceRole.ADMIN
+    )
+    producer = ZMQProducer(
+        port=get_random_available_port(),
+        queue_name=token_hex(8),
+        queue_stash=worker.queue_stash,
+        worker_stash=worker.worker_stash,
+        context=context,
+        max_queue_depth=1,
+    )
+    yield producer
+    producer.close()
+
+
+def test_zmq_producer_holds_items_of_full_worker_pools(
+    worker, worker_producer, monkeypatch
+):
+    pool_stash = worker.get_service(SyftWorkerPoolService).stash
+    worker_pool = pool_stash.get_all(worker.verify_key).ok()[0]
+    linked_worker_pool = LinkedObject.from_obj(
+        worker_pool, server_uid=worker.id, service_type=SyftWorkerPoolService
+    )
+    service = worker_producer.get_service(worker_pool.name)
+
+    items = []
+    for _ in range(3):
+        item = QueueItem(
+            server_uid=worker.id,
+            method="dummy_method",
+            service="dummy_service",
+            args=[],
+            kwargs={},
+            worker_pool=linked_worker_pool,
+        )
+        worker.queue_stash.set(worker.verify_key, item)
+        worker_producer.queue_item_by_uid(item.id)
+        items.append(item)
+
+    # the first item fills the requests, the others are held back in order
+    assert len(service.requests) == 1
+    assert list(worker_producer.held_items[worker_pool.name]) == [
+        item.id for item in items[1:]
+    ]
+    assert worker_producer.retry_items == {}
+
+    # held items are only read again once dispatch made room for them
+    reads = []
+    get_by_uid = worker.queue_stash.get_by_uid
+
+    def count_reads(credentials, uid):
+        reads.append(uid)
+        return get_by_uid(credentials, uid)
+
+    monkeypatch.setattr(worker.queue_stash, "get_by_uid", count_reads)
+    worker_producer.queue_held_items()
+    assert reads == []
+
+    waiting = Worker(address=b"worker", identity=b"worker", service=service)
+    service.waiting[waiting.identity] = waiting
+    worker_producer.dispatch(service, None)
+    assert worker_producer.new_items.get_nowait() is None
+
+    worker_producer.queue_held_items()
+    assert reads == [items[1].id]
+    assert len(service.requests) == 1
+    assert list(worker_producer.held_items[worker_pool.name]) == [items[2].id]
+    status = worker.queue_stash.get_by_uid(worker.verify_key, items[1].id).ok().status
+    assert status == Status.PROCESSING
+
+
+def test_zmq_producer_retry_backoff(worker_producer, monkeypatch):
+    monkeypatch.setattr(Timeout, "now", staticmethod(lambda: 100.0))
+    uid = UID()
+
+    intervals = []
+    for _ in range(7):
+        worker_producer.retry_item(uid)
+        retry_ts, interval = worker_producer.retry_items[uid]
+        assert retry_ts == 100.0 + interval
+        intervals.append(interval)
+
+    assert intervals == [1, 2, 4, 8, 16, 30, 30]